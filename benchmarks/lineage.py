@@ -0,0 +1,54 @@
+import sys
+import os
+import pyperf
+
+# Add the project root to the path so we can import from tests
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlglot import exp, parse_one
+from sqlglot.lineage import lineage
+
+
+def gen_models(layers, width, columns):
+    """
+    Generates a wide model graph, in which each model of a layer joins two models of the layer
+    below it, so that the sources of the top model are referenced 2 ** layers times over.
+    """
+    schema = {
+        f"raw_{i}": {"id": "int", **{f"c{j}": "int" for j in range(columns)}} for i in range(width)
+    }
+    sources = {}
+
+    for layer in range(1, layers + 1):
+        below = "raw" if layer == 1 else f"model_{layer - 1}"
+
+        for i in range(width):
+            selects = ", ".join(f"a.c{j} + b.c{j} AS c{j}" for j in range(columns))
+            sources[f"model_{layer}_{i}"] = parse_one(
+                f"SELECT a.id AS id, {selects} FROM {below}_{i} AS a "
+                f"JOIN {below}_{(i + 1) % width} AS b ON a.id = b.id"
+            )
+
+    return parse_one(f"SELECT c0 FROM model_{layers}_0"), sources, schema
+
+
+def expand_models(expression, sources, schema):
+    exp.expand(expression, sources)
+
+
+def lineage_models(expression, sources, schema):
+    lineage("c0", expression, sources=sources, schema=schema)
+
+
+def run_benchmarks():
+    runner = pyperf.Runner()
+
+    for layers in (4, 6):
+        expression, sources, schema = gen_models(layers, width=8, columns=20)
+
+        runner.bench_func(f"expand_{layers}_layers", expand_models, expression, sources, schema)
+        runner.bench_func(f"lineage_{layers}_layers", lineage_models, expression, sources, schema)
+
+
+if __name__ == "__main__":
+    run_benchmarks()
@@ -0,0 +1,109 @@
+"""
+Measures the memory held by parsed syntax trees, with and without interning their leaves, and
+that held by their arenas (see `sqlglot.arena`).
+
+The TPC-DS fixtures (both the queries and their optimized forms) are loaded `--copies` times, to
+mimic a warehouse of many similar queries, either by parsing them or through `sqlglot.serde.load`.
+Each measurement runs in a fresh interpreter, and reports how much its RSS grew while loading.
+"""
+
+import argparse
+import gc
+import os
+import resource
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+MODES = ("parse", "load")
+
+
+def _rss():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # Peak rather than current RSS, reported in bytes on macOS and in KB elsewhere
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss if sys.platform == "darwin" else rss * 1024
+
+
+def _measure(mode, intern, arena, copies):
+    import sqlglot
+    from sqlglot.arena import Arena
+    from sqlglot.serde import dump, load
+    from tests.helpers import load_sql_fixture_pairs
+
+    sqls = [
+        sql
+        for _, query, optimized in load_sql_fixture_pairs("optimizer/tpc-ds/tpc-ds.sql")
+        for sql in (query, optimized)
+    ]
+    dumps = [dump(sqlglot.parse_one(sql)) for sql in sqls] if mode == "load" else []
+
+    gc.collect()
+    before = _rss()
+
+    # Each tree is converted into an arena as soon as it's loaded, so that only arenas pile up
+    shape_pool: dict = {}
+
+    def store(tree):
+        return Arena.from_expression(tree, shape_pool=shape_pool) if arena else tree
+
+    if mode == "parse":
+        trees = [
+            store(sqlglot.parse_one(sql, intern=intern)) for _ in range(copies) for sql in sqls
+        ]
+    else:
+        trees = [store(load(payload, intern=intern)) for _ in range(copies) for payload in dumps]
+
+    gc.collect()
+    nodes = sum(len(tree) if arena else sum(1 for _ in tree.walk()) for tree in trees)
+    return _rss() - before, nodes
+
+
+def _run(mode, intern, arena, copies):
+    output = subprocess.run(
+        [sys.executable, __file__, "--measure", mode, "--copies", str(copies)]
+        + (["--intern"] if intern else [])
+        + (["--arena"] if arena else []),
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    rss, nodes = output.split()
+    return int(rss), int(nodes)
+
+
+def _fmt_size(size):
+    return f"{size / 2**20:.1f} MB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SQLGlot syntax tree memory benchmarks")
+    parser.add_argument("--copies", type=int, default=20, help="Times to load the fixtures")
+    parser.add_argument("--measure", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--intern", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--arena", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(*_measure(args.measure, args.intern, args.arena, args.copies))
+        return
+
+    print("| mode  |   nodes |      plain |   interned | saved |      arena | saved |")
+    print("| ----- | ------- | ---------- | ---------- | ----- | ---------- | ----- |")
+
+    for mode in MODES:
+        plain, nodes = _run(mode, False, False, args.copies)
+        interned, _ = _run(mode, True, False, args.copies)
+        arena, _ = _run(mode, False, True, args.copies)
+        print(
+            f"| {mode:<5} | {nodes:>7} | {_fmt_size(plain):>10} | {_fmt_size(interned):>10} "
+            f"| {1 - interned / plain:>5.0%} | {_fmt_size(arena):>10} | {1 - arena / plain:>5.0%} |"
+        )
+
+
+if __name__ == "__main__":
+    main()
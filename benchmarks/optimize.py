@@ -51,17 +51,27 @@ def optimize_queries(expressions, schema):
 
 
 def run_benchmarks():
-    runner = pyperf.Runner()
+    # Worker processes are spawned with their own command line, so forward the flag
+    runner = pyperf.Runner(
+        add_cmdline_args=lambda cmd, args: cmd.append("--tpcds") if args.tpcds else None
+    )
+    runner.argparser.add_argument(
+        "--tpcds", action="store_true", help="Also benchmark the TPC-DS queries"
+    )
+    args = runner.parse_args()
 
     # Define benchmarks with their setup functions
     benchmarks = {
         "tpch": get_tpch_setup,
-        # "tpcds": get_tpcds_setup,  # This is left out because it's too slow in CI
         "condition_10": get_condition_10_setup,
         "condition_100": get_condition_100_setup,
         "condition_1000": get_condition_1000_setup,
     }
 
+    # TPC-DS is opt-in because it's too slow in CI
+    if args.tpcds:
+        benchmarks["tpcds"] = get_tpcds_setup
+
     for benchmark_name, benchmark_setup in benchmarks.items():
         expressions, schema = benchmark_setup()
 
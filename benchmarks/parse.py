@@ -329,12 +329,12 @@ def _discover_parsers(registry=None):
 _quiet = False
 
 
-def _bench(name, fn, *args, iterations=5):
-    """Benchmark fn(*args) and return the best time in seconds."""
+def _bench(name, fn, *args, iterations=5, **kwargs):
+    """Benchmark fn(*args, **kwargs) and return the best time in seconds."""
     best = float("inf")
     for _ in range(iterations):
         t0 = time.perf_counter()
-        fn(*args)
+        fn(*args, **kwargs)
         elapsed = time.perf_counter() - t0
         if elapsed < best:
             best = elapsed
@@ -369,6 +369,326 @@ def _bench_third_party(results, mode="parse"):
     return available
 
 
+def _bench_parallel(statements=2000, chunk_size=64):
+    """Benchmark parse_parallel on a multi-statement script, for an increasing number of workers."""
+    import sqlglot
+
+    queries = [
+        QUERIES[name] for name in ("tpch", "short", "many_joins", "complex_where", "many_ctes")
+    ]
+    script = ";\n".join(queries[i % len(queries)] for i in range(statements))
+    cpus = os.cpu_count() or 1
+
+    print(f"{statements} statements, {len(script) / 1e6:.1f} MB, {cpus} CPUs\n")
+    print("| workers |       time | speedup | statements/sec |")
+    print("| ------- | ---------- | ------- | -------------- |")
+
+    serial = _bench("parse", sqlglot.parse, script, iterations=1)
+    print(f"| {'serial':>7} | {_fmt_time(serial):>10} | {1:>7.2f} | {statements / serial:>14.0f} |")
+
+    workers = 1
+    while workers <= max(cpus, 2):
+        elapsed = _bench(
+            f"parse_parallel[{workers}]",
+            sqlglot.parse_parallel,
+            script,
+            workers=workers,
+            chunk_size=chunk_size,
+            iterations=1,
+        )
+        print(
+            f"| {workers:>7} | {_fmt_time(elapsed):>10} | {serial / elapsed:>7.2f} "
+            f"| {statements / elapsed:>14.0f} |"
+        )
+        workers *= 2
+
+
+def _bench_transpile_many(statements=500, chunk_size=16):
+    """Benchmark transpile_many from Snowflake to DuckDB, for an increasing number of workers."""
+    import sqlglot
+
+    queries = [
+        QUERIES[name] for name in ("tpch", "short", "many_joins", "complex_where", "many_ctes")
+    ]
+    sqls = [queries[i % len(queries)] for i in range(statements)]
+    cpus = os.cpu_count() or 1
+
+    def transpile_serial():
+        for sql in sqls:
+            sqlglot.transpile(sql, read="snowflake", write="duckdb")
+
+    def transpile_many(workers):
+        for _ in sqlglot.transpile_many(
+            sqls, read="snowflake", write="duckdb", workers=workers, chunk_size=chunk_size
+        ):
+            pass
+
+    print(f"{statements} statements, {cpus} CPUs\n")
+    print("| workers |       time | speedup | statements/sec |")
+    print("| ------- | ---------- | ------- | -------------- |")
+
+    serial = _bench("transpile", transpile_serial, iterations=1)
+    print(f"| {'serial':>7} | {_fmt_time(serial):>10} | {1:>7.2f} | {statements / serial:>14.0f} |")
+
+    workers = 1
+    while workers <= max(cpus, 2):
+        elapsed = _bench(f"transpile_many[{workers}]", transpile_many, workers, iterations=1)
+        print(
+            f"| {workers:>7} | {_fmt_time(elapsed):>10} | {serial / elapsed:>7.2f} "
+            f"| {statements / elapsed:>14.0f} |"
+        )
+        workers *= 2
+
+
+def _bench_lazy():
+    """Benchmark eager parsing against lazy parsing, which defers long subqueries and calls."""
+    import sqlglot
+
+    def parse_lazy(sql):
+        sqlglot.parse_one(sql, error_level=sqlglot.ErrorLevel.IGNORE, lazy=True)
+
+    query_width = max(len(q) for q in QUERIES)
+    print(f"| {'Query':>{query_width}} |      eager |       lazy | speedup |")
+    print(f"| {'-' * query_width} | ---------- | ---------- | ------- |")
+
+    for query_name, sql in QUERIES.items():
+        eager = _bench("eager", sqlglot_parse, sql)
+        lazy = _bench("lazy", parse_lazy, sql)
+        print(
+            f"| {query_name:>{query_width}} | {_fmt_time(eager):>10} | {_fmt_time(lazy):>10} "
+            f"| {eager / lazy:>7.2f} |"
+        )
+
+
+def _bench_incremental(lines=10_000, keystrokes=200):
+    """Benchmark re-parsing a large script incrementally after each keystroke of an edit."""
+    import statistics
+
+    import sqlglot
+
+    queries = [QUERIES[name] for name in ("tpch", "short", "nested_subqueries", "nested_functions")]
+    statements = []
+    while sum(statement.count("\n") + 1 for statement in statements) < lines:
+        statements.append(queries[len(statements) % len(queries)])
+    script = ";\n".join(statements)
+
+    print(f"{script.count(chr(10)) + 1} lines, {len(statements)} statements\n")
+    print("| operation         |       time |")
+    print("| ----------------- | ---------- |")
+
+    full = _bench("parse", sqlglot.parse, script, iterations=1)
+    print(f"| {'full parse':<17} | {_fmt_time(full):>10} |")
+
+    # Type into (and then delete from) a string literal in the middle of the script
+    incremental = sqlglot.parse_incremental(script)
+    position = script.index("'", len(script) // 2) + 1
+
+    for name, edits in (
+        ("type a character", [(position + i, position + i, "x") for i in range(keystrokes)]),
+        (
+            "delete a character",
+            [(position + i - 1, position + i, "") for i in range(keystrokes, 0, -1)],
+        ),
+    ):
+        timings = []
+        for start, end, text in edits:
+            t0 = time.perf_counter()
+            incremental.edit(start, end, text)
+            timings.append(time.perf_counter() - t0)
+
+        median = statistics.median(timings)
+        print(f"| {name:<17} | {_fmt_time(median):>10} |")
+
+
+def _bench_backtracking(depths=(8, 16, 32, 64)):
+    """Benchmark inputs that make the parser backtrack at every nesting level."""
+    import sqlglot
+
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 20_000))
+
+    # Each of these used to be parsed in exponential time, because every nesting level was parsed
+    # once per alternative: a type or a function call, a LIMIT / OFFSET clause or an alias
+    queries = {
+        "nested_decimal_calls": (None, lambda n: "SELECT " + "DECIMAL(" * n + "1" + ")" * n),
+        "nested_struct_calls": (None, lambda n: "SELECT " + "STRUCT(" * n + "1" + ")" * n),
+        "nested_tuple_calls": (
+            "clickhouse",
+            lambda n: "SELECT " + "Tuple(" * n + "a" + ")" * n,
+        ),
+        "nested_offset_parens": (
+            None,
+            lambda n: "SELECT x FROM t OFFSET 1 + (" * n + "1" + ")" * n,
+        ),
+    }
+
+    query_width = max(len(q) for q in queries)
+    header = " | ".join(f"{f'depth {depth}':>10}" for depth in depths)
+    print(f"| {'Query':>{query_width}} | {header} |")
+    print(f"| {'-' * query_width} | {' | '.join('-' * 10 for _ in depths)} |")
+
+    for query_name, (read, query) in queries.items():
+        timings = [
+            _bench(f"{query_name}[{depth}]", sqlglot.parse_one, query(depth), read=read)
+            for depth in depths
+        ]
+        row = " | ".join(f"{_fmt_time(timing):>10}" for timing in timings)
+        print(f"| {query_name:>{query_width}} | {row} |")
+
+
+def _bench_pretty(depths=(10, 50, 150), columns=10):
+    """Benchmark compact against pretty generation of generated views of increasing depth."""
+    import sqlglot
+
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 20_000))
+
+    def view(depth):
+        sql = "t"
+        for i in range(depth):
+            projections = ", ".join(
+                f"CASE WHEN c{j} > {i} THEN COALESCE(c{j}, {j}) ELSE c{j} + {i} END AS c{j}"
+                for j in range(columns)
+            )
+            sql = f"(SELECT {projections} FROM {sql} WHERE c0 > {i}) AS s{i}"
+        return sqlglot.parse_one(f"SELECT * FROM {sql}")
+
+    print("| depth |  lines |    compact |     pretty | ratio |")
+    print("| ----- | ------ | ---------- | ---------- | ----- |")
+
+    for depth in depths:
+        expression = view(depth)
+        lines = expression.sql(pretty=True).count("\n") + 1
+        compact = _bench("compact", expression.sql, copy=False)
+        pretty = _bench("pretty", expression.sql, pretty=True, copy=False)
+        print(
+            f"| {depth:>5} | {lines:>6} | {_fmt_time(compact):>10} | {_fmt_time(pretty):>10} "
+            f"| {pretty / compact:>5.2f} |"
+        )
+
+
+def _bench_stream(rows=(1_000, 10_000, 100_000)):
+    """Benchmark the peak memory and time of generating large INSERTs, whole and streamed."""
+    import tracemalloc
+
+    import sqlglot
+    from sqlglot.generator import Generator
+
+    def peak(fn):
+        tracemalloc.start()
+        fn()
+        size = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return size
+
+    print("|    rows |  generate |    stream | generate peak | stream peak |")
+    print("| ------- | --------- | --------- | ------------- | ----------- |")
+
+    with open(os.devnull, "w") as devnull:
+        for count in rows:
+            values = ", ".join(f"({i}, 'name_{i}', {i}.5, NULL)" for i in range(count))
+            expression = sqlglot.parse_one(f"INSERT INTO t VALUES {values}")
+
+            def generate():
+                Generator().generate(expression, copy=False)
+
+            def stream():
+                Generator().generate_to(expression, devnull, copy=False)
+
+            print(
+                f"| {count:>7} | {_fmt_time(_bench('generate', generate)):>9} "
+                f"| {_fmt_time(_bench('stream', stream)):>9} "
+                f"| {peak(generate) / 2**20:>10.1f} MB | {peak(stream) / 2**20:>8.1f} MB |"
+            )
+
+
+def _bench_cache(dialects=("duckdb", "snowflake", "bigquery", "tsql"), rounds=3):
+    """Benchmark generating the TPC-DS queries and their subqueries repeatedly, with a cache."""
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    import sqlglot
+    from sqlglot.generator import GenerationCache
+    from tests.helpers import load_sql_fixture_pairs
+
+    trees = [
+        sqlglot.parse_one(query)
+        for _, query, _ in load_sql_fixture_pairs("optimizer/tpc-ds/tpc-ds.sql")
+    ]
+    subtrees = [
+        node for tree in trees for node in tree.find_all(sqlglot.exp.Select, sqlglot.exp.Subquery)
+    ]
+
+    def generate(cache):
+        for _ in range(rounds):
+            for dialect in dialects:
+                for node in subtrees:
+                    node.sql(dialect, cache=cache)
+
+    print("|  subtrees |   uncached |     cached | hit rate |")
+    print("| --------- | ---------- | ---------- | -------- |")
+
+    cache = GenerationCache(max_size=len(subtrees) * len(dialects))
+    uncached = _bench("uncached", generate, None, iterations=1)
+    cached = _bench("cached", generate, cache, iterations=1)
+    print(
+        f"| {len(subtrees):>9} | {_fmt_time(uncached):>10} | {_fmt_time(cached):>10} "
+        f"| {cache.hit_rate:>8.0%} |"
+    )
+
+
+def _bench_copy():
+    """
+    Benchmark identity transpiles of the identity and TPC-DS fixtures in every dialect, copying
+    each tree upfront against generating it in place unless the dialect mutates it.
+    """
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    import logging
+
+    import sqlglot
+    from sqlglot.dialects.dialect import Dialect, Dialects
+    from sqlglot.errors import ErrorLevel
+    from tests.helpers import load_sql_fixture_pairs, load_sql_fixtures
+
+    logging.getLogger("sqlglot").setLevel(logging.ERROR)
+
+    sqls = [
+        *load_sql_fixtures("identity.sql"),
+        *(query for _, query, _ in load_sql_fixture_pairs("optimizer/tpc-ds/tpc-ds.sql")),
+    ]
+
+    print("| dialect     | trees |     copied |   in place | speedup |")
+    print("| ----------- | ----- | ---------- | ---------- | ------- |")
+
+    for name in Dialects:
+        if not name.value:
+            continue
+
+        dialect = Dialect.get_or_raise(name.value)
+        trees = []
+
+        for sql in sqls:
+            try:
+                expression = sqlglot.parse_one(sql, read=dialect)
+                dialect.generate(expression, unsupported_level=ErrorLevel.IGNORE)
+            except Exception:
+                continue
+            trees.append(expression)
+
+        def copied():
+            for expression in trees:
+                dialect.generate(expression.copy(), copy=False, unsupported_level=ErrorLevel.IGNORE)
+
+        def in_place():
+            for expression in trees:
+                dialect.generate(expression, unsupported_level=ErrorLevel.IGNORE)
+
+        copied_time = _bench("copied", copied)
+        in_place_time = _bench("in place", in_place)
+        print(
+            f"| {name.value:<11} | {len(trees):>5} | {_fmt_time(copied_time):>10} "
+            f"| {_fmt_time(in_place_time):>10} | {copied_time / in_place_time:>7.2f} |"
+        )
+
+
 # --- Table printing ---
 
 
@@ -460,18 +780,50 @@ def _parse_args():
     )
     parser.add_argument(
         "--mode",
-        choices=["parse", "transpile"],
+        choices=[
+            "parse",
+            "transpile",
+            "parallel",
+            "transpile_many",
+            "lazy",
+            "incremental",
+            "backtracking",
+            "pretty",
+            "stream",
+            "cache",
+            "copy",
+        ],
         default="parse",
-        help="Benchmark mode: parse or transpile (default: parse)",
+        help="Benchmark mode: parse, transpile, parallel parsing scaling, parallel transpilation "
+        "scaling, lazy parsing, "
+        "incremental re-parsing, backtracking-heavy nesting, pretty generation, streamed "
+        "generation, cached generation or identity transpiles without defensive copies "
+        "(default: parse)",
     )
     return parser.parse_args()
 
 
+# Modes that run their own benchmark instead of comparing sqlglot to the third-party parsers
+STANDALONE_MODES = {
+    "parallel": _bench_parallel,
+    "transpile_many": _bench_transpile_many,
+    "lazy": _bench_lazy,
+    "incremental": _bench_incremental,
+    "backtracking": _bench_backtracking,
+    "pretty": _bench_pretty,
+    "stream": _bench_stream,
+    "cache": _bench_cache,
+    "copy": _bench_copy,
+}
+
+
 if __name__ == "__main__":
     if os.environ.get("_BENCH_SUBPROCESS"):
         _run_subprocess()
+    elif (args := _parse_args()).mode in STANDALONE_MODES:
+        _quiet = True
+        STANDALONE_MODES[args.mode]()
     else:
-        args = _parse_args()
         _quiet = args.quiet
 
         mode = args.mode
@@ -0,0 +1,89 @@
+"""
+Compares the serialization formats of syntax trees: the JSON serialized list of
+`sqlglot.serde.dump`, `pickle` (which goes through `Expression.__reduce__` and
+`sqlglot.serde.dump_flat`), `pickle` of the output of `dump` (which is how expressions used to be
+pickled) and the binary format of `sqlglot.serde.dump_binary`, loaded both eagerly and lazily.
+
+The TPC-DS fixtures (both the queries and their optimized forms) are dumped and loaded, and the
+best of `--repeat` runs is reported for each step, along with the total size of the payloads.
+Lazily loaded trees are also walked, which decodes their deferred subtrees.
+"""
+
+import argparse
+import json
+import os
+import pickle
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sqlglot
+from sqlglot.serde import dump, dump_binary, load, load_binary
+from tests.helpers import load_sql_fixture_pairs
+
+
+def _walk(expression):
+    for _ in expression.walk():
+        pass
+    return expression
+
+
+FORMATS = {
+    "json": (lambda e: json.dumps(dump(e)), lambda p: load(json.loads(p))),
+    "pickle": (pickle.dumps, pickle.loads),
+    "pickle (dump/load)": (lambda e: pickle.dumps(dump(e)), lambda p: load(pickle.loads(p))),
+    "binary": (dump_binary, load_binary),
+    "binary (lazy)": (dump_binary, lambda p: load_binary(p, lazy=True)),
+    "binary (lazy, walked)": (dump_binary, lambda p: _walk(load_binary(p, lazy=True))),
+}
+
+
+def _best(fun, items, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            fun(item)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _fmt_time(seconds):
+    return f"{seconds * 1e3:.1f}ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SQLGlot syntax tree serialization benchmarks")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement")
+    args = parser.parse_args()
+
+    # Deeply nested trees require a lot of recursion to pickle
+    sys.setrecursionlimit(10000)
+
+    expressions = [
+        sqlglot.parse_one(sql)
+        for _, query, optimized in load_sql_fixture_pairs("optimizer/tpc-ds/tpc-ds.sql")
+        for sql in (query, optimized)
+    ]
+
+    print("| format                |       size |    dump |    load |")
+    print("| --------------------- | ---------- | ------- | ------- |")
+
+    for name, (dumper, loader) in FORMATS.items():
+        payloads = [dumper(expression) for expression in expressions]
+
+        for expression, payload in zip(expressions, payloads):
+            assert loader(payload) == expression, name
+
+        size = sum(len(payload) for payload in payloads)
+        dump_time = _best(dumper, expressions, args.repeat)
+        load_time = _best(loader, payloads, args.repeat)
+        print(
+            f"| {name:<21} | {size / 1024:>7.0f} KB | {_fmt_time(dump_time):>7} "
+            f"| {_fmt_time(load_time):>7} |"
+        )
+
+
+if __name__ == "__main__":
+    main()
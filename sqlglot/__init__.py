@@ -49,7 +49,9 @@ from sqlglot.expressions import (
     to_table as to_table,
     union as union,
 )
-from sqlglot.generator import Generator as Generator
+from sqlglot.generator import GenerationCache as GenerationCache, Generator as Generator
+from sqlglot.incremental import parse_incremental as parse_incremental
+from sqlglot.parallel import parse_parallel as parse_parallel, transpile_many as transpile_many
 from sqlglot.parser import Parser as Parser
 from sqlglot.schema import MappingSchema as MappingSchema, Schema as Schema
 from sqlglot.tokens import Token as Token, Tokenizer as Tokenizer, TokenType as TokenType
@@ -89,6 +91,33 @@ def tokenize(sql: str, read: DialectType = None, dialect: DialectType = None) ->
     return Dialect.get_or_raise(read or dialect).tokenize(sql)
 
 
+def split_statements(
+    sql: str, read: DialectType = None, dialect: DialectType = None
+) -> t.Iterator[tuple[int, int, TokenType]]:
+    """
+    Lazily splits the given SQL string into statements, without building any syntax trees.
+
+    This only runs the tokenizer, so it is much cheaper than `parse`, while still respecting the
+    dialect's quoting, heredoc, comment and command rules.
+
+    Example:
+        >>> import sqlglot
+        >>> sql = "SELECT 1; CREATE TABLE t (c INT)"
+        >>> [(sql[start:end], kind.name) for start, end, kind in sqlglot.split_statements(sql)]
+        [('SELECT 1', 'SELECT'), ('CREATE TABLE t (c INT)', 'CREATE')]
+
+    Args:
+        sql: the SQL code string to split.
+        read: the SQL dialect to apply during tokenizing (eg. "spark", "hive", "presto", "mysql").
+        dialect: the SQL dialect (alias for read).
+
+    Returns:
+        An iterator of `(start, end, leading_token_type)` tuples, one per statement, where
+        `sql[start:end]` is the statement's text without its terminating semicolon.
+    """
+    return Dialect.get_or_raise(read or dialect).split_statements(sql)
+
+
 def parse(
     sql: str,
     read: DialectType = None,
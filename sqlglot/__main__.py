@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import argparse
 import sys
+from contextlib import nullcontext
 
 import sqlglot
 from sqlglot.helper import to_bool
+from sqlglot.profiler import profile_parser
 
 parser = argparse.ArgumentParser(description="Transpile SQL")
 parser.add_argument(
@@ -59,6 +61,12 @@ parser.add_argument(
     default="IMMEDIATE",
     help="IGNORE, WARN, RAISE, IMMEDIATE (default)",
 )
+parser.add_argument(
+    "--profile",
+    dest="profile",
+    action="store_true",
+    help="Print a per-rule profile of the parser to stderr",
+)
 parser.add_argument(
     "--version",
     action="version",
@@ -72,26 +80,30 @@ error_level = sqlglot.ErrorLevel[args.error_level.upper()]
 
 sql = sys.stdin.read() if args.sql == "-" else args.sql
 
-if args.parse:
-    objs: list[str] | list[sqlglot.tokens.Token] = [
-        repr(expression)
-        for expression in sqlglot.parse(
+with profile_parser() if args.profile else nullcontext() as profile:
+    if args.parse:
+        objs: list[str] | list[sqlglot.tokens.Token] = [
+            repr(expression)
+            for expression in sqlglot.parse(
+                sql,
+                read=args.read,
+                error_level=error_level,
+            )
+        ]
+    elif args.tokenize:
+        objs = sqlglot.Dialect.get_or_raise(args.read).tokenize(sql)
+    else:
+        objs = sqlglot.transpile(
             sql,
             read=args.read,
+            write=args.write,
+            identify="safe" if args.identify == "safe" else to_bool(args.identify),
+            pretty=args.pretty,
             error_level=error_level,
         )
-    ]
-elif args.tokenize:
-    objs = sqlglot.Dialect.get_or_raise(args.read).tokenize(sql)
-else:
-    objs = sqlglot.transpile(
-        sql,
-        read=args.read,
-        write=args.write,
-        identify="safe" if args.identify == "safe" else to_bool(args.identify),
-        pretty=args.pretty,
-        error_level=error_level,
-    )
 
 for obj in objs:
     print(obj)
+
+if profile:
+    print(profile.report(), file=sys.stderr)
@@ -9,6 +9,7 @@ if t.TYPE_CHECKING:
     from typing_extensions import ParamSpec
     from sqlglot.dialects.dialect import DialectType
     from sqlglot.errors import ErrorLevel
+    from sqlglot.generator import GenerationCache
 
     P = ParamSpec("P")
 
@@ -30,6 +31,9 @@ class ParserNoDialectArgs(t.TypedDict, total=False):
     error_message_context: int
     max_errors: int
     max_nodes: int
+    literal_lists: bool
+    lazy: bool
+    intern: bool
 
 
 class DataTypeArgs(ParserNoDialectArgs, total=False):
@@ -57,6 +61,7 @@ class GeneratorNoDialectArgs(t.TypedDict, total=False):
     leading_comma: bool
     max_text_width: int
     comments: bool
+    cache: GenerationCache | None
 
 
 class GeneratorArgs(GeneratorNoDialectArgs, _DialectArg, total=False):
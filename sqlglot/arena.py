@@ -0,0 +1,486 @@
+"""
+A compact, read-only representation of syntax trees, for applications that analyze many parsed
+queries at once, e.g. for lineage or catalog indexing.
+
+Every node of a regular tree is an `sqlglot.expressions.Expression` object with an `args` dict,
+which costs a few hundred bytes per node. An `Arena` instead stores a tree in flat `array`
+buffers, in preorder: the class id, parent, arg key and list index of each node, and the end of
+its subtree, so that the children of a node are the consecutive subtrees that follow it. The
+scalar args of the nodes, e.g. the names of identifiers, are kept in a side table of their
+distinct "shapes", and so are their comments and the types they're annotated with.
+
+    >>> import sqlglot
+    >>> from sqlglot import exp
+    >>> from sqlglot.arena import Arena
+    >>> arena = Arena.from_expression(sqlglot.parse_one("SELECT a, b FROM t WHERE a > 1"))
+    >>> [column.name for column in arena.find_all(exp.Column)]
+    ['a', 'b', 'a']
+    >>> arena.find(exp.Where).sql()
+    'WHERE a > 1'
+
+Arenas can't be mutated, but any of their subtrees can be converted back to a regular tree with
+`ArenaNode.to_expression`, which is also how they're turned into SQL by the regular generator.
+"""
+
+from __future__ import annotations
+
+import typing as t
+from array import array
+from builtins import type as Type
+from collections import deque
+
+from sqlglot import exp
+
+if t.TYPE_CHECKING:
+    from typing_extensions import Unpack
+
+    from sqlglot._typing import E, GeneratorNoDialectArgs
+    from sqlglot.dialects.dialect import DialectType
+
+# The ids of node classes and arg keys, which are shared by all arenas
+_CLASSES: list[Type[exp.Expr]] = []
+_CLASS_IDS: dict[Type[exp.Expr], int] = {}
+_KEYS: list[str] = [""]
+_KEY_IDS: dict[str, int] = {"": 0}
+
+
+class _Child:
+    """Marks the places of child nodes in the shapes of their parents."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "CHILD"
+
+
+CHILD = _Child()
+
+
+def _class_id(klass: Type[exp.Expr]) -> int:
+    class_id = _CLASS_IDS.get(klass)
+    if class_id is None:
+        class_id = _CLASS_IDS[klass] = len(_CLASSES)
+        _CLASSES.append(klass)
+    return class_id
+
+
+def _key_id(key: str) -> int:
+    key_id = _KEY_IDS.get(key)
+    if key_id is None:
+        key_id = _KEY_IDS[key] = len(_KEYS)
+        _KEYS.append(key)
+    return key_id
+
+
+class Arena:
+    """
+    A read-only syntax tree, see the module's documentation.
+
+    Attributes:
+        classes: the class id of each node.
+        parents: the position of the parent of each node, or -1 for roots.
+        keys: the id of the arg key each node is stored under in its parent.
+        indices: the index of each node in its parent's list of values, or -1.
+        ends: the position that follows the subtree of each node.
+        shapes: the position of the shape of each node in `shape_table`.
+        shape_table: the distinct shapes, i.e. the keys and values of the args of the nodes, in
+            order and flattened into a tuple, where children are replaced by `CHILD` and lists
+            by tuples.
+        comments: the comments of the nodes that have some, by position.
+        types: the position of the root of the type of the nodes that are annotated with one, by
+            position. Types are stored after the tree.
+        meta: the meta dicts of the nodes, by position, if they were kept.
+    """
+
+    __slots__ = (
+        "classes",
+        "parents",
+        "keys",
+        "indices",
+        "ends",
+        "shapes",
+        "shape_table",
+        "comments",
+        "types",
+        "meta",
+    )
+
+    def __init__(self) -> None:
+        self.classes = array("H")
+        self.parents = array("i")
+        self.keys = array("H")
+        self.indices = array("i")
+        self.ends = array("i")
+        self.shapes = array("I")
+        self.shape_table: list[tuple[t.Any, ...]] = []
+        self.comments: dict[int, list[str]] = {}
+        self.types: dict[int, int] = {}
+        self.meta: dict[int, dict[str, t.Any]] = {}
+
+    @classmethod
+    def from_expression(
+        cls,
+        expression: exp.Expr,
+        meta: bool = False,
+        shape_pool: dict[tuple[t.Any, ...], tuple[t.Any, ...]] | None = None,
+    ) -> Arena:
+        """
+        Builds the arena of a tree. Lazy placeholders in it are parsed first.
+
+        Args:
+            expression: the root of the tree.
+            meta: whether to keep the meta dicts of the nodes, e.g. their positions.
+            shape_pool: a dict to share the shapes of the nodes through, with the other arenas
+                built with it. Similar queries have mostly the same shapes, so this saves most
+                of the memory arenas take beyond their buffers, but the pool keeps every shape
+                it's given alive.
+
+        Returns:
+            The arena.
+        """
+        arena = cls()
+        shape_ids: dict[tuple[t.Any, ...], int] = {}
+        types: list[tuple[int, exp.Expr]] = []
+
+        arena._add(exp.parse_lazy(expression), shape_ids, shape_pool, types, meta)
+
+        # Types are trees of their own, and may be annotated with types too
+        while types:
+            position, dtype = types.pop()
+            arena.types[position] = len(arena.classes)
+            arena._add(dtype, shape_ids, shape_pool, types, meta)
+
+        return arena
+
+    def _add(
+        self,
+        expression: exp.Expr,
+        shape_ids: dict[tuple[t.Any, ...], int],
+        shape_pool: dict[tuple[t.Any, ...], tuple[t.Any, ...]] | None,
+        types: list[tuple[int, exp.Expr]],
+        meta: bool,
+    ) -> None:
+        shape_table = self.shape_table
+        stack: list[tuple[exp.Expr, int, str, int]] = [(expression, -1, "", -1)]
+        # The positions of the nodes whose subtrees are being added
+        open_nodes: list[int] = []
+
+        while stack:
+            node, parent, arg_key, index = stack.pop()
+            position = len(self.classes)
+
+            while open_nodes and open_nodes[-1] != parent:
+                self.ends[open_nodes.pop()] = position
+            open_nodes.append(position)
+
+            shape: list[t.Any] = []
+            children: list[tuple[exp.Expr, int, str, int]] = []
+
+            for k, vs in node.args.items():
+                if isinstance(vs, exp.Expr):
+                    shape += (k, CHILD)
+                    children.append((vs, position, k, -1))
+                elif type(vs) is list:
+                    values: list[t.Any] = []
+                    for i, v in enumerate(vs):
+                        if isinstance(v, exp.Expr):
+                            children.append((v, position, k, i))
+                            v = CHILD
+                        values.append(v)
+                    shape += (k, tuple(values))
+                else:
+                    shape += (k, vs)
+
+            # Values are keyed along with their types, since e.g. True == 1
+            shape_key = tuple((v, type(v)) for v in shape)
+            shape_id = shape_ids.get(shape_key)
+            if shape_id is None:
+                shape_id = shape_ids[shape_key] = len(shape_table)
+                if shape_pool is None:
+                    shape_table.append(tuple(shape))
+                else:
+                    shape_table.append(shape_pool.setdefault(shape_key, tuple(shape)))
+
+            self.classes.append(_class_id(node.__class__))
+            self.parents.append(parent)
+            self.keys.append(_key_id(arg_key))
+            self.indices.append(index)
+            self.ends.append(0)
+            self.shapes.append(shape_id)
+
+            if node.comments:
+                self.comments[position] = node.comments[:]
+            if meta and node._meta:
+                self.meta[position] = dict(node._meta)
+            if isinstance(node._type, exp.Expr) and node._type is not node:
+                types.append((position, node._type))
+
+            stack.extend(reversed(children))
+
+        end = len(self.classes)
+        for position in open_nodes:
+            self.ends[position] = end
+
+    def __len__(self) -> int:
+        return self.ends[0] if self.ends else 0
+
+    @property
+    def root(self) -> ArenaNode:
+        return ArenaNode(self, 0)
+
+    def walk(
+        self, bfs: bool = True, prune: t.Callable[[ArenaNode], bool] | None = None
+    ) -> t.Iterator[ArenaNode]:
+        return self.root.walk(bfs=bfs, prune=prune)
+
+    def find_all(
+        self, *expression_types: Type[exp.Expr], bfs: bool = True
+    ) -> t.Iterator[ArenaNode]:
+        return self.root.find_all(*expression_types, bfs=bfs)
+
+    def find(self, *expression_types: Type[exp.Expr], bfs: bool = True) -> ArenaNode | None:
+        return self.root.find(*expression_types, bfs=bfs)
+
+    def to_expression(self) -> exp.Expr:
+        return self.root.to_expression()
+
+    def sql(self, dialect: DialectType = None, **opts: Unpack[GeneratorNoDialectArgs]) -> str:
+        return self.root.sql(dialect, **opts)
+
+
+class ArenaNode:
+    """
+    A node of an `Arena`, i.e. an arena and a position in it. Nodes are created on demand, so
+    two of them are equal if they share their arena and position.
+    """
+
+    __slots__ = ("arena", "position")
+
+    def __init__(self, arena: Arena, position: int) -> None:
+        self.arena = arena
+        self.position = position
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            type(other) is ArenaNode
+            and self.arena is other.arena
+            and self.position == other.position
+        )
+
+    def __hash__(self) -> int:
+        return hash((id(self.arena), self.position))
+
+    def __repr__(self) -> str:
+        return f"ArenaNode({self.cls.__name__}, position={self.position})"
+
+    @property
+    def cls(self) -> Type[exp.Expr]:
+        """The class of the node."""
+        return _CLASSES[self.arena.classes[self.position]]
+
+    @property
+    def key(self) -> str:
+        return self.cls.key
+
+    @property
+    def parent(self) -> ArenaNode | None:
+        parent = self.arena.parents[self.position]
+        return ArenaNode(self.arena, parent) if parent >= 0 else None
+
+    @property
+    def arg_key(self) -> str | None:
+        return (
+            _KEYS[self.arena.keys[self.position]]
+            if self.arena.parents[self.position] >= 0
+            else None
+        )
+
+    @property
+    def index(self) -> int | None:
+        index = self.arena.indices[self.position]
+        return index if index >= 0 else None
+
+    @property
+    def comments(self) -> list[str] | None:
+        return self.arena.comments.get(self.position)
+
+    @property
+    def type(self) -> ArenaNode | None:
+        position = self.arena.types.get(self.position)
+        return ArenaNode(self.arena, position) if position is not None else None
+
+    @property
+    def this(self) -> t.Any:
+        return self.args.get("this")
+
+    @property
+    def name(self) -> str:
+        if self.cls.name is exp.Expression.name:
+            return self.text("this")
+        return self.to_expression().name
+
+    def text(self, key: str) -> str:
+        """Like `sqlglot.expressions.Expr.text`."""
+        field = self.args.get(key)
+        if isinstance(field, str):
+            return field
+        if isinstance(field, ArenaNode):
+            if field.is_type(exp.Identifier, exp.Literal, exp.Var):
+                return field.this
+            if field.is_type(exp.Star, exp.Null):
+                return field.to_expression().name
+        return ""
+
+    @property
+    def args(self) -> dict[str, t.Any]:
+        """The args of the node, where children are `ArenaNode`s."""
+        children = self.children()
+        args: dict[str, t.Any] = {}
+
+        shape = self.arena.shape_table[self.arena.shapes[self.position]]
+
+        for k, v in zip(shape[::2], shape[1::2]):
+            if v is CHILD:
+                args[k] = next(c for c in children if c.arg_key == k)
+            elif type(v) is tuple:
+                args[k] = [
+                    next(c for c in children if c.arg_key == k and c.index == i)
+                    if x is CHILD
+                    else x
+                    for i, x in enumerate(v)
+                ]
+            else:
+                args[k] = v
+
+        return args
+
+    def children(self) -> list[ArenaNode]:
+        """The children of the node, in the order of its args."""
+        arena, ends = self.arena, self.arena.ends
+        end = ends[self.position]
+        children = []
+        position = self.position + 1
+
+        while position < end:
+            children.append(ArenaNode(arena, position))
+            position = ends[position]
+
+        return children
+
+    def walk(
+        self, bfs: bool = True, prune: t.Callable[[ArenaNode], bool] | None = None
+    ) -> t.Iterator[ArenaNode]:
+        """
+        Returns a generator object which visits all nodes in this subtree, in the same order as
+        `sqlglot.expressions.Expr.walk` would.
+
+        Args:
+            bfs: if set to True the BFS traversal order will be applied, otherwise the DFS
+                traversal will be used instead.
+            prune: callable that returns True if the generator should stop traversing this
+                branch of the tree.
+        """
+        arena, ends = self.arena, self.arena.ends
+
+        if not bfs and not prune:
+            # The subtree is stored in preorder
+            for position in range(self.position, ends[self.position]):
+                yield ArenaNode(arena, position)
+            return
+
+        pending: deque[int] = deque([self.position])
+        pop = pending.popleft if bfs else pending.pop
+
+        while pending:
+            position = pop()
+            node = ArenaNode(arena, position)
+            yield node
+
+            if prune and prune(node):
+                continue
+
+            end = ends[position]
+            children = []
+            child = position + 1
+            while child < end:
+                children.append(child)
+                child = ends[child]
+
+            pending.extend(children if bfs else reversed(children))
+
+    def find_all(
+        self, *expression_types: Type[exp.Expr], bfs: bool = True
+    ) -> t.Iterator[ArenaNode]:
+        """
+        Returns a generator object which visits all nodes in this subtree and only yields those
+        that match at least one of the specified expression types.
+        """
+        class_ids = {i for i, klass in enumerate(_CLASSES) if issubclass(klass, expression_types)}
+        classes = self.arena.classes
+
+        for node in self.walk(bfs=bfs):
+            if classes[node.position] in class_ids:
+                yield node
+
+    def find(self, *expression_types: Type[exp.Expr], bfs: bool = True) -> ArenaNode | None:
+        """Returns the first node in this subtree which matches at least one of the types."""
+        return next(self.find_all(*expression_types, bfs=bfs), None)
+
+    def to_expression(self) -> exp.Expr:
+        """Converts the subtree of this node into a regular, mutable tree."""
+        arena = self.arena
+        classes, parents, keys, indices = arena.classes, arena.parents, arena.keys, arena.indices
+        shapes, shape_table = arena.shapes, arena.shape_table
+        nodes: dict[int, exp.Expr] = {}
+        root: exp.Expr | None = None
+
+        for position in range(self.position, arena.ends[self.position]):
+            node = _CLASSES[classes[position]]()
+            args = node.args
+
+            shape = shape_table[shapes[position]]
+
+            for k, v in zip(shape[::2], shape[1::2]):
+                if v is CHILD:
+                    args[k] = None
+                elif type(v) is tuple:
+                    args[k] = list(v)
+                else:
+                    args[k] = v
+
+            comments = arena.comments.get(position)
+            if comments is not None:
+                node.comments = comments[:]
+            meta = arena.meta.get(position)
+            if meta is not None:
+                node._meta = dict(meta)
+            dtype = arena.types.get(position)
+            if dtype is not None:
+                node._type = ArenaNode(arena, dtype).to_expression()  # type: ignore[assignment]
+
+            parent = nodes.get(parents[position])
+            if parent is None:
+                root = node
+            else:
+                arg_key = _KEYS[keys[position]]
+                node.parent = parent
+                node.arg_key = arg_key
+
+                index = indices[position]
+                if index < 0:
+                    parent.args[arg_key] = node
+                else:
+                    node.index = index
+                    parent.args[arg_key][index] = node
+
+            nodes[position] = node
+
+        assert root
+        return root
+
+    def sql(self, dialect: DialectType = None, **opts: Unpack[GeneratorNoDialectArgs]) -> str:
+        """Generates the SQL of this subtree, by converting it into a regular tree first."""
+        return self.to_expression().sql(dialect, copy=False, **opts)
+
+    def is_type(self, *expression_types: Type[E]) -> bool:
+        return issubclass(self.cls, expression_types)
@@ -0,0 +1,220 @@
+"""
+An opt-in, content-addressed cache of syntax trees, for applications that parse the same SQL texts
+over and over again.
+
+Once enabled, `Dialect.parse` and `Dialect.parse_into`, and thus `sqlglot.parse`, `sqlglot.parse_one`
+and `sqlglot.transpile`, look the parsed trees up by dialect settings, parser options and SQL text
+before tokenizing anything:
+
+    >>> import sqlglot
+    >>> from sqlglot.cache import enable_parse_cache, disable_parse_cache
+    >>> cache = enable_parse_cache(max_nodes=100_000)
+    >>> sqlglot.parse_one("SELECT a FROM t") is sqlglot.parse_one("SELECT a FROM t")
+    False
+    >>> cache.info()
+    CacheInfo(hits=1, misses=1, evictions=0, entries=1, nodes=6, max_nodes=100000)
+    >>> disable_parse_cache()
+"""
+
+from __future__ import annotations
+
+import threading
+import typing as t
+from collections import OrderedDict
+
+from sqlglot import exp
+
+if t.TYPE_CHECKING:
+    from sqlglot._typing import ParserArgs
+    from sqlglot.dialects.dialect import Dialect
+    from sqlglot.expressions import Expr, IntoType
+
+
+class CacheInfo(t.NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    nodes: int
+    max_nodes: int
+
+
+class ParseCache:
+    """
+    A bounded LRU cache of parsed syntax trees.
+
+    The cache's size is measured in syntax tree nodes rather than entries, so that a single huge
+    statement can't evict many small ones and statements larger than the cap aren't cached at all.
+    Results that were parsed with errors (e.g. under `ErrorLevel.WARN`) aren't cached either, so
+    their warnings are reported every time.
+
+    Args:
+        max_nodes: the maximum total number of nodes held by the cached syntax trees.
+        copy: whether to hand out copies of the cached trees. If False, every hit returns the very
+            same trees, which is faster but makes them read-only: they're guarded with
+            `exp.MUTATION_GUARD` for as long as they're cached, so mutating them raises a
+            `MutationError`, and callers must copy them first. Guarded trees also make every
+            mutation in the process check whether it's allowed.
+    """
+
+    def __init__(self, max_nodes: int = 1_000_000, copy: bool = True) -> None:
+        self.max_nodes = max_nodes
+        self.copy = copy
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nodes = 0
+        self._entries: OrderedDict[t.Hashable, tuple[list[Expr | None], int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __del__(self) -> None:
+        # The guards are keyed by the ids of the trees, which are reused once the trees are freed
+        if not self.copy and self._entries:
+            self.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def info(self) -> CacheInfo:
+        """Returns the cache's statistics."""
+        return CacheInfo(
+            self.hits, self.misses, self.evictions, len(self._entries), self.nodes, self.max_nodes
+        )
+
+    def clear(self) -> None:
+        """Empties the cache and resets its statistics."""
+        with self._lock:
+            for expressions, _ in self._entries.values():
+                self._release(expressions)
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = self.nodes = 0
+
+    def parse(
+        self,
+        dialect: Dialect,
+        sql: str,
+        opts: ParserArgs | None = None,
+        into: IntoType | None = None,
+    ) -> list[Expr | None]:
+        """
+        Parses `sql` with `dialect`, or returns the cached result of a previous identical call.
+
+        Args:
+            dialect: the dialect to parse with.
+            sql: the SQL code string to parse.
+            opts: `sqlglot.parser.Parser` options.
+            into: the SQLGlot Expr to parse into, if any.
+
+        Returns:
+            The resulting syntax tree collection.
+        """
+        opts = opts or {}
+
+        try:
+            key = (
+                type(dialect),
+                dialect.normalization_strategy,
+                dialect.version,
+                tuple(sorted(dialect.settings.items())),
+                tuple(sorted(opts.items())),
+                into if into is None or isinstance(into, (str, type)) else tuple(into),
+                sql,
+            )
+            hash(key)
+        except TypeError:
+            # Unhashable options or settings, e.g. a schema passed as a dict
+            return _parse(dialect, sql, into, opts)[0]
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if entry is not None:
+            return self._copy(entry[0])
+
+        expressions, errors = _parse(dialect, sql, into, opts)
+        if errors:
+            return expressions
+
+        size = sum(1 for expression in expressions if expression for _ in expression.walk())
+        if size > self.max_nodes:
+            return expressions
+
+        cached = self._copy(expressions)
+
+        with self._lock:
+            if key not in self._entries:
+                if not self.copy:
+                    for expression in cached:
+                        if expression:
+                            exp.MUTATION_GUARD.add(expression)
+
+                self._entries[key] = (cached, size)
+                self.nodes += size
+
+                while self.nodes > self.max_nodes:
+                    _, (evicted, evicted_size) = self._entries.popitem(last=False)
+                    self._release(evicted)
+                    self.nodes -= evicted_size
+                    self.evictions += 1
+
+        return expressions
+
+    def _release(self, expressions: list[Expr | None]) -> None:
+        if not self.copy:
+            for expression in expressions:
+                if expression:
+                    exp.MUTATION_GUARD.discard(expression)
+
+    def _copy(self, expressions: list[Expr | None]) -> list[Expr | None]:
+        if self.copy:
+            return [expression.copy() if expression else None for expression in expressions]
+        return list(expressions)
+
+
+def _parse(
+    dialect: Dialect, sql: str, into: IntoType | None, opts: ParserArgs
+) -> tuple[list[Expr | None], bool]:
+    parser = dialect.parser(**opts)
+    tokens = dialect.tokenize(sql)
+
+    if into:
+        expressions = parser.parse_into(into, tokens, sql)
+    else:
+        expressions = parser.parse(tokens, sql)
+
+    return expressions, bool(parser.errors)
+
+
+PARSE_CACHE: ParseCache | None = None
+"""The cache consulted by `Dialect.parse`, if any. See `enable_parse_cache`."""
+
+
+def enable_parse_cache(max_nodes: int = 1_000_000, copy: bool = True) -> ParseCache:
+    """
+    Puts a fresh `ParseCache` in front of `Dialect.parse` and `Dialect.parse_into`.
+
+    Args:
+        max_nodes: the maximum total number of nodes held by the cached syntax trees.
+        copy: whether to hand out copies of the cached trees, instead of shared read-only ones,
+            see `ParseCache`.
+
+    Returns:
+        The enabled cache, e.g. to inspect its statistics.
+    """
+    global PARSE_CACHE
+    disable_parse_cache()
+    PARSE_CACHE = ParseCache(max_nodes=max_nodes, copy=copy)
+    return PARSE_CACHE
+
+
+def disable_parse_cache() -> None:
+    """Removes the parse cache, if one was enabled."""
+    global PARSE_CACHE
+    if PARSE_CACHE is not None:
+        PARSE_CACHE.clear()
+    PARSE_CACHE = None
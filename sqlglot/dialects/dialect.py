@@ -9,7 +9,7 @@ from enum import Enum, auto
 from functools import reduce
 from builtins import type as Type
 
-from sqlglot import exp
+from sqlglot import cache as parse_cache, exp, profiler
 from sqlglot.dialects import DIALECT_MODULE_NAMES
 from sqlglot.errors import ParseError
 from sqlglot.generator import Generator, unsupported_args
@@ -1126,11 +1126,15 @@ class Dialect(metaclass=_Dialect):
         return path
 
     def parse(self, sql: str, **opts: Unpack[ParserArgs]) -> list[exp.Expr | None]:
+        if parse_cache.PARSE_CACHE is not None:
+            return parse_cache.PARSE_CACHE.parse(self, sql, opts)
         return self.parser(**opts).parse(self.tokenize(sql), sql)
 
     def parse_into(
         self, expression_type: exp.IntoType, sql: str, **opts: Unpack[ParserArgs]
     ) -> list[exp.Expr | None]:
+        if parse_cache.PARSE_CACHE is not None:
+            return parse_cache.PARSE_CACHE.parse(self, sql, opts, into=expression_type)
         return self.parser(**opts).parse_into(expression_type, self.tokenize(sql), sql)
 
     def generate(
@@ -1138,6 +1142,15 @@ class Dialect(metaclass=_Dialect):
     ) -> str:
         return self.generator(**opts).generate(expression, copy=copy)
 
+    def generate_to(
+        self,
+        expression: exp.Expr,
+        writer: t.IO[str] | list[str],
+        copy: bool = True,
+        **opts: Unpack[GeneratorArgs],
+    ) -> None:
+        self.generator(**opts).generate_to(expression, writer, copy=copy)
+
     def transpile(self, sql: str, **opts: Unpack[GeneratorArgs]) -> list[str]:
         return [
             self.generate(expression, copy=False, **opts) if expression else ""
@@ -1147,6 +1160,9 @@ class Dialect(metaclass=_Dialect):
     def tokenize(self, sql: str, dialect: DialectType = None) -> list[Token]:
         return self.tokenizer(dialect=dialect).tokenize(sql)
 
+    def split_statements(self, sql: str) -> t.Iterator[tuple[int, int, TokenType]]:
+        return self.tokenizer().split_statements(sql)
+
     def tokenizer(self, dialect: DialectType = None) -> Tokenizer:
         return self.tokenizer_class(dialect=dialect or self)
 
@@ -1155,6 +1171,8 @@ class Dialect(metaclass=_Dialect):
 
     def parser(self, **opts: Unpack[ParserArgs]) -> Parser:
         args: ParserArgs = {"dialect": self, **opts}
+        if profiler.PROFILE is not None:
+            return profiler.PROFILE.parser(self.parser_class, **args)
         return self.parser_class(**args)
 
     def generator(self, **opts: Unpack[GeneratorArgs]) -> Generator:
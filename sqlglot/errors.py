@@ -34,6 +34,10 @@ class UnsupportedError(SqlglotError):
     pass
 
 
+class MutationError(SqlglotError):
+    """Raised before a tree that's guarded by `exp.guard_mutations` is mutated."""
+
+
 class ParseError(SqlglotError):
     def __init__(
         self,
@@ -43,6 +47,10 @@ class ParseError(SqlglotError):
         super().__init__(message)
         self.errors = errors or []
 
+    def __reduce__(self) -> tuple[t.Any, ...]:
+        # Keeps the errors when pickled, e.g. to be sent back from a worker process
+        return (self.__class__, (*self.args, self.errors))
+
     @classmethod
     def new(
         cls,
@@ -12,16 +12,18 @@ import textwrap
 import typing as t
 from builtins import type as Type
 from collections import deque
-from collections.abc import Collection, Iterator, Mapping, MutableMapping, Sequence
+from contextlib import contextmanager
+from collections.abc import Collection, Iterable, Iterator, Mapping, MutableMapping, Sequence
 from copy import deepcopy
 from decimal import Decimal
 from functools import reduce
 
 from sqlglot._typing import E, GeneratorNoDialectArgs, ParserNoDialectArgs, T
-from sqlglot.errors import ParseError
+from sqlglot.errors import MutationError, ParseError
 from sqlglot.helper import (
     camel_to_snake_case,
     ensure_list,
+    mypyc_attr,
     seq_get,
     to_bool,
     trait,
@@ -98,6 +100,8 @@ class Expr:
     _type: DataType | None
     _meta: dict[str, t.Any] | None
     _hash: int | None
+    _node_index: NodeIndex | None
+    _lazy: bool
 
     @classmethod
     def __init_subclass__(cls, **kwargs: t.Any) -> None:
@@ -120,6 +124,8 @@ class Expr:
         self._type: DataType | None = None
         self._meta: dict[str, t.Any] | None = None
         self._hash: int | None = None
+        self._node_index: NodeIndex | None = None
+        self._lazy: bool = False
 
         if not self.is_primitive:
             for arg_key, value in self.args.items():
@@ -396,6 +402,30 @@ class Expr:
         """
         raise NotImplementedError
 
+    def collect(
+        self,
+        *expression_types: Type[E],
+        bfs: bool = True,
+        prune: t.Callable[[Expr], bool] | None = None,
+    ) -> list[E]:
+        """
+        Returns all nodes in this tree which match at least one of the specified types, or all of
+        its nodes if no types are given, in the order in which `walk` would visit them.
+
+        Unlike `find_all` and `walk`, this builds the list in a single pass without going through
+        generators, which is faster when all of the matches are needed anyway.
+
+        Args:
+            expression_types: the expression type(s) to match.
+            bfs: whether to search the AST using the BFS algorithm (DFS is used if false).
+            prune: callable that returns True if the search should stop traversing this branch
+                of the tree.
+
+        Returns:
+            The list of matching nodes.
+        """
+        raise NotImplementedError
+
     def unnest(self) -> Expr:
         """
         Returns the first non parenthesis child or self.
@@ -463,6 +493,22 @@ class Expr:
         """
         raise NotImplementedError
 
+    def map_in_place(self, fun: t.Callable[..., T], *args: object, **kwargs: object) -> T:
+        """
+        Visits all tree nodes (excluding already transformed ones) in DFS order and applies the
+        given transformation function to each node, modifying the tree in place. This is what
+        `transform` does when `copy` is False, without going through generators.
+
+        Args:
+            fun: a function which takes a node as an argument and returns a
+                new transformed node or the same node without modifications. If the function
+                returns None, then the corresponding node will be removed from the syntax tree.
+
+        Returns:
+            The transformed tree.
+        """
+        raise NotImplementedError
+
     def replace(self, expression: T) -> T:
         """
         Swap out this expression with a new expression.
@@ -830,6 +876,8 @@ class Expression(Expr):
         "_type",
         "_meta",
         "_hash",
+        "_node_index",
+        "_lazy",
     )
 
     def __eq__(self, other: object) -> bool:
@@ -853,11 +901,14 @@ class Expression(Expr):
                 for v in node.args.values():
                     if isinstance(v, Expr):
                         if v._hash is None:
-                            stack.append(v)
+                            # Placeholders are hashed like the subtrees they stand for
+                            stack.append(v.parse() if type(v) is Lazy else v)
                     elif type(v) is list:
                         for x in v:
                             if isinstance(x, Expr) and x._hash is None:
-                                stack.append(x)
+                                stack.append(x.parse() if type(x) is Lazy else x)
+
+            HASH_STATS.rehashed += len(nodes)
 
             for node in reversed(nodes):
                 hash_ = hash(node.key)
@@ -887,13 +938,10 @@ class Expression(Expr):
 
     def __reduce__(
         self,
-    ) -> tuple[
-        t.Callable[[list[dict[str, t.Any]] | None], Expr | DType | None],
-        tuple[list[dict[str, t.Any]]],
-    ]:
-        from sqlglot.serde import dump, load
+    ) -> tuple[t.Callable[[tuple[t.Any, ...]], Expr], tuple[tuple[t.Any, ...]]]:
+        from sqlglot.serde import dump_flat, load_flat
 
-        return (load, (dump(self),))
+        return (load_flat, (dump_flat(self),))
 
     @property
     def this(self) -> t.Any:
@@ -974,6 +1022,8 @@ class Expression(Expr):
 
     @type.setter
     def type(self, dtype: DataType | DType | str | None) -> None:
+        if MUTATION_GUARD.roots:
+            MUTATION_GUARD.check(self)
         if dtype and type(dtype).__name__ != "DataType":
             from sqlglot.expressions.datatypes import DataType as _DataType
 
@@ -999,43 +1049,96 @@ class Expression(Expr):
         return meta.get(key, default) if meta is not None else default
 
     def __deepcopy__(self, memo: t.Any) -> Expr:
+        # Within a `deepcopy` call, every node is recorded in its memo, so that a tree reached
+        # several times, e.g. as both a lineage node's source and one of its subtrees, is copied
+        # once: a subtree that was copied on its own is adopted by its parent's copy
+        if memo is not None:
+            copied = memo.get(id(self))
+            if copied is not None:
+                return copied
+
         root = self.__class__()
         stack: list[tuple[Expr, Expr]] = [(self, root)]
+        types: dict[int, Expr] = {}
 
+        if memo is not None:
+            memo[id(self)] = root
+            types = memo
+
+        # The copies are wired up directly instead of through `set` and `append`, since there
+        # are no hashes to invalidate in a fresh tree, and the types are copied on the same
+        # stack instead of recursing into `deepcopy`, whose dispatch dominates the cost
         while stack:
             node, copy = stack.pop()
 
             if node.comments is not None:
-                copy.comments = deepcopy(node.comments)
-            if node._type is not None:
-                copy._type = deepcopy(node._type)
+                copy.comments = node.comments[:]
+            if isinstance(node._type, Expr):
+                # Annotated nodes often share their type instances, and so do their copies
+                dtype = types.get(id(node._type))
+                if dtype is None:
+                    dtype = SHARED_TYPES.get(id(node._type))
+                    if dtype is None:
+                        dtype = node._type.__class__()
+                        stack.append((node._type, dtype))
+                    types[id(node._type)] = dtype
+                copy._type = dtype  # type: ignore[assignment]
+            elif node._type is not None:
+                copy._type = deepcopy(node._type, memo)
             if node._meta is not None:
-                copy._meta = deepcopy(node._meta)
-            if node._hash is not None:
-                copy._hash = node._hash
+                copy._meta = _copy_meta(node._meta)
+            copy._hash = node._hash
+            copy._lazy = node._lazy
+
+            if type(node.args) is not dict:
+                # Interned args only hold immutable values and can be shared by the copy too
+                copy.args = node.args
+                continue
 
+            args = copy.args
             for k, vs in node.args.items():
                 if isinstance(vs, Expr):
-                    stack.append((vs, vs.__class__()))
-                    copy.set(k, stack[-1][-1])
+                    child = memo.get(id(vs)) if memo is not None else None
+                    if child is None:
+                        child = vs.__class__()
+                        stack.append((vs, child))
+                        if memo is not None:
+                            memo[id(vs)] = child
+                    child.parent = copy
+                    child.arg_key = k
+                    args[k] = child
                 elif type(vs) is list:
-                    copy.args[k] = []
-
-                    for v in vs:
+                    values: list[t.Any] = []
+                    for i, v in enumerate(vs):
                         if isinstance(v, Expr):
-                            stack.append((v, v.__class__()))
-                            copy.append(k, stack[-1][-1])
-                        else:
-                            copy.append(k, v)
+                            child = memo.get(id(v)) if memo is not None else None
+                            if child is None:
+                                child = v.__class__()
+                                stack.append((v, child))
+                                if memo is not None:
+                                    memo[id(v)] = child
+                            child.parent = copy
+                            child.arg_key = k
+                            child.index = i
+                            v = child
+                        values.append(v)
+                    args[k] = values
                 else:
-                    copy.args[k] = vs
+                    args[k] = vs
 
         return root
 
     def copy(self: E) -> E:
-        return deepcopy(self)
+        # Skips `deepcopy`'s memo bookkeeping, which the iterative copy doesn't need
+        return t.cast(E, self.__deepcopy__(None))
 
     def add_comments(self, comments: list[str] | None = None, prepend: bool = False) -> None:
+        if MUTATION_GUARD.roots and MUTATION_GUARD.guards(self):
+            # Adding no comments would only initialize the list, which doesn't change the SQL
+            if not comments:
+                return
+            MUTATION_GUARD.trip(self)
+
         if self.comments is None:
             self.comments = []
 
@@ -1054,15 +1157,32 @@ class Expression(Expr):
                 self.comments = comments + self.comments
 
     def pop_comments(self) -> list[str]:
+        if MUTATION_GUARD.roots and MUTATION_GUARD.guards(self):
+            if not self.comments:
+                return []
+            MUTATION_GUARD.trip(self)
+
         comments = self.comments or []
         self.comments = None
         return comments
 
     def append(self, arg_key: str, value: t.Any) -> None:
+        if MUTATION_GUARD.roots:
+            MUTATION_GUARD.check(self)
         node: Expr | None = self
+        invalidated = 0
+
         while node and node._hash is not None:
             node._hash = None
             node = node.parent
+            invalidated += 1
+
+        HASH_STATS.invalidated += invalidated
+        HASH_STATS.version += 1
+
+        if type(self.args) is not dict:
+            # Interned args are shared with other nodes, see sqlglot.interning
+            self.args = dict(self.args)
 
         if type(self.args.get(arg_key)) is not list:
             self.args[arg_key] = []
@@ -1072,6 +1192,9 @@ class Expression(Expr):
             value.index = len(values)
         values.append(value)
 
+        if self._node_index is not None:
+            self._node_index.add(value)
+
     def set(
         self,
         arg_key: str,
@@ -1079,11 +1202,31 @@ class Expression(Expr):
         index: int | None = None,
         overwrite: bool = True,
     ) -> None:
+        if MUTATION_GUARD.roots and MUTATION_GUARD.guards(self):
+            # Setting an arg to what it already is would leave the node as is
+            if index is None and (
+                self.args.get(arg_key) is value
+                if isinstance(value, Expr)
+                else value is None and arg_key not in self.args
+            ):
+                return
+            MUTATION_GUARD.trip(self)
+
         node: Expr | None = self
+        invalidated = 0
 
         while node and node._hash is not None:
             node._hash = None
             node = node.parent
+            invalidated += 1
+
+        HASH_STATS.invalidated += invalidated
+        HASH_STATS.version += 1
+
+        if type(self.args) is not dict:
+            self.args = dict(self.args)
+
+        node_index = self._node_index
 
         if index is not None:
             expressions = self.args.get(arg_key) or []
@@ -1091,6 +1234,11 @@ class Expression(Expr):
             if seq_get(expressions, index) is None:
                 return
 
+            if node_index is not None:
+                if value is None or isinstance(value, list) or overwrite:
+                    node_index.remove(self, expressions[index])
+                node_index.add(value)
+
             if value is None:
                 expressions.pop(index)
                 for v in expressions[index:]:
@@ -1106,24 +1254,35 @@ class Expression(Expr):
                 expressions.insert(index, value)
 
             value = expressions
-        elif value is None:
-            self.args.pop(arg_key, None)
-            return
+        else:
+            if node_index is not None:
+                node_index.remove(self, self.args.get(arg_key))
+                node_index.add(value)
+
+            if value is None:
+                self.args.pop(arg_key, None)
+                return
 
         self.args[arg_key] = value
         self._set_parent(arg_key, value, index)
 
     def _set_parent(self, arg_key: str, value: object, index: int | None = None) -> None:
+        if MUTATION_GUARD.roots:
+            MUTATION_GUARD.check_value(value)
         if isinstance(value, Expr):
             value.parent = self
             value.arg_key = arg_key
             value.index = index
+            if value._lazy:
+                mark_lazy(self)
         elif isinstance(value, list):
             for i, v in enumerate(value):
                 if isinstance(v, Expr):
                     v.parent = self
                     v.arg_key = arg_key
                     v.index = i
+                    if v._lazy:
+                        mark_lazy(self)
 
     def set_kwargs(self, kwargs: Mapping[str, object]) -> Self:
         """Set multiples keyword arguments at once, using `.set()` method.
@@ -1157,7 +1316,14 @@ class Expression(Expr):
         return next(self.find_all(*expression_types, bfs=bfs), None)
 
     def find_all(self, *expression_types: Type[E], bfs: bool = True) -> Iterator[E]:
-        for expression in self.walk(bfs=bfs):
+        node_index = self._node_index
+        if node_index is not None and node_index.root is self and self.parent is None:
+            nodes = node_index.find_all(expression_types, bfs=bfs)
+            if nodes is not None:
+                yield from nodes
+                return
+
+        for expression in self.bfs() if bfs else self.dfs():
             if isinstance(expression, expression_types):
                 yield expression
 
@@ -1191,16 +1357,28 @@ class Expression(Expr):
         else:
             yield from self.dfs(prune=prune)
 
+    # The traversals below find child expressions inline instead of via the iter_expressions
+    # generator, whose per-node generator object dominates their cost. Only placeholders, which
+    # are parsed when they're walked into, still go through it.
+
     def dfs(self, prune: t.Callable[[Expr], bool] | None = None) -> Iterator[Expr]:
-        stack = [self]
+        stack: list[Expr] = [self]
 
         while stack:
             node = stack.pop()
             yield node
             if prune and prune(node):
                 continue
-            for v in node.iter_expressions(reverse=True):
-                stack.append(v)
+            if type(node) is Lazy:
+                stack.extend(node.iter_expressions())
+                continue
+            for vs in reversed(node.args.values()):
+                if isinstance(vs, Expr):
+                    stack.append(vs)
+                elif type(vs) is list:
+                    for v in reversed(vs):
+                        if isinstance(v, Expr):
+                            stack.append(v)
 
     def bfs(self, prune: t.Callable[[Expr], bool] | None = None) -> Iterator[Expr]:
         queue: deque[Expr] = deque()
@@ -1211,8 +1389,67 @@ class Expression(Expr):
             yield node
             if prune and prune(node):
                 continue
-            for v in node.iter_expressions():
-                queue.append(v)
+            if type(node) is Lazy:
+                queue.extend(node.iter_expressions())
+                continue
+            for vs in node.args.values():
+                if isinstance(vs, Expr):
+                    queue.append(vs)
+                elif type(vs) is list:
+                    for v in vs:
+                        if isinstance(v, Expr):
+                            queue.append(v)
+
+    def collect(
+        self,
+        *expression_types: Type[E],
+        bfs: bool = True,
+        prune: t.Callable[[Expr], bool] | None = None,
+    ) -> list[E]:
+        nodes: list[Expr] = []
+
+        if bfs:
+            # The list of visited nodes doubles as the queue
+            nodes.append(self)
+            i = 0
+
+            while i < len(nodes):
+                node = nodes[i]
+                i += 1
+                if prune and prune(node):
+                    continue
+                if type(node) is Lazy:
+                    nodes.extend(node.iter_expressions())
+                    continue
+                for vs in node.args.values():
+                    if isinstance(vs, Expr):
+                        nodes.append(vs)
+                    elif type(vs) is list:
+                        for v in vs:
+                            if isinstance(v, Expr):
+                                nodes.append(v)
+        else:
+            stack: list[Expr] = [self]
+
+            while stack:
+                node = stack.pop()
+                nodes.append(node)
+                if prune and prune(node):
+                    continue
+                if type(node) is Lazy:
+                    stack.extend(node.iter_expressions())
+                    continue
+                for vs in reversed(node.args.values()):
+                    if isinstance(vs, Expr):
+                        stack.append(vs)
+                    elif type(vs) is list:
+                        for v in reversed(vs):
+                            if isinstance(v, Expr):
+                                stack.append(v)
+
+        if not expression_types:
+            return t.cast(list[E], nodes)
+        return [t.cast(E, node) for node in nodes if isinstance(node, expression_types)]
 
     def unnest(self) -> Expr:
         expression = self
@@ -1252,10 +1489,14 @@ class Expression(Expr):
     def transform(
         self, fun: t.Callable[..., T], *args: object, copy: bool = True, **kwargs: object
     ) -> T:
+        return (self.copy() if copy else self).map_in_place(fun, *args, **kwargs)
+
+    def map_in_place(self, fun: t.Callable[..., T], *args: object, **kwargs: object) -> T:
         root: t.Any = None
-        new_node: t.Any = None
+        stack: list[Expr] = [self]
 
-        for node in (self.copy() if copy else self).dfs(prune=lambda n: n is not new_node):
+        while stack:
+            node = stack.pop()
             parent, arg_key, index = node.parent, node.arg_key, node.index
             new_node = fun(node, *args, **kwargs)
 
@@ -1264,6 +1505,21 @@ class Expression(Expr):
             elif parent and arg_key and new_node is not node:
                 parent.set(arg_key, new_node, index)
 
+            # Transformed nodes aren't visited any further
+            if new_node is not node:
+                continue
+
+            if type(node) is Lazy:
+                stack.extend(node.iter_expressions())
+                continue
+            for vs in reversed(node.args.values()):
+                if isinstance(vs, Expr):
+                    stack.append(vs)
+                elif type(vs) is list:
+                    for v in reversed(vs):
+                        if isinstance(v, Expr):
+                            stack.append(v)
+
         assert root
         return root
 
@@ -1768,6 +2024,556 @@ class Literal(Expression, Condition):
         return self.this
 
 
+class LiteralList(Expression):
+    """
+    A compact sequence of literals, such as the elements of a large IN list or of a VALUES row.
+
+    Instead of one `Literal` node per element, the literals' texts and whether each of them is a
+    string are stored in two tuples. These nodes are produced by `Parser(literal_lists=True)` and
+    are leaves as far as tree traversals are concerned: `literals` builds the equivalent `Literal`
+    nodes, and `expand` replaces the list with them in its parent, e.g. before mutating them.
+    """
+
+    arg_types = {"values": True, "is_string": True}
+    _hash_raw_args = True
+    is_primitive = True
+
+    @classmethod
+    def from_literals(cls, literals: Iterable[Literal]) -> LiteralList:
+        values = []
+        is_string = []
+        for literal in literals:
+            values.append(literal.this)
+            is_string.append(literal.args["is_string"])
+        return cls(values=tuple(values), is_string=tuple(is_string))
+
+    def set(
+        self,
+        arg_key: str,
+        value: object,
+        index: int | None = None,
+        overwrite: bool = True,
+    ) -> None:
+        # Deserializers produce lists, but the values have to be hashable
+        super().set(arg_key, tuple(value) if type(value) is list else value, index, overwrite)
+
+    def literals(self) -> list[Literal]:
+        """Returns new `Literal` nodes, one per element of this list."""
+        return [
+            Literal(this=value, is_string=is_string)
+            for value, is_string in zip(self.args["values"], self.args["is_string"])
+        ]
+
+    def expand(self) -> list[Literal]:
+        """Replaces this node with its literals, in place, and returns them."""
+        literals = self.literals()
+        if self.parent:
+            self.replace(literals)
+        return literals
+
+    def to_py(self) -> list[int | str | Decimal]:
+        return [literal.to_py() for literal in self.literals()]
+
+
+class Lazy(Expression):
+    """
+    A placeholder for a subtree whose parsing was deferred by `Parser(lazy=True)`, such as the body
+    of a CTE, a parenthesized subquery or a function call.
+
+    The placeholder holds the range of tokens it spans (see `sqlglot.parser.LazyRange`) and is
+    replaced in place by the parsed subtree the first time it's walked into, e.g. by `walk`,
+    `find_all` or `dump`, or when it's explicitly parsed by `parse`. Generating SQL for it parses
+    the copy of the tree the generator works on, so the original placeholder is kept.
+
+    Placeholders and the nodes they're attached under are flagged, see `mark_lazy`, so that
+    `parse_lazy` only walks the trees that may hold some.
+    """
+
+    arg_types = {"this": True}
+    _hash_raw_args = True
+
+    def __init__(self, **args: object) -> None:
+        super().__init__(**args)
+        self._lazy = True
+
+    @property
+    def source(self) -> str:
+        """The SQL text this placeholder spans."""
+        return self.args["this"].text
+
+    def parse(self) -> Expr:
+        """Parses the deferred subtree, replaces this placeholder with it and returns it."""
+        expression = self.args["this"].parse()
+        if self.comments:
+            expression.add_comments(self.comments, prepend=True)
+        if self.parent:
+            self.replace(expression)
+        return expression
+
+    def iter_expressions(self: E, reverse: bool = False) -> Iterator[E]:
+        yield t.cast(E, t.cast(Lazy, self).parse())
+
+
+def mark_lazy(expression: Expr) -> None:
+    """
+    Flags `expression` and its ancestors as nodes whose subtrees may hold `Lazy` placeholders.
+    Attaching a flagged node to another one flags it too, so this is only needed for nodes that
+    are wired up directly, bypassing `set` and the constructors.
+    """
+    node: Expr | None = expression
+    while node is not None and not node._lazy:
+        node._lazy = True
+        node = node.parent
+
+
+def parse_lazy(expression: Expr) -> Expr:
+    """
+    Parses all of the `Lazy` placeholders in the given tree, in place. Trees that aren't flagged
+    by `mark_lazy` hold none, so they're returned as is.
+
+    Args:
+        expression: the tree to parse.
+
+    Returns:
+        The parsed tree, which is a new node only if `expression` itself is a placeholder.
+    """
+    if not expression._lazy:
+        return expression
+
+    if isinstance(expression, Lazy):
+        expression = expression.parse()
+
+    # Walking into a placeholder parses it, which flags its ancestors again if the parsed subtree
+    # holds placeholders of its own, so the flags are only cleared once the walk is over
+    nodes = list(expression.walk())
+    for node in nodes:
+        node._lazy = False
+
+    return expression
+
+
+class NodeIndex:
+    """
+    An index from node class to the nodes of a tree, which lets `find_all` (and thus `find`) on
+    the tree's root look its matches up instead of walking the whole tree. See `index_nodes`.
+
+    Every indexed node points to the index, so that `set`, `append`, `replace` and `pop` can keep
+    it up to date without looking for the root. Nodes that are moved out of the tree by other
+    means are detected and dropped when they're looked up, but nodes that are added to it by other
+    means, e.g. by mutating a list arg in place, aren't found.
+    """
+
+    __slots__ = ("root", "nodes", "size")
+
+    # Looking matches up only pays off if they're a small enough fraction of the tree, since
+    # they need to be sorted into the order of a walk
+    MAX_MATCH_RATIO: t.ClassVar[float] = 0.25
+
+    def __init__(self, root: Expr) -> None:
+        self.root = root
+        self.nodes: dict[type[Expr], dict[int, Expr]] = {}
+        self.size = 0
+
+    def add(self, value: t.Any) -> None:
+        """Indexes the nodes of an expression, or of a list of expressions."""
+        stack = [v for v in ensure_list(value) if isinstance(v, Expr)]
+
+        while stack:
+            node = stack.pop()
+            node._node_index = self
+            nodes = self.nodes.get(node.__class__)
+            if nodes is None:
+                nodes = self.nodes[node.__class__] = {}
+            if id(node) not in nodes:
+                nodes[id(node)] = node
+                self.size += 1
+
+            for vs in node.args.values():
+                if isinstance(vs, Expr):
+                    stack.append(vs)
+                elif type(vs) is list:
+                    for v in vs:
+                        if isinstance(v, Expr):
+                            stack.append(v)
+
+    def remove(self, parent: Expr, value: t.Any) -> None:
+        """
+        Removes the nodes of an expression, or of a list of expressions, that's about to be
+        detached from `parent`. Nodes that were already moved elsewhere, e.g. into a new node
+        that's set into the tree, are kept.
+        """
+        stack = [(parent, v) for v in ensure_list(value) if isinstance(v, Expr)]
+
+        while stack:
+            parent, node = stack.pop()
+            if node.parent is not parent:
+                continue
+
+            self.discard(node)
+
+            for vs in node.args.values():
+                if isinstance(vs, Expr):
+                    stack.append((node, vs))
+                elif type(vs) is list:
+                    for v in vs:
+                        if isinstance(v, Expr):
+                            stack.append((node, v))
+
+    def discard(self, node: Expr) -> None:
+        """Removes a single node from the index."""
+        nodes = self.nodes.get(node.__class__)
+        if nodes is not None and nodes.pop(id(node), None) is not None:
+            self.size -= 1
+        if node._node_index is self:
+            node._node_index = None
+
+    def find_all(self, expression_types: tuple[Type[E], ...], bfs: bool = True) -> list[E] | None:
+        """
+        Looks up the nodes of the indexed tree that match at least one of `expression_types`.
+
+        Returns:
+            The matching nodes, in the order in which a walk would visit them, or None if looking
+            them up wouldn't be faster than walking the tree.
+        """
+        candidates: list[Expr] = []
+        for klass, nodes in self.nodes.items():
+            if issubclass(klass, expression_types):
+                candidates.extend(nodes.values())
+
+        if len(candidates) > self.size * self.MAX_MATCH_RATIO:
+            return None
+
+        keyed: list[tuple[list[tuple[int, int]], Expr]] = []
+        for node in candidates:
+            path = _path(self.root, node)
+            if path is None:
+                self.discard(node)
+            else:
+                keyed.append((path, node))
+
+        # A DFS visits the nodes in the lexicographic order of their paths from the root, while a
+        # BFS visits them level by level
+        if bfs:
+            keyed.sort(key=lambda item: (len(item[0]), item[0]))
+        else:
+            keyed.sort(key=lambda item: item[0])
+
+        return [t.cast(E, node) for _, node in keyed]
+
+
+def _path(root: Expr, node: Expr) -> list[tuple[int, int]] | None:
+    # The positions of the node and its ancestors among their siblings, from the root down, or
+    # None if the node is no longer in the root's tree
+    path: list[tuple[int, int]] = []
+
+    while node is not root:
+        parent = node.parent
+        if parent is None or node.arg_key is None:
+            return None
+
+        value = parent.args.get(node.arg_key)
+        if value is not node:
+            i = node.index
+            if type(value) is not list or i is None or i >= len(value) or value[i] is not node:
+                return None
+
+        path.append((list(parent.args).index(node.arg_key), node.index or 0))
+        node = parent
+
+    path.reverse()
+    return path
+
+
+def index_nodes(expression: E) -> E:
+    """
+    Builds an index from node class to the nodes of a tree, so that finding a few nodes of some
+    type in a large tree doesn't require walking all of it, e.g. `find_all(Column)` on the root.
+
+    Example:
+        >>> import sqlglot
+        >>> from sqlglot import exp
+        >>> expression = exp.index_nodes(sqlglot.parse_one("SELECT a FROM t WHERE b > 1"))
+        >>> expression.find(exp.Where).this.set("this", exp.column("c"))
+        >>> [column.name for column in expression.find_all(exp.Column)]
+        ['a', 'c']
+
+    Args:
+        expression: the root of the tree to index. Lazy placeholders in it are parsed first.
+
+    Returns:
+        The indexed tree.
+    """
+    expression = t.cast(E, parse_lazy(expression))
+    NodeIndex(expression).add(expression)
+    return expression
+
+
+class HashStats:
+    """
+    Counters of the work spent on keeping the structural hashes of trees up to date.
+
+    Hashes are cached on the nodes, and `set` and `append` only invalidate those of the mutated
+    node and its ancestors, so hashing a tree again only recomputes that spine, bottom-up, and
+    reuses the cached hashes of everything else.
+
+    Attributes:
+        rehashed: the number of nodes whose hash was computed.
+        invalidated: the number of cached hashes that were invalidated by mutations.
+        version: the number of mutations, i.e. of calls to `set` and `append`. If it hasn't
+            changed, no tree was mutated in the meantime.
+    """
+
+    __slots__ = ("rehashed", "invalidated", "version")
+
+    def __init__(self) -> None:
+        self.rehashed = 0
+        self.invalidated = 0
+        self.version = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"HashStats(rehashed={self.rehashed}, invalidated={self.invalidated}, "
+            f"version={self.version})"
+        )
+
+
+HASH_STATS = HashStats()
+"""The global counters, which only ever grow. See `hash_stats` for those of a block of code."""
+
+
+@contextmanager
+def hash_stats() -> Iterator[HashStats]:
+    """
+    Counts the hashing work done within a block of code, e.g. within an `optimize` call.
+
+    Example:
+        >>> import sqlglot
+        >>> from sqlglot import exp
+        >>> from sqlglot.optimizer import optimize
+        >>> with exp.hash_stats() as stats:
+        ...     _ = optimize(sqlglot.parse_one("SELECT a FROM t WHERE a > 1 AND a > 1"))
+        >>> stats.rehashed > 0
+        True
+
+    Yields:
+        The counters, which are set once the block is exited.
+    """
+    stats = HashStats()
+    rehashed, invalidated, version = (
+        HASH_STATS.rehashed,
+        HASH_STATS.invalidated,
+        HASH_STATS.version,
+    )
+
+    try:
+        yield stats
+    finally:
+        stats.rehashed = HASH_STATS.rehashed - rehashed
+        stats.invalidated = HASH_STATS.invalidated - invalidated
+        stats.version = HASH_STATS.version - version
+
+
+class MutationGuard:
+    """
+    Protects trees that are read in place from being mutated, see `guard_mutations`.
+
+    Mutations go through `set`, `append`, the `type` setter and the comment methods, and nodes
+    are reparented through `_set_parent`. These check the guard when it's in use, so that a
+    guarded tree is never left half-mutated.
+
+    Attributes:
+        roots: the ids of the roots of the guarded trees, mapped to the number of guards on them.
+        trips: the number of mutations that were prevented, which only ever grows.
+    """
+
+    __slots__ = ("roots", "trips")
+
+    def __init__(self) -> None:
+        self.roots: dict[int, int] = {}
+        self.trips = 0
+
+    def __repr__(self) -> str:
+        return f"MutationGuard(roots={len(self.roots)}, trips={self.trips})"
+
+    def add(self, expression: Expr) -> None:
+        """Guards the tree of `expression` until it's discarded, e.g. while it's cached."""
+        key = id(expression.root())
+        self.roots[key] = self.roots.get(key, 0) + 1
+
+    def discard(self, expression: Expr) -> None:
+        """Releases a guard that was added on the tree of `expression`."""
+        key = id(expression.root())
+        if self.roots[key] == 1:
+            del self.roots[key]
+        else:
+            self.roots[key] -= 1
+
+    def guards(self, node: Expr) -> bool:
+        """Checks whether `node` belongs to a guarded tree."""
+        return id(node.root()) in self.roots
+
+    def check(self, node: Expr) -> None:
+        """Raises a `MutationError` if `node` belongs to a guarded tree."""
+        if id(node.root()) in self.roots:
+            self.trip(node)
+
+    def trip(self, node: Expr) -> None:
+        self.trips += 1
+        raise MutationError(f"Attempted to mutate a guarded tree at {node.key}")
+
+    def check_value(self, value: object) -> None:
+        """Raises a `MutationError` if `value`, e.g. an arg that's being set, is guarded."""
+        if isinstance(value, Expr):
+            self.check(value)
+        elif isinstance(value, list):
+            for v in value:
+                if isinstance(v, Expr):
+                    self.check(v)
+
+
+MUTATION_GUARD = MutationGuard()
+"""The global guard, which is only checked while at least one tree is guarded."""
+
+
+@contextmanager
+def guard_mutations(*expressions: Expr) -> Iterator[MutationGuard]:
+    """
+    Guards trees against mutations within a block of code, so that they can be read in place
+    by code that usually mutates its input, e.g. by the generator, and only copied if needed.
+
+    Example:
+        >>> import sqlglot
+        >>> from sqlglot import exp
+        >>> expression = sqlglot.parse_one("SELECT a FROM t")
+        >>> with exp.guard_mutations(expression):
+        ...     expression.find(exp.Column).replace(exp.column("b"))
+        Traceback (most recent call last):
+          ...
+        sqlglot.errors.MutationError: Attempted to mutate a guarded tree at select
+
+    Args:
+        expressions: the trees, e.g. a syntax tree and the types it's annotated with.
+
+    Yields:
+        The global guard, whose `trips` tell whether a mutation was attempted, even if the
+        resulting `MutationError` was caught.
+    """
+    for expression in expressions:
+        MUTATION_GUARD.add(expression)
+
+    try:
+        yield MUTATION_GUARD
+    finally:
+        # Guarded trees can't be reparented, so their roots are still the same
+        for expression in expressions:
+            MUTATION_GUARD.discard(expression)
+
+
+def unguarded(expression: E) -> E:
+    """
+    Returns `expression`, or a copy of it if it's guarded, e.g. because it's shared by a read-only
+    `sqlglot.cache.ParseCache`, so that code that parses a tree to build upon it can mutate it.
+    """
+    if MUTATION_GUARD.roots and MUTATION_GUARD.guards(expression):
+        return expression.copy()
+    return expression
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
+class Visitor:
+    """
+    Walks a tree without going through generators, dispatching each node to the `visit_<key>`
+    method of its class, e.g. `visit_column` for columns, or to that of its closest base class
+    that has one, e.g. `visit_func` for functions, and to `generic_visit` otherwise. A method
+    that returns True prunes the node, i.e. its children aren't visited.
+
+    The method of each node class is resolved once and cached in a dispatch table, which is
+    shared by all instances of a visitor class.
+
+    Example:
+        >>> import sqlglot
+        >>> from sqlglot import exp
+        >>> class Names(exp.Visitor):
+        ...     def __init__(self):
+        ...         self.names = []
+        ...     def visit_column(self, node):
+        ...         self.names.append(node.name)
+        ...     def visit_subquery(self, node):
+        ...         return True
+        >>> names = Names()
+        >>> names.visit(sqlglot.parse_one("SELECT a, b + 1 FROM (SELECT c FROM t) WHERE d > 1"))
+        >>> names.names
+        ['a', 'b', 'd']
+    """
+
+    _dispatch: t.ClassVar[dict[type, t.Callable[[t.Any, t.Any], bool | None]]] = {}
+
+    def __init_subclass__(cls, **kwargs: t.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._dispatch = {}
+
+    @classmethod
+    def _resolve(cls, node_class: type) -> t.Callable[[t.Any, t.Any], bool | None]:
+        method = None
+        for base in node_class.__mro__:
+            # Every node is an Expr, so these bases would shadow more specific traits
+            if base is Expression or base is Expr or not issubclass(base, Expr):
+                continue
+            method = getattr(cls, f"visit_{base.key}", None)
+            if method is not None:
+                break
+
+        handler = method or cls.generic_visit
+        cls._dispatch[node_class] = handler
+        return handler
+
+    def generic_visit(self, node: Expr) -> bool | None:
+        """Visits the nodes whose class doesn't have a `visit_<key>` method."""
+        return None
+
+    def visit(self, expression: Expr, bfs: bool = True) -> None:
+        """
+        Visits all nodes of a tree, in the order in which `Expr.walk` would yield them.
+
+        Args:
+            expression: the root of the tree to visit.
+            bfs: whether to visit the nodes in BFS order (DFS is used if false).
+        """
+        dispatch = self._dispatch
+        nodes: list[Expr] = [expression]
+        i = 0
+
+        while i < len(nodes):
+            if bfs:
+                node = nodes[i]
+                i += 1
+            else:
+                node = nodes.pop()
+
+            handler = dispatch.get(node.__class__) or self._resolve(node.__class__)
+            if handler(self, node):
+                continue
+
+            if type(node) is Lazy:
+                nodes.extend(node.iter_expressions())
+            elif bfs:
+                for vs in node.args.values():
+                    if isinstance(vs, Expr):
+                        nodes.append(vs)
+                    elif type(vs) is list:
+                        for v in vs:
+                            if isinstance(v, Expr):
+                                nodes.append(v)
+            else:
+                for vs in reversed(node.args.values()):
+                    if isinstance(vs, Expr):
+                        nodes.append(vs)
+                    elif type(vs) is list:
+                        for v in reversed(vs):
+                            if isinstance(v, Expr):
+                                nodes.append(v)
+
+
 class Var(Expression):
     is_primitive = True
 
@@ -2553,7 +3359,21 @@ def maybe_parse(
     if prefix:
         sql = f"{prefix} {sql}"
 
-    return sqlglot.parse_one(sql, read=dialect, into=into, **opts)
+    return unguarded(sqlglot.parse_one(sql, read=dialect, into=into, **opts))
+
+
+_ATOMIC_META_TYPES: frozenset[type] = frozenset((bool, int, float, str))
+
+# The instances of `DataType.shared` by id, which the copies of the nodes they annotate share too
+SHARED_TYPES: dict[int, Expr] = {}
+
+
+def _copy_meta(meta: dict[str, t.Any]) -> dict[str, t.Any]:
+    # Meta values are mostly positions and flags, which don't need to be deep-copied
+    for v in meta.values():
+        if not (v is None or type(v) in _ATOMIC_META_TYPES):
+            return deepcopy(meta)
+    return meta.copy()
 
 
 @t.overload
@@ -13,7 +13,9 @@ from sqlglot.expressions.core import (
     _TimeUnit,
     Identifier,
     Dot,
+    SHARED_TYPES,
     maybe_copy,
+    unguarded,
 )
 from builtins import type as Type
 
@@ -176,6 +178,9 @@ class DType(AutoName):
         return DataType(this=self).set_kwargs(kwargs)
 
 
+_SHARED_BY_DTYPE: dict[DType, DataType] = {}
+
+
 class DataType(Expression):
     arg_types = {
         "this": True,
@@ -370,6 +375,29 @@ class DataType(Expression):
         else:
             raise ValueError(f"Invalid data type: {type(dtype)}. Expected str or DType")
 
+    @classmethod
+    def shared(cls, dtype: DType) -> DataType:
+        """
+        Returns the shared instance of a type without parameters, e.g. INT, to annotate nodes with.
+        It's also shared by the copies of the nodes, so it must not be mutated, and it must be
+        copied to be used in a tree, e.g. as the target of a cast.
+
+        Example:
+            >>> DataType.shared(DType.INT) is DataType.shared(DType.INT)
+            True
+
+        Args:
+            dtype: the type.
+
+        Returns:
+            The shared `DataType` instance.
+        """
+        shared = _SHARED_BY_DTYPE.get(dtype)
+        if shared is None:
+            shared = _SHARED_BY_DTYPE[dtype] = DataType(this=dtype)
+            SHARED_TYPES[id(shared)] = shared
+        return shared
+
     @classmethod
     def from_str(
         cls,
@@ -396,8 +424,8 @@ class DataType(Expression):
         if dtype.upper() == "UNKNOWN":
             return cls(this=DType.UNKNOWN, **kwargs)
         try:
-            return parse_one(
-                dtype, read=dialect, into=cls, error_level=ErrorLevel.IGNORE
+            return unguarded(
+                parse_one(dtype, read=dialect, into=cls, error_level=ErrorLevel.IGNORE)
             ).set_kwargs(kwargs)
         except ParseError:
             if udt:
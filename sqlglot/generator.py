@@ -9,8 +9,8 @@ from functools import reduce, wraps
 from sqlglot import exp
 from sqlglot.errors import ErrorLevel, UnsupportedError, concat_messages
 from sqlglot.expressions import apply_index_offset
-from sqlglot.expressions.core import maybe_parse
-from sqlglot.helper import csv, name_sequence, seq_get
+from sqlglot.expressions.core import POSITION_META_KEYS, maybe_parse, parse_lazy
+from sqlglot.helper import csv, seq_get
 from sqlglot.jsonpath import ALL_JSON_PATH_PARTS, JSON_PATH_PART_TRANSFORMS
 from sqlglot.time import format_time
 from sqlglot.tokens import TokenType
@@ -27,6 +27,12 @@ logger = logging.getLogger("sqlglot")
 ESCAPED_UNICODE_RE = re.compile(r"\\(\d+)")
 UNSUPPORTED_TEMPLATE = "Argument '{}' is not supported for expression '{}' when targeting {}."
 
+# In pretty mode, `wrap` marks where nested queries start and end instead of indenting their lines
+# at every level, and `_indent_nested` indents them all at once when the SQL is complete
+INDENT_MARKER = "__SQLGLOT__INDENT__"
+DEDENT_MARKER = "__SQLGLOT__DEDENT__"
+_INDENT_MARKER_RE = re.compile(f"({INDENT_MARKER}|{DEDENT_MARKER})")
+
 
 def unsupported_args(
     *args: str | tuple[str, str],
@@ -74,6 +80,10 @@ AFTER_HAVING_MODIFIER_TRANSFORMS: dict[str, t.Any] = {
 
 _DISPATCH_CACHE: dict[type[Generator], dict[type[exp.Expr], t.Callable[..., str]]] = {}
 
+# Per generator class, the number of trees that were generated in place, of those that had to be
+# copied after all and of those that weren't even tried, see `Generator._generate_in_place`
+_IN_PLACE_STATS: dict[type[Generator], list[int]] = {}
+
 
 def _build_dispatch(
     cls: type[Generator],
@@ -93,6 +103,264 @@ def _build_dispatch(
     return dispatch
 
 
+def _in_place_roots(expression: exp.Expr) -> list[exp.Expr] | None:
+    """
+    Checks in one pass whether a tree can be generated in place, i.e. whether it's identical to
+    a copy of it: every node has to be held by its parent, under its arg key and index, and none
+    can be a `Lazy` placeholder, since generating one parses it into the tree.
+
+    Returns:
+        The roots that have to be guarded, i.e. the tree's and those of the types its nodes are
+        annotated with, or None if the tree has to be copied.
+    """
+    if expression.parent is not None:
+        return None
+
+    roots: dict[int, exp.Expr] = {id(expression): expression}
+    stack = [expression]
+
+    while stack:
+        node = stack.pop()
+
+        if type(node) is exp.Lazy:
+            return None
+
+        dtype = node._type
+        if isinstance(dtype, exp.Expr):
+            roots[id(dtype)] = dtype
+
+        if type(node.args) is not dict:
+            # Interned args only hold immutable values, see sqlglot.interning
+            continue
+
+        for k, vs in node.args.items():
+            if isinstance(vs, exp.Expr):
+                if vs.parent is not node or vs.arg_key != k or vs.index is not None:
+                    return None
+                stack.append(vs)
+            elif type(vs) is list:
+                for i, v in enumerate(vs):
+                    if isinstance(v, exp.Expr):
+                        if v.parent is not node or v.arg_key != k or v.index != i:
+                            return None
+                        stack.append(v)
+
+    return list(roots.values())
+
+
+def _indent_nested(sql: str, prefix: str, depth: int = 0) -> tuple[str, int]:
+    """
+    Replaces the markers `Generator.wrap` leaves around nested queries with their indentation, i.e.
+    adds `prefix` to each of their lines once per query they're nested in.
+
+    Args:
+        sql: The SQL, which may be a fragment of a larger one.
+        prefix: The indentation of a single level.
+        depth: The number of nested queries the SQL starts in.
+
+    Returns:
+        The indented SQL and the number of nested queries it ends in.
+    """
+    if not depth and INDENT_MARKER not in sql:
+        return sql, 0
+
+    parts = []
+    for i, part in enumerate(_INDENT_MARKER_RE.split(sql)):
+        if not i % 2:
+            parts.append(part.replace("\n", f"\n{prefix * depth}") if depth else part)
+        elif part == INDENT_MARKER:
+            parts.append(prefix)
+            depth += 1
+        else:
+            depth -= 1
+
+    return "".join(parts), depth
+
+
+class _SQLWriter:
+    """
+    Writes SQL fragments as `Generator.generate` would return their concatenation, i.e. with the
+    nested queries indented, the leading and trailing whitespace stripped and the sentinel line
+    breaks restored.
+    """
+
+    __slots__ = ("_write", "_sentinel", "_indent", "_depth", "_started", "_pending")
+
+    def __init__(
+        self, write: t.Callable[[str], t.Any], sentinel: str | None, indent: str | None
+    ) -> None:
+        self._write = write
+        self._sentinel = sentinel
+        self._indent = indent
+        self._depth = 0
+        self._started = False
+        self._pending = ""
+
+    def write(self, fragment: str) -> None:
+        if self._indent is not None:
+            fragment, self._depth = _indent_nested(fragment, self._indent, self._depth)
+
+        if not self._started:
+            fragment = fragment.lstrip()
+            if not fragment:
+                return
+            self._started = True
+
+        # Trailing whitespace is held back until we know it isn't the end of the SQL
+        stripped = fragment.rstrip()
+        if not stripped:
+            self._pending += fragment
+            return
+
+        sql = self._pending + stripped
+        self._write(sql.replace(self._sentinel, "\n") if self._sentinel else sql)
+        self._pending = fragment[len(stripped) :]
+
+
+class GenerationCache:
+    """
+    A cache of generated SQL, which generators consult when they're given one, e.g. through
+    `Expr.sql(dialect, cache=cache)`.
+
+    Entries are keyed on the generator's class and options and on the hash of the generated tree,
+    which `set` and `append` reset when the tree is mutated. Since that hash is insensitive to the
+    case of most strings and ignores comments and types, each entry also holds a snapshot of the
+    tree it was generated from, which a hit is compared against.
+
+    Only trees generated on their own are cached, i.e. roots or copies of subtrees (as in
+    `subtree.sql()`), because the SQL of a node within a tree may depend on its ancestors.
+
+    Example:
+        >>> from sqlglot import parse_one
+        >>> cache = GenerationCache()
+        >>> expression = parse_one("SELECT a FROM t")
+        >>> expression.sql("duckdb", cache=cache)
+        'SELECT a FROM t'
+        >>> expression.sql("duckdb", cache=cache)
+        'SELECT a FROM t'
+        >>> cache
+        GenerationCache(size=1, hits=1, misses=1, evictions=0)
+
+    Args:
+        max_size: The maximum number of entries, beyond which the least recently used is evicted.
+
+    Attributes:
+        hits: the number of generations that were served by the cache.
+        misses: the number of generations that had to be carried out.
+        evictions: the number of entries that were evicted to make room for new ones.
+    """
+
+    __slots__ = ("max_size", "hits", "misses", "evictions", "_entries")
+
+    def __init__(self, max_size: int = 1024) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: dict[t.Hashable, tuple[exp.Expr, str, tuple[str, ...]]] = {}
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of the lookups that were hits."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (
+            f"GenerationCache(size={len(self._entries)}, hits={self.hits}, "
+            f"misses={self.misses}, evictions={self.evictions})"
+        )
+
+    def clear(self) -> None:
+        """Removes every entry, keeping the statistics."""
+        self._entries.clear()
+
+    def get(self, key: t.Hashable, expression: exp.Expr) -> tuple[str, tuple[str, ...]] | None:
+        """Returns the SQL and unsupported messages cached for `expression` under `key`, if any."""
+        entry = self._entries.get(key)
+
+        if entry is None or not _same_tree(entry[0], expression):
+            self.misses += 1
+            return None
+
+        # Hits are moved to the end, so that the first entry is always the least recently used
+        del self._entries[key]
+        self._entries[key] = entry
+        self.hits += 1
+        return entry[1], entry[2]
+
+    def put(
+        self, key: t.Hashable, snapshot: exp.Expr, sql: str, unsupported_messages: list[str]
+    ) -> None:
+        """Caches the SQL generated from a tree equal to `snapshot`, which must not be mutated."""
+        entries = self._entries
+        entries.pop(key, None)
+
+        while entries and len(entries) >= self.max_size:
+            del entries[next(iter(entries))]
+            self.evictions += 1
+
+        if self.max_size > 0:
+            entries[key] = (snapshot, sql, tuple(unsupported_messages))
+
+
+def _meta_sans_positions(expression: exp.Expr) -> dict[str, t.Any]:
+    meta = expression._meta or {}
+    return {k: v for k, v in meta.items() if k not in POSITION_META_KEYS}
+
+
+def _same_tree(a: exp.Expr, b: exp.Expr) -> bool:
+    # Unlike `==`, which compares hashes, this tells apart everything the generator may depend on
+    stack = [(a, b)]
+
+    while stack:
+        x, y = stack.pop()
+        if x is y:
+            continue
+
+        if type(x) is not type(y) or x.comments != y.comments:
+            return False
+
+        # Equal subtrees parsed from different places only differ in their positions
+        if x._meta != y._meta and _meta_sans_positions(x) != _meta_sans_positions(y):
+            return False
+
+        x_type, y_type = x._type, y._type
+        if x_type is not y_type:
+            if not isinstance(x_type, exp.Expr) or not isinstance(y_type, exp.Expr):
+                return False
+            stack.append((x_type, y_type))
+
+        x_args, y_args = x.args, y.args
+        if len(x_args) != len(y_args):
+            return False
+
+        for k, v in x_args.items():
+            w = y_args.get(k)
+
+            if isinstance(v, exp.Expr):
+                if not isinstance(w, exp.Expr):
+                    return False
+                stack.append((v, w))
+            elif type(v) is list:
+                if type(w) is not list or len(v) != len(w):
+                    return False
+                for i, j in zip(v, w):
+                    if isinstance(i, exp.Expr):
+                        if not isinstance(j, exp.Expr):
+                            return False
+                        stack.append((i, j))
+                    elif type(i) is not type(j) or i != j:
+                        return False
+            elif type(v) is not type(w) or v != w:
+                return False
+
+    return True
+
+
 class Generator:
     """
     Generator converts a given syntax tree to the corresponding SQL string.
@@ -130,6 +398,8 @@ class Generator:
             Default: 80
         comments: Whether to preserve comments in the output SQL code.
             Default: True
+        cache: A `GenerationCache` to look the generated SQL up in, and to store it into.
+            Default: None
     """
 
     TRANSFORMS: t.ClassVar[dict[type[exp.Expr], t.Callable[..., str]]] = {
@@ -840,6 +1110,9 @@ class Generator:
 
     SENTINEL_LINE_BREAK = "__SQLGLOT__LB__"
 
+    # Stands in for the list of expressions that `generate_to` streams
+    STREAM_MARKER = "__SQLGLOT__STREAM__"
+
     __slots__ = (
         "pretty",
         "identify",
@@ -857,11 +1130,14 @@ class Generator:
         "_escaped_quote_end",
         "_escaped_byte_quote_end",
         "_escaped_identifier_end",
-        "_next_name",
+        "_name_count",
         "_identifier_start",
         "_identifier_end",
         "_quote_json_path_key_using_brackets",
         "_dispatch",
+        "_stream_target",
+        "_streamed",
+        "cache",
     )
 
     def __init__(
@@ -878,6 +1154,7 @@ class Generator:
         max_text_width: int = 80,
         comments: bool = True,
         dialect: DialectType = None,
+        cache: GenerationCache | None = None,
     ):
         import sqlglot
         import sqlglot.dialects.dialect
@@ -893,6 +1170,7 @@ class Generator:
         self.max_text_width = max_text_width
         self.comments = comments
         self.dialect = sqlglot.dialects.dialect.Dialect.get_or_raise(dialect)
+        self.cache = cache
 
         # This is both a Dialect property and a Generator argument, so we prioritize the latter
         self.normalize_functions = (
@@ -910,12 +1188,14 @@ class Generator:
         )
         self._escaped_identifier_end = self.dialect.IDENTIFIER_END * 2
 
-        self._next_name = name_sequence("_t")
+        self._name_count = 0
 
         self._identifier_start = self.dialect.IDENTIFIER_START
         self._identifier_end = self.dialect.IDENTIFIER_END
 
         self._quote_json_path_key_using_brackets = True
+        self._stream_target: t.Any = None
+        self._streamed: tuple[t.Any, ...] | None = None
 
         cls = type(self)
         dispatch = _DISPATCH_CACHE.get(cls)
@@ -931,32 +1211,314 @@ class Generator:
         Args:
             expression: The syntax tree.
             copy: Whether to copy the expression. The generator performs mutations so
-                it is safer to copy.
+                it is safer to copy. A root is only copied once the generator attempts to
+                mutate it, see `exp.guard_mutations`.
 
         Returns:
             The SQL string corresponding to `expression`.
         """
-        if copy:
-            expression = expression.copy()
+        cache = self.cache
+        cache_key: tuple[t.Any, ...] | None = None
+        snapshot: exp.Expr | None = None
+
+        # A subtree that's generated in place may depend on its ancestors, unlike a copy of it
+        if cache is not None and (copy or expression.parent is None):
+            cache_key = (self._cache_options(), hash(expression))
+            cached = cache.get(cache_key, expression)
+
+            if cached is not None:
+                cached_sql, unsupported_messages = cached
+                self.unsupported_messages = list(unsupported_messages)
+                self._report_unsupported()
+                return cached_sql
+
+            snapshot = expression.copy()
 
+        sql = self._generate_in_place(expression) if copy else None
+
+        if sql is None:
+            if copy:
+                expression = expression.copy()
+
+            sql = self._generate_sql(expression)
+
+        if cache is not None and cache_key is not None and snapshot is not None:
+            cache.put(cache_key, snapshot, sql, self.unsupported_messages)
+
+        self._report_unsupported()
+        return sql
+
+    def _generate_sql(self, expression: exp.Expr) -> str:
+        # Transforms inspect subtrees directly, so deferred ones have to be parsed first
+        expression = parse_lazy(expression)
         expression = self.preprocess(expression)
 
         self.unsupported_messages = []
-        sql = self.sql(expression).strip()
+        sql = self.sql(expression)
+
+        if self.pretty:
+            sql = _indent_nested(sql, " " * self._indent)[0]
+
+        sql = sql.strip()
 
         if self.pretty:
             sql = sql.replace(self.SENTINEL_LINE_BREAK, "\n")
 
+        return sql
+
+    def _generate_in_place(self, expression: exp.Expr) -> str | None:
+        """
+        Generates a root without copying it, guarding it against mutations instead, since most
+        trees aren't mutated by the generator, and copying one is about as costly as generating it.
+
+        Returns:
+            The SQL string, or None if the generator attempted to mutate the tree, in which case
+            it was left untouched, the generator's state was restored and the tree has to be copied.
+        """
+        cls = type(self)
+        stats = _IN_PLACE_STATS.get(cls)
+        if stats is None:
+            stats = _IN_PLACE_STATS[cls] = [0, 0, 0]
+
+        attempts, copies, skipped = stats
+
+        # Dialects that rewrite most trees are better off copying them upfront, but they still
+        # try every so often, in case the trees they're given change
+        if attempts >= 32 and copies * 4 > attempts:
+            stats[2] = skipped + 1
+            if skipped % 16:
+                return None
+
+        roots = _in_place_roots(expression)
+        if roots is None:
+            return None
+
+        if attempts >= 1024:
+            stats[0] //= 2
+            stats[1] //= 2
+
+        stats[0] += 1
+
+        identify = self.identify
+        name_count = self._name_count
+        quote_json_path_key_using_brackets = self._quote_json_path_key_using_brackets
+
+        with exp.guard_mutations(*roots) as guard:
+            trips = guard.trips
+
+            try:
+                sql: str | None = self._generate_sql(expression)
+            except Exception:
+                if guard.trips == trips:
+                    raise
+                sql = None
+
+            # The error may have been caught along the way, so the count is what tells
+            if guard.trips != trips:
+                sql = None
+
+        if sql is None:
+            stats[1] += 1
+            self.identify = identify
+            self._name_count = name_count
+            self._quote_json_path_key_using_brackets = quote_json_path_key_using_brackets
+
+        return sql
+
+    def _cache_options(self) -> tuple[t.Any, ...]:
+        dialect = self.dialect
+        return (
+            type(self),
+            self.pretty,
+            self.identify,
+            self.normalize,
+            self.pad,
+            self._indent,
+            self.normalize_functions,
+            self.leading_comma,
+            self.max_text_width,
+            self.comments,
+            type(dialect),
+            dialect.version,
+            dialect.normalization_strategy,
+            repr(sorted(dialect.settings.items())),
+        )
+
+    def generate_to(
+        self,
+        expression: exp.Expr,
+        writer: t.IO[str] | list[str],
+        copy: bool = True,
+    ) -> None:
+        """
+        Generates the SQL string corresponding to the given syntax tree, like `generate`, but
+        writes it to `writer` in fragments instead of returning it.
+
+        The operands of a top-level set operation chain, the rows of a top-level VALUES (including
+        that of an INSERT) and the projections of a top-level SELECT are generated and written one
+        at a time, so that the SQL of very large statements is never concatenated in memory.
+
+        Example:
+            >>> import io
+            >>> from sqlglot import parse_one
+            >>> buffer = io.StringIO()
+            >>> Generator().generate_to(parse_one("SELECT 1 UNION ALL SELECT 2"), buffer)
+            >>> buffer.getvalue()
+            'SELECT 1 UNION ALL SELECT 2'
+
+        Args:
+            expression: The syntax tree.
+            writer: A text stream to write the SQL to, or a list to append its fragments to.
+            copy: Whether to copy the expression. The generator performs mutations so
+                it is safer to copy.
+        """
+        if copy:
+            expression = expression.copy()
+
+        expression = parse_lazy(expression)
+        expression = self.preprocess(expression)
+
+        self.unsupported_messages = []
+        out = _SQLWriter(
+            writer.append if isinstance(writer, list) else writer.write,
+            self.SENTINEL_LINE_BREAK if self.pretty else None,
+            " " * self._indent if self.pretty else None,
+        )
+
+        node = expression.expression if isinstance(expression, exp.Insert) else expression
+        if isinstance(node, exp.SetOperation):
+            self._stream_target = node
+        elif isinstance(node, (exp.Select, exp.Values)):
+            self._stream_target = node.args.get("expressions")
+
+        try:
+            sql = self.sql(expression)
+            streamed = self._streamed
+        finally:
+            self._stream_target = None
+            self._streamed = None
+
+        head, marker, tail = sql.partition(self.STREAM_MARKER)
+
+        if not streamed:
+            out.write(sql)
+        elif not marker or self.STREAM_MARKER in tail:
+            # The SQL of the streamed expressions was either dropped or repeated, so we can't tell
+            # where it goes and generate the statement as a whole instead
+            self.unsupported_messages = []
+            out.write(self.sql(expression))
+        else:
+            out.write(head)
+            if isinstance(streamed[0], exp.SetOperation):
+                self._write_set_operations(streamed[0], out)
+            else:
+                self._write_expressions(out, *streamed)
+            out.write(tail)
+
+        self._report_unsupported()
+
+    def _write_set_operations(self, expression: exp.SetOperation, out: _SQLWriter) -> None:
+        sep = self.sep()
+        for i, sql in enumerate(self._set_operation_sqls(expression)):
+            if i:
+                out.write(sep)
+            out.write(sql)
+
+    def _write_expressions(
+        self,
+        out: _SQLWriter,
+        expressions: t.Sequence[str | exp.Expr],
+        flat: bool,
+        indent: bool,
+        skip_first: bool,
+        skip_last: bool,
+        sep: str,
+        prefix: str,
+        new_line: bool,
+    ) -> None:
+        # Mirrors the layout of `expressions`, one expression at a time
+        if flat:
+            first = True
+            for e in expressions:
+                sql = self.sql(e)
+                if sql:
+                    out.write(sql if first else sep + sql)
+                    first = False
+            return
+
+        num_sqls = len(expressions)
+
+        if not self.pretty:
+            for i, e in enumerate(expressions):
+                sql = self.sql(e, comment=False)
+                if sql:
+                    comments = self.maybe_comment("", e) if isinstance(e, exp.Expr) else ""
+                    out.write(f"{prefix}{sql}{comments}{sep if i + 1 < num_sqls else ''}")
+            return
+
+        # The lines are joined and indented like `indent` would, but only the break before the last
+        # line may be treated differently, so each line is held back until the next one comes in
+        pad = " " * self.pad if indent else ""
+        indented_break = f"\n{pad}"
+        lines = [""] if new_line else []
+        pending: str | None = None
+        first = True
+
+        for i, e in enumerate(expressions):
+            sql = self.sql(e, comment=False)
+            if not sql:
+                continue
+
+            comments = self.maybe_comment("", e) if isinstance(e, exp.Expr) else ""
+            if self.leading_comma:
+                lines.append(f"{sep if i > 0 else ''}{prefix}{sql}{comments}".rstrip())
+            else:
+                lines.append(
+                    f"{prefix}{sql}{(sep.rstrip() if comments else sep) if i + 1 < num_sqls else ''}{comments}".rstrip()
+                )
+
+            for line in lines:
+                if pending is None:
+                    pending = line
+                    continue
+
+                chunk = pending.replace("\n", indented_break)
+                out.write(f"{pad}{chunk}" if first and not skip_first else chunk)
+                pending = f"\n{line}"
+                first = False
+
+            lines.clear()
+
+        if new_line:
+            pending = "\n" if pending is None else f"{pending}\n"
+
+        if pending is None:
+            return
+
+        if skip_last:
+            head, line_break, last = pending.rpartition("\n")
+            if not line_break:
+                # The only line is also the last one
+                out.write(pending)
+                return
+            chunk = head.replace("\n", indented_break) + "\n" + last
+        else:
+            chunk = pending.replace("\n", indented_break)
+
+        out.write(f"{pad}{chunk}" if first and not skip_first else chunk)
+
+    def _report_unsupported(self) -> None:
         if self.unsupported_level == ErrorLevel.IGNORE:
-            return sql
+            return
 
         if self.unsupported_level == ErrorLevel.WARN:
             for msg in self.unsupported_messages:
                 logger.warning(msg)
         elif self.unsupported_level == ErrorLevel.RAISE and self.unsupported_messages:
             raise UnsupportedError(concat_messages(self.unsupported_messages, self.max_unsupported))
-
-        return sql
+        elif self.unsupported_level == ErrorLevel.IMMEDIATE and self.unsupported_messages:
+            # Only replayed messages get here, e.g. on a cache hit, since `unsupported` raises
+            raise UnsupportedError(self.unsupported_messages[0])
 
     def preprocess(self, expression: exp.Expr) -> exp.Expr:
         """Apply generic preprocessing transformations to a given expression."""
@@ -1046,7 +1608,10 @@ class Generator:
         if not this_sql:
             return "()"
 
-        this_sql = self.indent(this_sql, level=1, pad=0)
+        if self.pretty:
+            # Indenting the query here would copy it once per level it's nested in
+            this_sql = f"{INDENT_MARKER}{this_sql}{DEDENT_MARKER}"
+
         return f"({self.sep('')}{this_sql}{self.seg(')', sep='')}"
 
     def no_identify(self, func: t.Callable[..., str], *args, **kwargs) -> str:
@@ -1075,16 +1640,25 @@ class Generator:
             return sql
 
         pad = self.pad if pad is None else pad
-        lines = sql.split("\n")
+        prefix = " " * (level * self._indent + pad)
 
-        return "\n".join(
-            (
-                line
-                if (skip_first and i == 0) or (skip_last and i == len(lines) - 1)
-                else f"{' ' * (level * self._indent + pad)}{line}"
-            )
-            for i, line in enumerate(lines)
-        )
+        # Blocks nested in one another are indented once per level, so this has to be linear in the
+        # size of the SQL with a small constant, which `str.replace` is, unlike splitting it into lines
+        if not prefix:
+            return sql
+
+        indented_break = f"\n{prefix}"
+
+        if skip_last:
+            head, line_break, last = sql.rpartition("\n")
+            if not line_break:
+                # The only line is also the last one
+                return sql
+            sql = head.replace("\n", indented_break) + "\n" + last
+        else:
+            sql = sql.replace("\n", indented_break)
+
+        return sql if skip_first else f"{prefix}{sql}"
 
     def sql(
         self,
@@ -1561,7 +2135,8 @@ class Generator:
             self.unsupported("Named columns are not supported in table alias.")
 
         if not alias and not self.dialect.UNNEST_COLUMN_ONLY:
-            alias = self._next_name()
+            alias = f"_t{self._name_count}"
+            self._name_count += 1
 
         return f"{alias}{columns}"
 
@@ -1699,7 +2274,9 @@ class Generator:
                     f"{type_value.value} parameter {param_value.name} exceeds "
                     f"{self.dialect.__class__.__name__}'s maximum of {bound}; capping"
                 )
-                params[i] = exp.DataTypeParam(this=exp.Literal.number(bound))
+                expression.set(
+                    "expressions", exp.DataTypeParam(this=exp.Literal.number(bound)), index=i
+                )
 
         return expression
 
@@ -1866,7 +2443,18 @@ class Generator:
                     select = select.order_by(order.pop(), copy=False)
                 return self.sql(select)
 
-        sqls: list[str] = []
+        if expression is self._stream_target and not isinstance(expression.parent, exp.Subquery):
+            # The operands will be written by `generate_to`, so their SQL isn't needed yet
+            self._streamed = (expression,)
+            this = self.STREAM_MARKER
+        else:
+            this = self.sep().join(self._set_operation_sqls(expression))
+
+        this = self.query_modifiers(expression, this)
+        return self.prepend_ctes(expression, this)
+
+    def _set_operation_sqls(self, expression: exp.SetOperation) -> t.Iterator[str]:
+        # Chains are flattened iteratively, since deeply nested ones would exceed the recursion limit
         stack: list[str | exp.Expr] = [expression]
 
         while stack:
@@ -1881,11 +2469,7 @@ class Generator:
                 )
                 stack.append(node.this)
             else:
-                sqls.append(self.sql(node))
-
-        this = self.sep().join(sqls)
-        this = self.query_modifiers(expression, this)
-        return self.prepend_ctes(expression, this)
+                yield self.sql(node)
 
     def fetch_sql(self, expression: exp.Fetch) -> str:
         direction = expression.args.get("direction")
@@ -2697,7 +3281,11 @@ class Generator:
         selects: list[exp.Query] = []
 
         for i, tup in enumerate(expression.expressions):
-            row = tup.expressions
+            row = [
+                literal
+                for value in tup.expressions
+                for literal in (value.literals() if isinstance(value, exp.LiteralList) else [value])
+            ]
 
             if i == 0 and column_names:
                 row = [
@@ -2980,6 +3568,25 @@ class Generator:
             text = f"{self.dialect.QUOTE_START}{self.escape_str(text)}{self.dialect.QUOTE_END}"
         return text
 
+    def literallist_sql(self, expression: exp.LiteralList) -> str:
+        return ", ".join(self.literal_list_sqls(expression))
+
+    def literal_list_sqls(self, expression: exp.LiteralList) -> list[str]:
+        if self._dispatch.get(exp.Literal) is not Generator.literal_sql:
+            return [self.sql(literal) for literal in expression.literals()]
+
+        quote_start = self.dialect.QUOTE_START
+        quote_end = self.dialect.QUOTE_END
+        escape_str = self.escape_str
+
+        return [
+            f"{quote_start}{escape_str(value)}{quote_end}" if is_string else value
+            for value, is_string in zip(expression.args["values"], expression.args["is_string"])
+        ]
+
+    def lazy_sql(self, expression: exp.Lazy) -> str:
+        return self.sql(expression.parse())
+
     def escape_str(
         self,
         text: str,
@@ -4623,7 +5230,13 @@ class Generator:
         return sep.join(arg_sqls)
 
     def too_wide(self, args: t.Iterable) -> bool:
-        return sum(len(arg) for arg in args) > self.max_text_width
+        return sum(map(self._text_width, args)) > self.max_text_width
+
+    def _text_width(self, sql: str) -> int:
+        # Nested queries aren't indented until the SQL is complete, but their indentation counts
+        if INDENT_MARKER in sql:
+            sql = _indent_nested(sql, " " * self._indent)[0]
+        return len(sql)
 
     def format_time(
         self,
@@ -4656,6 +5269,30 @@ class Generator:
         if not expressions:
             return ""
 
+        streamed = expressions is self._stream_target
+
+        if (
+            len(expressions) == 1
+            and type(expressions) is list
+            and type(expressions[0]) is exp.LiteralList
+        ):
+            # Lay out the elements of a compact literal list like any other list of expressions
+            expressions = self.literal_list_sqls(expressions[0])
+
+        if streamed and not (dynamic and self.pretty):
+            # The expressions will be written by `generate_to`, so their SQL isn't needed yet
+            self._streamed = (
+                expressions,
+                flat,
+                indent,
+                skip_first,
+                skip_last,
+                sep,
+                prefix,
+                new_line,
+            )
+            return self.STREAM_MARKER
+
         if flat:
             return sep.join(sql for sql in (self.sql(e) for e in expressions) if sql)
 
@@ -5339,6 +5976,8 @@ class Generator:
     def _replace_line_breaks(self, string: str) -> str:
         """We don't want to extra indent line breaks so we temporarily replace them with sentinels."""
         if self.pretty:
+            # The line breaks of nested queries have to be indented before they're hidden
+            string = _indent_nested(string, " " * self._indent)[0]
             return string.replace("\n", self.SENTINEL_LINE_BREAK)
         return string
 
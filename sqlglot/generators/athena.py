@@ -81,6 +81,7 @@ def _generator_kwargs(
     leading_comma: bool,
     max_text_width: int,
     comments: bool,
+    cache: t.Any,
 ) -> dict[str, t.Any]:
     kwargs: dict[str, t.Any] = {
         "pretty": pretty,
@@ -93,6 +94,7 @@ def _generator_kwargs(
         "leading_comma": leading_comma,
         "max_text_width": max_text_width,
         "comments": comments,
+        "cache": cache,
     }
     if unsupported_level is not None:
         kwargs["unsupported_level"] = unsupported_level
@@ -144,6 +146,7 @@ class AthenaGenerator(generator.Generator):
         max_text_width: int = 80,
         comments: bool = True,
         dialect: t.Any = None,
+        cache: t.Any = None,
         hive: t.Any = None,
         trino: t.Any = None,
     ) -> None:
@@ -165,6 +168,7 @@ class AthenaGenerator(generator.Generator):
             leading_comma,
             max_text_width,
             comments,
+            cache,
         )
 
         generator.Generator.__init__(self, dialect=dialect, **kwargs)
@@ -178,3 +182,11 @@ class AthenaGenerator(generator.Generator):
             return self._hive_generator.generate(expression, copy=copy)
 
         return self._trino_generator.generate(expression, copy=copy)
+
+    def generate_to(
+        self, expression: exp.Expr, writer: t.IO[str] | list[str], copy: bool = True
+    ) -> None:
+        if _generate_as_hive(expression):
+            self._hive_generator.generate_to(expression, writer, copy=copy)
+        else:
+            self._trino_generator.generate_to(expression, writer, copy=copy)
@@ -1422,7 +1422,7 @@ def _regr_val_sql(
         result_type = exp.DType.DOUBLE.into_expr()
 
     # Cast NULL to the same type as return_value to avoid DuckDB type inference issues
-    typed_null = exp.Cast(this=exp.Null(), to=result_type)
+    typed_null = exp.Cast(this=exp.Null(), to=result_type.copy())
 
     return self.sql(
         exp.If(
@@ -3930,8 +3930,9 @@ class DuckDBGenerator(generator.Generator):
         if explode_array:
             # In BigQuery, UNNESTing a nested array leads to explosion of the top-level array & struct
             # This is transpiled to DDB by transforming "FROM UNNEST(...)" to "FROM (SELECT UNNEST(..., max_depth => 2))"
-            expression.expressions.append(
-                exp.Kwarg(this=exp.var("max_depth"), expression=exp.Literal.number(2))
+            expression.append(
+                "expressions",
+                exp.Kwarg(this=exp.var("max_depth"), expression=exp.Literal.number(2)),
             )
 
             # If BQ's UNNEST is aliased, we transform it from a column alias to a table alias in DDB
@@ -4364,7 +4365,7 @@ class DuckDBGenerator(generator.Generator):
         # We need to cast the result back to the original type when the input is DATE or TIMESTAMPTZ
         # Example: ADD_MONTHS('2023-01-31'::date, 1) should return DATE, not TIMESTAMP
         if this.is_type(exp.DType.DATE, exp.DType.TIMESTAMPTZ):
-            return self.sql(exp.Cast(this=result_expr, to=this.type))
+            return self.sql(exp.Cast(this=result_expr, to=this.type.copy()))
         return self.sql(result_expr)
 
     def format_sql(self, expression: exp.Format) -> str:
@@ -4398,7 +4399,7 @@ class DuckDBGenerator(generator.Generator):
             and date.is_type(*exp.DataType.TEMPORAL_TYPES)
             and not (is_date_unit(unit) and date.is_type(exp.DType.DATE))
         ):
-            return self.sql(exp.Cast(this=result, to=date.type))
+            return self.sql(exp.Cast(this=result, to=date.type.copy()))
 
         return result
 
@@ -4426,12 +4427,12 @@ class DuckDBGenerator(generator.Generator):
                 )
                 date_time = exp.Add(this=dummy_date, expression=timestamp)
                 result = self.func("DATE_TRUNC", unit, date_time)
-                return self.sql(exp.Cast(this=result, to=timestamp.type))
+                return self.sql(exp.Cast(this=result, to=timestamp.type.copy()))
 
             if timestamp.is_type(*exp.DataType.TEMPORAL_TYPES) and not (
                 date_unit and timestamp.is_type(exp.DType.DATE)
             ):
-                return self.sql(exp.Cast(this=result, to=timestamp.type))
+                return self.sql(exp.Cast(this=result, to=timestamp.type.copy()))
 
         return result
 
@@ -118,7 +118,7 @@ def _auto_increment_to_serial(expression: exp.Expr) -> exp.Expr:
     auto = expression.find(exp.AutoIncrementColumnConstraint)
 
     if auto:
-        expression.args["constraints"].remove(auto.parent)
+        t.cast(exp.Expr, auto.parent).pop()
         kind = expression.args["kind"]
 
         if kind.this == exp.DType.INT:
@@ -153,10 +153,11 @@ def _serial_to_generated(expression: exp.Expr) -> exp.Expr:
         generated = exp.ColumnConstraint(kind=exp.GeneratedAsIdentityColumnConstraint(this=False))
         notnull = exp.ColumnConstraint(kind=exp.NotNullColumnConstraint())
 
-        if notnull not in constraints:
-            constraints.insert(0, notnull)
-        if generated not in constraints:
-            constraints.insert(0, generated)
+        missing = [
+            constraint for constraint in (generated, notnull) if constraint not in constraints
+        ]
+        if missing:
+            expression.set("constraints", [*missing, *constraints])
 
     return expression
 
@@ -72,6 +72,9 @@ def _schema_sql(self: PrestoGenerator, expression: exp.Schema) -> str:
 
             column_defs = schema.find_all(exp.ColumnDef)
             if column_defs and isinstance(schema.parent, exp.Property):
+                # The definitions are shared rather than moved, so this bypasses `set`
+                if exp.MUTATION_GUARD.roots:
+                    exp.MUTATION_GUARD.check(expression)
                 expression.expressions.extend(column_defs)
 
     return self.schema_sql(expression)
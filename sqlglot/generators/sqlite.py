@@ -38,7 +38,7 @@ def _transform_create(expression: exp.Expr) -> exp.Expr:
             column.append(
                 "constraints", exp.ColumnConstraint(kind=exp.PrimaryKeyColumnConstraint())
             )
-            schema.expressions.remove(primary_key)
+            primary_key.pop()
 
         for column in defs.values():
             primary_key_index = -1
@@ -55,9 +55,10 @@ def _transform_create(expression: exp.Expr) -> exp.Expr:
             if auto_increment is not None and (
                 primary_key_index == -1 or auto_increment_index < primary_key_index
             ):
-                column.constraints.remove(auto_increment)
+                constraints = [c for c in column.constraints if c is not auto_increment]
                 if primary_key_index != -1:
-                    column.constraints.insert(primary_key_index, auto_increment)
+                    constraints.insert(primary_key_index, auto_increment)
+                column.set("constraints", constraints)
 
     return expression
 
@@ -172,6 +172,17 @@ def while_changing(expression: E, func: t.Callable[[E], E]) -> E:
     Returns:
         The transformed expression.
     """
+    from sqlglot.expressions.core import HASH_STATS
+
+    # The first pass is checked for changes with the mutation counter, so that expressions it
+    # leaves untouched, which are common, don't have to be hashed at all
+    version = HASH_STATS.version
+    transformed = func(expression)
+
+    if transformed is expression and HASH_STATS.version == version:
+        return expression
+
+    expression = transformed
 
     while True:
         start_hash = hash(expression)
@@ -0,0 +1,393 @@
+"""
+Incremental re-parsing of SQL scripts, for editors and language servers that need a fresh syntax tree
+per statement after every keystroke.
+
+A `Script` keeps the tokens and syntax trees of each statement. When the text is edited, only the
+statements whose tokens changed are tokenized and parsed again, while the trees of all other
+statements are reused and their positions are shifted:
+
+    >>> from sqlglot.incremental import Script
+    >>> script = Script("SELECT a FROM t;\\nSELECT b FROM u")
+    >>> script.edit(7, 8, "x").sql
+    'SELECT x FROM t;\\nSELECT b FROM u'
+    >>> [expression.sql() for expression in script.expressions]
+    ['SELECT x FROM t', 'SELECT b FROM u']
+"""
+
+from __future__ import annotations
+
+import bisect
+import typing as t
+
+from sqlglot import exp
+from sqlglot.dialects.dialect import Dialect
+from sqlglot.errors import ErrorLevel
+from sqlglot.tokens import Token, Tokenizer, TokenType
+
+if t.TYPE_CHECKING:
+    from typing_extensions import Unpack
+
+    from sqlglot._typing import ParserNoDialectArgs
+    from sqlglot.dialects.dialect import DialectType
+
+
+# Added to the lines of the tokens that are parsed, so that the nodes positioned from them can be
+# told apart from the ones the parser builds out of other strings, e.g. hints or the star of a
+# FROM-first query, whose positions are relative to those strings and never move
+_LINE_BASE = 1 << 32
+
+
+class _Segment:
+    """
+    The tokens of a statement, up to and including its terminating semicolon, its trees and the
+    nodes of its trees that are positioned from its tokens.
+    """
+
+    __slots__ = ("tokens", "expressions", "positioned")
+
+    def __init__(
+        self,
+        tokens: list[Token],
+        expressions: list[exp.Expr | None],
+        positioned: list[exp.Expr],
+    ) -> None:
+        self.tokens = tokens
+        self.expressions = expressions
+        self.positioned = positioned
+
+
+def _segments(tokens: list[Token]) -> list[list[Token]]:
+    segments: list[list[Token]] = []
+    segment: list[Token] = []
+
+    for token in tokens:
+        segment.append(token)
+        if token.token_type == TokenType.SEMICOLON:
+            segments.append(segment)
+            segment = []
+
+    if segment:
+        segments.append(segment)
+
+    return segments
+
+
+def _chunk_count(segment: list[Token]) -> int:
+    # The parser makes a statement of its own out of each semicolon that has comments
+    last = segment[-1]
+    return 2 if last.token_type == TokenType.SEMICOLON and last.comments else 1
+
+
+def _shift(segment: _Segment, start: int, line: int, col_line: int = -1, col: int = 0) -> None:
+    """
+    Shifts the positions of a segment's tokens and of the nodes positioned from them by `start`
+    characters and `line` lines, and then the columns of the ones on line `col_line` by `col`
+    characters.
+    """
+    for token in segment.tokens:
+        token.start += start
+        token.end += start
+        token.line += line
+        if token.line == col_line:
+            token.col += col
+
+    for node in segment.positioned:
+        meta = node.meta
+        meta["start"] += start
+        meta["end"] += start
+        meta["line"] += line
+        if meta["line"] == col_line:
+            meta["col"] += col
+
+
+def _positioned(expression: exp.Expr | None) -> list[exp.Expr]:
+    """Returns the nodes positioned from the parsed tokens, whose lines are restored on the way."""
+    positioned = []
+
+    if expression:
+        for node in expression.walk():
+            meta = node._meta
+            if meta and meta.get("line", 0) >= _LINE_BASE:
+                meta["line"] -= _LINE_BASE
+                positioned.append(node)
+
+    return positioned
+
+
+def _is_end(segment: list[Token]) -> bool:
+    size = len(segment) - (segment[-1].token_type == TokenType.SEMICOLON)
+    return size == 1 and segment[0].token_type == TokenType.END
+
+
+class Script:
+    """
+    A SQL script along with its tokens and syntax trees, which can be updated incrementally.
+
+    The script is split into statements at its semicolons, exactly like the parser does. Statements
+    whose parsing spans several of them, i.e. procedural blocks such as `WHILE ... BEGIN ...; END`,
+    can't be re-parsed in isolation, so any edit to a script that contains one re-parses all of it.
+    The same goes for dialects whose tokenizer post-processes the tokens of the whole script.
+
+    Reused trees are shifted lazily: their positions are only updated when they are accessed
+    through `tokens` or `expressions`, so an edit costs time proportional to the size of the
+    statements it touches, plus a small per-statement bookkeeping cost.
+
+    Args:
+        sql: the SQL code string to parse.
+        read: the SQL dialect to apply during parsing (eg. "spark", "hive", "presto", "mysql").
+        dialect: the SQL dialect (alias for read).
+        **opts: other `sqlglot.parser.Parser` options.
+    """
+
+    def __init__(
+        self,
+        sql: str,
+        read: DialectType = None,
+        dialect: DialectType = None,
+        **opts: Unpack[ParserNoDialectArgs],
+    ) -> None:
+        if opts.get("lazy"):
+            raise ValueError("Lazy parsing isn't supported by incremental re-parsing.")
+
+        self.dialect = Dialect.get_or_raise(read or dialect)
+        self.sql = ""
+        self._tokenizer = self.dialect.tokenizer()
+        self._parser = self.dialect.parser(**opts)
+        # Parses with shifted lines, whose errors are reported by parsing again with `_parser`
+        positioning_opts: ParserNoDialectArgs = {**opts, "error_level": ErrorLevel.IGNORE}
+        self._positioning_parser = self.dialect.parser(**positioning_opts)
+        self._segments: list[_Segment] = []
+        # The current end offset and line of each segment's last token. Segments are shifted
+        # lazily, so their tokens may still have the positions they had before the last edits.
+        self._ends: list[int] = []
+        self._lines: list[int] = []
+        self._incremental = True
+        self._parse_all(sql)
+
+    @property
+    def tokens(self) -> list[Token]:
+        """The script's tokens."""
+        return [token for i in range(len(self._segments)) for token in self._segment(i).tokens]
+
+    @property
+    def expressions(self) -> list[exp.Expr | None]:
+        """The script's syntax trees, one per statement, like the ones `sqlglot.parse` returns."""
+        if not self._segments:
+            return [None]
+
+        return [
+            expression
+            for i in range(len(self._segments))
+            for expression in self._segment(i).expressions
+        ]
+
+    def edit(self, start: int, end: int, text: str) -> Script:
+        """
+        Replaces `sql[start:end]` with `text` and updates the script's tokens and syntax trees.
+
+        Only the statements whose tokens are affected by the edit are tokenized and parsed again.
+        If parsing them fails, the script is left unchanged.
+
+        Args:
+            start: the offset of the first replaced character.
+            end: the offset after the last replaced character.
+            text: the replacement text.
+
+        Returns:
+            The updated script.
+        """
+        sql = self.sql[:start] + text + self.sql[end:]
+
+        if not self._incremental or not self._segments:
+            self._parse_all(sql)
+            return self
+
+        delta = len(text) - (end - start)
+        segments = self._segments
+        ends = self._ends
+        size = len(segments)
+
+        # The first segment to tokenize again is the one the edit starts in, or the one before it
+        # if the edit may change what follows the previous statement's semicolon, e.g. the comments
+        # that trail it, which also happens if it merges with the segment's first token
+        first = min(bisect.bisect_left(ends, start), size - 1)
+        if first > 0 and self._segment(first).tokens[0].end + 1 >= start:
+            first -= 1
+
+        # Tokenizing restarts at the preceding semicolon, whose surroundings are untouched
+        if first:
+            restart = segments[first - 1].tokens[-1]
+            position, line, col = ends[first - 1], self._lines[first - 1], restart.col - 1
+        else:
+            position, line, col = 0, 1, 0
+
+        rescanned = bool(first)
+
+        # The last segment to tokenize again is the first one whose semicolon follows the edit. If
+        # that semicolon is swallowed, e.g. because a string was opened, tokenizing goes on until
+        # a semicolon that ends one of the following segments is found, or the text is exhausted
+        last = bisect.bisect_left(ends, end)
+        tokens: list[Token] = []
+
+        while True:
+            cut = last < size and segments[last].tokens[-1].token_type == TokenType.SEMICOLON
+            stop = ends[last] + delta if cut else len(sql)
+            scanned = self._tokenizer.tokenize_range(sql, position, stop, line, col)
+
+            # The semicolon tokenizing restarted at is already known
+            tokens.extend(scanned[1:] if rescanned else scanned)
+
+            boundary = tokens[-1] if tokens else None
+            if not boundary or boundary.token_type != TokenType.SEMICOLON or boundary.start < stop:
+                cut = False
+                last = size - 1
+                break
+
+            last = bisect.bisect_left(ends, boundary.start - delta)
+            cut = (
+                last < size
+                and ends[last] + delta == boundary.start
+                and segments[last].tokens[-1].token_type == TokenType.SEMICOLON
+            )
+            if cut:
+                break
+
+            position, line, col = boundary.start, boundary.line, boundary.col - 1
+            rescanned = True
+
+        _, new_segments = self._parse_segments(tokens, sql)
+        if new_segments is None:
+            self._parse_all(sql)
+            return self
+
+        if cut:
+            old_last = segments[last].tokens[-1]
+            new_last = tokens[-1]
+            line_delta = new_last.line - self._lines[last]
+            col_delta = new_last.col - old_last.col
+        else:
+            line_delta = col_delta = 0
+
+        segments[first : last + 1] = new_segments
+        ends[first : last + 1] = [segment.tokens[-1].end for segment in new_segments]
+        self._lines[first : last + 1] = [segment.tokens[-1].line for segment in new_segments]
+
+        tail = first + len(new_segments)
+        if delta:
+            ends[tail:] = [segment_end + delta for segment_end in ends[tail:]]
+        if line_delta:
+            self._lines[tail:] = [segment_line + line_delta for segment_line in self._lines[tail:]]
+
+        if col_delta:
+            # The tokens that follow the edit on its last line also move horizontally
+            col_line = tokens[-1].line
+            for i in range(tail, len(segments)):
+                segment = self._segment(i)
+                if segment.tokens[0].line != col_line:
+                    break
+
+                _shift(segment, 0, 0, col_line, col_delta)
+
+        self.sql = sql
+        return self
+
+    def _segment(self, i: int) -> _Segment:
+        segment = self._segments[i]
+        last = segment.tokens[-1]
+        start = self._ends[i] - last.end
+        line = self._lines[i] - last.line
+
+        if start or line:
+            _shift(segment, start, line)
+
+        return segment
+
+    def _parse_all(self, sql: str) -> None:
+        tokens = self._tokenizer.tokenize(sql)
+        expressions, segments = self._parse_segments(tokens, sql)
+
+        if segments is None or (
+            segments and type(self._tokenizer).tokenize is not Tokenizer.tokenize
+        ):
+            # The statements can't be re-parsed one by one, so the whole script is kept as a single
+            # segment that's parsed again after every edit
+            segments = [_Segment(tokens, expressions, [])]
+            self._incremental = False
+        else:
+            self._incremental = True
+
+        self.sql = sql
+        self._segments = segments
+        self._ends = [segment.tokens[-1].end for segment in self._segments]
+        self._lines = [segment.tokens[-1].line for segment in self._segments]
+
+    def _parse_segments(
+        self, tokens: list[Token], sql: str
+    ) -> tuple[list[exp.Expr | None], list[_Segment] | None]:
+        """
+        Parses `tokens` and splits the resulting syntax trees by segment. The segments are None if
+        some statement can't be parsed in isolation.
+        """
+        token_segments = _segments(tokens)
+        if not token_segments:
+            return [], []
+
+        for token in tokens:
+            token.line += _LINE_BASE
+        try:
+            expressions = self._positioning_parser.parse(tokens, sql)
+        finally:
+            for token in tokens:
+                token.line -= _LINE_BASE
+
+        if self._positioning_parser.errors:
+            # The errors are raised or logged like `sqlglot.parse` does, and if they aren't raised
+            # the script is parsed as a whole from then on, since its nodes can't be told apart
+            return self._parser.parse(tokens, sql), None
+
+        positioned = [_positioned(expression) for expression in expressions]
+
+        counts = [_chunk_count(segment) for segment in token_segments]
+
+        # Procedural blocks span several segments, and so does a lone END, which terminates one
+        if (
+            len(expressions) != sum(counts)
+            or any(expression and expression.find(exp.Block) for expression in expressions)
+            or any(_is_end(segment) for segment in token_segments)
+        ):
+            return expressions, None
+
+        segments = []
+        index = 0
+        for segment, count in zip(token_segments, counts):
+            segment_positioned = [
+                node for nodes in positioned[index : index + count] for node in nodes
+            ]
+            segments.append(
+                _Segment(segment, expressions[index : index + count], segment_positioned)
+            )
+            index += count
+
+        return expressions, segments
+
+
+def parse_incremental(
+    sql: str,
+    read: DialectType = None,
+    dialect: DialectType = None,
+    **opts: Unpack[ParserNoDialectArgs],
+) -> Script:
+    """
+    Parses the given SQL script into a `Script`, whose syntax trees can be updated incrementally
+    after each edit of its text with `Script.edit`.
+
+    Args:
+        sql: the SQL code string to parse.
+        read: the SQL dialect to apply during parsing (eg. "spark", "hive", "presto", "mysql").
+        dialect: the SQL dialect (alias for read).
+        **opts: other `sqlglot.parser.Parser` options.
+
+    Returns:
+        The parsed script.
+    """
+    return Script(sql, read=read, dialect=dialect, **opts)
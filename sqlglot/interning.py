@@ -0,0 +1,130 @@
+"""
+An opt-in interning layer for the leaves of syntax trees, for applications that hold many parsed
+trees in memory at once.
+
+Most nodes of a typical tree are leaves such as identifiers, literals, variables and data types,
+and many of them are structurally identical across the trees of a warehouse, e.g. the identifiers
+of common column names. Every node must keep its own `parent`, `arg_key` and `index`, so nodes
+can't be shared between trees, but the `args` of frozen leaves, i.e. leaves whose args only hold
+strings, numbers, booleans, enum members or None, can: interning a tree replaces the args of each
+such leaf with an equal, shared dict taken from a pool.
+
+Interning is available through the parser's `intern` option, and thus through `sqlglot.parse` and
+`sqlglot.parse_one`, and through the `intern` argument of `sqlglot.serde.load`:
+
+    >>> import sqlglot
+    >>> a = sqlglot.parse_one("SELECT col FROM t", intern=True)
+    >>> b = sqlglot.parse_one("SELECT col FROM u", intern=True)
+    >>> a.selects[0].this.args is b.selects[0].this.args
+    True
+
+Shared args are copied on write: the first `set` or `append` on an interned node gives it its own
+args again, so trees can be transformed as usual. The pool only holds its args weakly, so they're
+released along with the last node that uses them.
+"""
+
+from __future__ import annotations
+
+import typing as t
+import weakref
+from enum import Enum
+
+if t.TYPE_CHECKING:
+    from sqlglot.expressions import Expr
+
+
+class InternedArgs(dict):
+    """The args of interned nodes. They are shared between nodes and thus must not be mutated."""
+
+    __slots__ = ("__weakref__",)
+
+
+_ATOMIC_TYPES: frozenset[type] = frozenset((str, bool, int, float))
+
+
+class InternPool:
+    """
+    A pool of the args of frozen leaf nodes, see the module's documentation.
+
+    Attributes:
+        hits: the number of nodes whose args were found in the pool.
+        misses: the number of nodes whose args were added to the pool.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._pool: weakref.WeakValueDictionary[t.Hashable, InternedArgs] = (
+            weakref.WeakValueDictionary()
+        )
+
+    def __len__(self) -> int:
+        return len(self._pool)
+
+    def clear(self) -> None:
+        """Empties the pool and resets its statistics. Interned nodes keep their args."""
+        self._pool.clear()
+        self.hits = self.misses = 0
+
+    def intern(self, expression: Expr) -> Expr:
+        """
+        Interns the frozen leaves of a tree, including those of the types it's annotated with,
+        in place. The subtrees of `sqlglot.expressions.Lazy` placeholders are left unparsed.
+
+        Args:
+            expression: the tree to intern.
+
+        Returns:
+            The same tree.
+        """
+        from sqlglot.expressions import Expr, Lazy
+
+        pool = self._pool
+        stack: list[Expr] = [expression]
+
+        while stack:
+            node = stack.pop()
+            if type(node) is Lazy:
+                continue
+
+            dtype = node._type
+            if isinstance(dtype, Expr) and dtype is not node:
+                stack.append(dtype)
+
+            args = node.args
+            if type(args) is InternedArgs or not args:
+                continue
+
+            leaf = True
+            for v in args.values():
+                if isinstance(v, Expr):
+                    stack.append(v)
+                    leaf = False
+                elif type(v) is list:
+                    for x in v:
+                        if isinstance(x, Expr):
+                            stack.append(x)
+                    leaf = False
+                elif v is not None and not (type(v) in _ATOMIC_TYPES or isinstance(v, Enum)):
+                    leaf = False
+
+            if not leaf:
+                continue
+
+            # Values are keyed along with their types, since e.g. True == 1
+            key = (type(node), *((k, type(v), v) for k, v in args.items()))
+            interned = pool.get(key)
+
+            if interned is None:
+                interned = pool[key] = InternedArgs(args)
+                self.misses += 1
+            else:
+                self.hits += 1
+
+            node.args = interned
+
+        return expression
+
+
+POOL = InternPool()
+"""The pool used by the parser's `intern` option and by `sqlglot.serde.load`."""
@@ -124,10 +124,11 @@ def lineage(
     expression = maybe_parse(sql, copy=copy, dialect=dialect)
 
     if sources:
+        # The sources don't need to be copied here, since `expand` copies them for each reference
         expression = exp.expand(
             expression,
             {
-                k: t.cast(exp.Query, maybe_parse(v, copy=copy, dialect=dialect))
+                k: t.cast(exp.Query, maybe_parse(v, copy=False, dialect=dialect))
                 for k, v in sources.items()
             },
             dialect=dialect,
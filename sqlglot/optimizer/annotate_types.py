@@ -50,6 +50,7 @@ def annotate_types(
     coerces_to: dict[exp.DType, set[exp.DType]] | None = None,
     dialect: DialectType = None,
     overwrite_types: bool = True,
+    shared_types: bool = False,
 ) -> E:
     """
     Infers the types of an expression, annotating its AST accordingly.
@@ -69,6 +70,10 @@ def annotate_types(
         coerces_to: Maps expression type to set of types that it can be coerced into.
         dialect: The dialect to consult when constructing a Schema object, if needed.
         overwrite_types: Re-annotate the existing AST types.
+        shared_types: Annotate the nodes whose types have no parameters, e.g. INT, with the
+            shared instances of `exp.DataType.shared` instead of their own copies. This saves
+            most of the memory the annotations take and the time it takes to copy them, but the
+            types must then not be mutated in place.
 
     Returns:
         The expression annotated with types.
@@ -81,6 +86,7 @@ def annotate_types(
         expression_metadata=expression_metadata,
         coerces_to=coerces_to,
         overwrite_types=overwrite_types,
+        shared_types=shared_types,
     ).annotate(expression)
 
 
@@ -200,6 +206,7 @@ class TypeAnnotator:
         coerces_to: dict[exp.DType, set[exp.DType]] | None = None,
         binary_coercions: BinaryCoercions | None = None,
         overwrite_types: bool = True,
+        shared_types: bool = False,
     ) -> None:
         self.schema = schema
         dialect = schema.dialect or Dialect()
@@ -225,6 +232,9 @@ class TypeAnnotator:
         # When set to False, this enables partial annotation by skipping already-annotated nodes
         self._overwrite_types = overwrite_types
 
+        # When set to True, types without parameters are annotated with shared instances
+        self._shared_types = shared_types
+
         # Maps (Scope, source_name) to its column projections and types
         self._scope_source_selects: dict[
             tuple[Scope, str], dict[str, exp.DataType | exp.DType]
@@ -241,6 +251,9 @@ class TypeAnnotator:
     def _set_type(
         self, expression: exp.Expr, target_type: exp.DataType | exp.DType | None
     ) -> exp.Expr:
+        if exp.MUTATION_GUARD.roots:
+            exp.MUTATION_GUARD.check(expression)
+
         prev_type = expression.type
         expression_id = id(expression)
 
@@ -248,7 +261,12 @@ class TypeAnnotator:
         # setter to enforce the getter's return type (Optional[DataType]), rejecting DType.
         # Bypass by converting and assigning to _type directly.
         dtype = target_type or exp.DType.UNKNOWN
-        expression._type = dtype if isinstance(dtype, exp.DataType) else dtype.into_expr()
+        if isinstance(dtype, exp.DataType):
+            expression._type = dtype
+        elif self._shared_types:
+            expression._type = exp.DataType.shared(dtype)
+        else:
+            expression._type = dtype.into_expr()
         self._visited.add(expression_id)
 
         if (
@@ -843,7 +861,11 @@ class TypeAnnotator:
         if array:
             self._set_type(
                 expression,
-                exp.DataType(this=exp.DType.ARRAY, expressions=[expression.type], nested=True),
+                exp.DataType(
+                    this=exp.DType.ARRAY,
+                    expressions=[t.cast(exp.DataType, expression.type).copy()],
+                    nested=True,
+                ),
             )
 
         return expression
@@ -960,6 +982,9 @@ class TypeAnnotator:
         if kind and kind.is_type(exp.DType.UNKNOWN):
             return None
 
+        # The struct's type is a tree of its own, so it can't adopt the value's type
+        kind = kind.copy() if kind else None
+
         if this:
             return exp.ColumnDef(this=this, kind=kind)
 
@@ -997,7 +1022,7 @@ class TypeAnnotator:
             value_type = seq_get(values.type.expressions, 0) or exp.DType.UNKNOWN
 
             if key_type != exp.DType.UNKNOWN and value_type != exp.DType.UNKNOWN:
-                map_type.set("expressions", [key_type, value_type])
+                map_type.set("expressions", [key_type.copy(), value_type.copy()])
                 map_type.set("nested", True)
 
         self._set_type(expression, map_type)
@@ -1010,7 +1035,7 @@ class TypeAnnotator:
             for coldef in arg.type.expressions:
                 kind = coldef.kind
                 if kind != exp.DType.UNKNOWN:
-                    map_type.set("expressions", [exp.DType.VARCHAR.into_expr(), kind])
+                    map_type.set("expressions", [exp.DType.VARCHAR.into_expr(), kind.copy()])
                     map_type.set("nested", True)
                     break
 
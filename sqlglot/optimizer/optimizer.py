@@ -102,7 +102,7 @@ def optimize(
         **kwargs,
     }
 
-    optimized = exp.maybe_parse(expression, dialect=dialect, copy=True)
+    optimized = exp.parse_lazy(exp.maybe_parse(expression, dialect=dialect, copy=True))
     for rule in rules:
         # Find any additional rule parameters, beyond `expression`
         rule_params = inspect.getfullargspec(rule).args
@@ -10,7 +10,13 @@ from sqlglot.errors import OptimizeError, highlight_sql
 from sqlglot.helper import seq_get
 from sqlglot.optimizer.annotate_types import TypeAnnotator
 from sqlglot.optimizer.resolver import Resolver
-from sqlglot.optimizer.scope import Scope, build_scope, traverse_scope, walk_in_scope
+from sqlglot.optimizer.scope import (
+    Scope,
+    build_scope,
+    collect_in_scope,
+    traverse_scope,
+    walk_in_scope,
+)
 from sqlglot.optimizer.simplify import simplify_parens
 from sqlglot.schema import Schema, ensure_schema
 
@@ -204,7 +210,7 @@ def _expand_using(scope: Scope, resolver: Resolver) -> dict[str, t.Any]:
             if column_name not in columns:
                 columns[column_name] = source_name
 
-    joins = list(scope.find_all(exp.Join))
+    joins = collect_in_scope(scope.expression, exp.Join)
     if not joins:
         return {}
 
@@ -982,9 +988,8 @@ def quote_identifiers(expression: E, dialect: DialectType = None, identify: bool
 
     # `quote_identifier` only mutates identifiers in place, so we avoid `transform` here
     # because its node replacement machinery is wasteful for this case.
-    for node in expression.walk():
-        if isinstance(node, exp.Identifier):
-            dialect.quote_identifier(node, identify=identify)
+    for node in expression.collect(exp.Identifier):
+        dialect.quote_identifier(node, identify=identify)
 
     return expression
 
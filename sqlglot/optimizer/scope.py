@@ -183,10 +183,10 @@ class Scope:
         self._semi_anti_join_tables = set()
         self._column_index = set()
 
-        for node in self.walk():
-            # Most nodes (identifiers, literals, operators etc.) aren't collectible, so a
-            # single isinstance gate lets them skip the classification chain below.
-            if node is self.expression or not isinstance(node, COLLECTIBLE_TYPES):
+        # Most nodes (identifiers, literals, operators etc.) aren't collectible, so they're
+        # filtered out while collecting, before the classification chain below.
+        for node in collect_in_scope(self.expression, *COLLECTIBLE_TYPES):
+            if node is self.expression:
                 continue
 
             if isinstance(node, exp.Dot) and node.is_star:
@@ -654,6 +654,9 @@ def traverse_scope(expression: exp.Expr) -> list[Scope]:
     Returns:
         A list of the created scope instances
     """
+    # Scopes are built by inspecting subtrees directly, so deferred ones have to be parsed first
+    expression = exp.parse_lazy(expression)
+
     if isinstance(expression, TRAVERSABLES):
         return list(_traverse_scope(Scope(expression)))
     return []
@@ -998,6 +1001,60 @@ def walk_in_scope(
                 stack.append(vs)
 
 
+def collect_in_scope(expression: exp.Expr, *expression_types: Type[E]) -> list[E]:
+    """
+    Returns all nodes in this scope which match at least one of the specified types, or all of its
+    nodes if no types are given, in the order in which `walk_in_scope` would visit them.
+
+    Unlike `find_all_in_scope`, this builds the list in a single pass without going through
+    generators, which is faster when all of the matches are needed anyway.
+
+    This does NOT traverse into subscopes.
+
+    Args:
+        expression: the expression to search.
+        expression_types: the expression type(s) to match.
+
+    Returns:
+        The list of matching nodes.
+    """
+    nodes: list[exp.Expr] = []
+    stack: list[exp.Expr] = [expression]
+
+    while stack:
+        node = stack.pop()
+
+        if not expression_types or isinstance(node, expression_types):
+            nodes.append(node)
+
+        # See walk_in_scope
+        if (
+            node is not expression
+            and isinstance(node, (exp.CTE, exp.Query))
+            and (
+                isinstance(node, exp.CTE)
+                or (isinstance(node.parent, (exp.From, exp.Join)) and _is_derived_table(node))
+                or isinstance(node.parent, exp.UDTF)
+                or isinstance(node, exp.UNWRAPPED_QUERIES)
+            )
+        ):
+            if isinstance(node, (exp.Subquery, exp.UDTF)):
+                for key in ("joins", "laterals", "pivots"):
+                    for arg in node.args.get(key) or []:
+                        nodes.extend(collect_in_scope(arg, *expression_types))
+            continue
+
+        for vs in reversed(node.args.values()):
+            if isinstance(vs, list):
+                for v in reversed(vs):
+                    if isinstance(v, exp.Expr):
+                        stack.append(v)
+            elif isinstance(vs, exp.Expr):
+                stack.append(vs)
+
+    return t.cast("list[E]", nodes)
+
+
 def find_all_in_scope(
     expression: exp.Expr,
     *expression_types: Type[E],
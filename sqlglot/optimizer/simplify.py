@@ -616,58 +616,18 @@ class Simplifier:
         constant_propagation: bool = False,
         coalesce_simplification: bool = False,
     ) -> exp.Expr:
-        wheres: list[exp.Where] = []
-        joins: list[exp.Join] = []
+        # The visitor resets the pointers of every node it visits, even when it doesn't rewrite it
+        if exp.MUTATION_GUARD.roots:
+            exp.MUTATION_GUARD.check(expression)
 
-        for node in expression.walk(
-            prune=lambda n: bool(isinstance(n, exp.Condition) or n.meta_get(FINAL))
-        ):
-            if node.meta_get(FINAL):
-                continue
-
-            # group by expressions cannot be simplified, for example
-            # select x + 1 + 1 FROM y GROUP BY x + 1 + 1
-            # the projection must exactly match the group by key
-            group = node.args.get("group")
-
-            if group and hasattr(node, "selects"):
-                groups = set(group.expressions)
-                group.meta[FINAL] = True
-
-                for s in node.selects:
-                    for n in s.walk():
-                        if n in groups:
-                            s.meta[FINAL] = True
-                            break
-
-                having = node.args.get("having")
-
-                if having:
-                    for n in having.walk():
-                        if n in groups:
-                            having.meta[FINAL] = True
-                            break
-
-            if isinstance(node, exp.Condition):
-                simplified = while_changing(
-                    node, lambda e: self._simplify(e, constant_propagation, coalesce_simplification)
-                )
-
-                if node is expression:
-                    expression = simplified
-            elif isinstance(node, exp.Where):
-                wheres.append(node)
-            elif isinstance(node, exp.Join):
-                # snowflake match_conditions have very strict ordering rules
-                if match := node.args.get("match_condition"):
-                    match.meta[FINAL] = True
-
-                joins.append(node)
+        visitor = _SimplifyVisitor(self, expression, constant_propagation, coalesce_simplification)
+        visitor.visit(expression)
+        expression = visitor.expression
 
-        for where in wheres:
+        for where in visitor.wheres:
             if always_true(where.this):
                 where.pop()
-        for join in joins:
+        for join in visitor.joins:
             if (
                 always_true(join.args.get("on"))
                 and not join.args.get("using")
@@ -730,6 +690,9 @@ class Simplifier:
             # entire subtrees after every (mostly no-op) pass.
             for k, v in tuple(original.args.items()):
                 if v is None:
+                    if type(original.args) is not dict:
+                        # Interned args are shared with other nodes, see sqlglot.interning
+                        original.args = dict(original.args)
                     original.args.pop(k)
                 else:
                     original._set_parent(k, v)
@@ -1543,6 +1506,89 @@ class Simplifier:
         return expression
 
 
+class _SimplifyVisitor(exp.Visitor):
+    """
+    The walk of `Simplifier.simplify`: simplifies the outermost conditions of a tree in place and
+    collects its WHERE and JOIN clauses. Conditions are simplified as a whole, so they're pruned,
+    and so are nodes marked as final.
+    """
+
+    def __init__(
+        self,
+        simplifier: Simplifier,
+        expression: exp.Expr,
+        constant_propagation: bool,
+        coalesce_simplification: bool,
+    ) -> None:
+        self.simplifier = simplifier
+        self.expression = expression
+        self.constant_propagation = constant_propagation
+        self.coalesce_simplification = coalesce_simplification
+        self.wheres: list[exp.Where] = []
+        self.joins: list[exp.Join] = []
+
+    def _simplify(self, node: exp.Expr) -> exp.Expr:
+        return self.simplifier._simplify(
+            node, self.constant_propagation, self.coalesce_simplification
+        )
+
+    def generic_visit(self, node: exp.Expr) -> bool | None:
+        if node.meta_get(FINAL):
+            return True
+
+        # group by expressions cannot be simplified, for example
+        # select x + 1 + 1 FROM y GROUP BY x + 1 + 1
+        # the projection must exactly match the group by key
+        group = node.args.get("group")
+
+        if group and hasattr(node, "selects"):
+            groups = set(group.expressions)
+            group.meta[FINAL] = True
+
+            for s in node.selects:
+                for n in s.walk():
+                    if n in groups:
+                        s.meta[FINAL] = True
+                        break
+
+            having = node.args.get("having")
+
+            if having:
+                for n in having.walk():
+                    if n in groups:
+                        having.meta[FINAL] = True
+                        break
+
+        return False
+
+    def visit_condition(self, node: exp.Expr) -> bool | None:
+        if not node.meta_get(FINAL):
+            simplified = while_changing(node, self._simplify)
+
+            if node is self.expression:
+                self.expression = simplified
+
+        return True
+
+    def visit_where(self, node: exp.Where) -> bool | None:
+        if node.meta_get(FINAL):
+            return True
+
+        self.wheres.append(node)
+        return False
+
+    def visit_join(self, node: exp.Join) -> bool | None:
+        if node.meta_get(FINAL):
+            return True
+
+        # snowflake match_conditions have very strict ordering rules
+        if match := node.args.get("match_condition"):
+            match.meta[FINAL] = True
+
+        self.joins.append(node)
+        return False
+
+
 def gen(expression: exp.Expr, comments: bool = False) -> str:
     """Simple pseudo sql generator for quickly generating sortable and uniq strings.
 
@@ -0,0 +1,376 @@
+"""
+Multi-process counterparts of the top-level `sqlglot` APIs, for scripts large enough that the cost
+of shipping syntax trees between processes is dwarfed by the cost of parsing them.
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+import pickle
+import typing as t
+
+from sqlglot.dialects.dialect import Dialect
+from sqlglot.errors import ErrorLevel, ParseError, SqlglotError
+from sqlglot.tokens import Token, TokenType
+
+if t.TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from typing_extensions import Unpack
+
+    from sqlglot._typing import GeneratorNoDialectArgs, ParserNoDialectArgs
+    from sqlglot.dialects.dialect import DialectType
+    from sqlglot.expressions import Expr
+    from sqlglot.parser import Parser
+    from sqlglot.tokens import Tokenizer
+
+    # (start offset, end offset, line offset, col offset, whether a semicolon precedes the chunk,
+    # line and col of the semicolon that follows it, if any)
+    Chunk = tuple[int, int, int, int, bool, tuple[int, int] | None]
+
+    # (transpiled statements, error), as sent back by the workers of `transpile_many`
+    Transpiled = tuple[list[str], Exception | None]
+
+
+# Per-process state of pool workers, set up once by the pool's initializer
+_PARSER: Parser | None = None
+_SQL: str = ""
+_TRANSPILER: _Transpiler | None = None
+
+
+def _init_parser(read: DialectType, opts: ParserNoDialectArgs, sql: str) -> None:
+    global _PARSER, _SQL
+    _PARSER = Dialect.get_or_raise(read).parser(**opts)
+    _SQL = sql
+
+
+# Statements that may continue past their first semicolon, e.g. `IF ... ELSE ...` in T-SQL or
+# `LOOP ...; END LOOP` in procedural dialects
+BLOCK_STATEMENTS = {"IF", "WHILE", "LOOP", "REPEAT", "FOR", "CASE", "ELSE", "END"}
+
+# Keywords that make a BEGIN start a transaction rather than a block
+TRANSACTION_KEYWORDS = {"TRANSACTION", "TRAN", "WORK", "DEFERRED", "IMMEDIATE", "EXCLUSIVE"}
+
+
+def _chunks(sql: str, dialect: Dialect, chunk_size: int) -> t.Iterator[Chunk]:
+    """
+    Splits `sql` into chunks of `chunk_size` statements. Every chunk but the first starts at the
+    semicolon that terminates the previous one, so that its tokens (and the comments attached to
+    them) are exactly the ones the whole script would have produced.
+
+    Block statements (e.g. `IF`, `WHILE` or `BEGIN ... END`) can span several semicolons, so the
+    rest of the script is left in a single chunk as soon as one of them is found.
+    """
+    start = line = col = 0
+    statements = 0
+    statement_start = True
+    begin = False
+
+    for token in dialect.tokenizer().iter_tokens(sql):
+        token_type = token.token_type
+
+        if begin:
+            begin = False
+            if token_type != TokenType.SEMICOLON and token.text.upper() not in TRANSACTION_KEYWORDS:
+                break
+
+        if token_type == TokenType.SEMICOLON:
+            statements += 1
+            statement_start = True
+
+            if statements % chunk_size == 0:
+                yield start, token.start, line, col, start > 0, (token.line, token.col)
+                start, line, col = token.start, token.line - 1, token.col - 1
+
+            continue
+
+        if statement_start and token.text.upper() in BLOCK_STATEMENTS:
+            break
+
+        statement_start = False
+        begin = token_type == TokenType.BEGIN
+
+    yield start, len(sql), line, col, start > 0, None
+
+
+def _parse_chunk(chunk: Chunk) -> list[Expr | None]:
+    assert _PARSER is not None
+
+    start, end, line, col, after_semicolon, semicolon = chunk
+    tokens = _PARSER.dialect.tokenize(_SQL[start:end])
+
+    if start:
+        # The tokens are positioned in the whole script, which is what the parser is given too, so
+        # that the positions of the nodes and the context of the errors are those of a serial parse
+        for token in tokens:
+            if token.line == 1:
+                token.col += col
+            token.line += line
+            token.start += start
+            token.end += start
+
+    if semicolon:
+        # The semicolon that follows the chunk terminates its last statement, even if it's empty.
+        # Its comments are attached by the next chunk, which starts with it.
+        tokens.append(Token(TokenType.SEMICOLON, ";", *semicolon, end, end))
+
+    expressions = _PARSER.parse(tokens, _SQL)
+
+    if after_semicolon:
+        # The leading semicolon terminates an empty statement that belongs to the previous chunk
+        expressions = expressions[1:]
+
+    return expressions
+
+
+def parse_parallel(
+    sql: str,
+    read: DialectType = None,
+    dialect: DialectType = None,
+    workers: int | None = None,
+    chunk_size: int = 128,
+    **opts: Unpack[ParserNoDialectArgs],
+) -> list[Expr | None]:
+    """
+    Parses the given SQL script using a pool of processes, one syntax tree per parsed statement.
+
+    The script is split at statement boundaries into chunks of `chunk_size` statements, which are
+    parsed by worker processes that keep a warm parser for the dialect. The syntax trees are
+    returned in their original order, with the same `meta` positions that `sqlglot.parse` produces.
+
+    Procedural blocks whose body spans several statements (e.g. `IF ... BEGIN ...; ... END`) can't
+    be split across chunks, so everything from the first block statement on is parsed by a single
+    worker. If parsing any chunk fails, the whole script is parsed again serially, so that genuine
+    errors are handled exactly like `sqlglot.parse` handles them.
+
+    Args:
+        sql: the SQL code string to parse.
+        read: the SQL dialect to apply during parsing (eg. "spark", "hive", "presto", "mysql").
+        dialect: the SQL dialect (alias for read).
+        workers: the number of worker processes. Defaults to the number of CPUs.
+        chunk_size: the number of statements each worker parses at a time.
+        **opts: other `sqlglot.parser.Parser` options.
+
+    Returns:
+        The resulting syntax tree collection.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    read_dialect = Dialect.get_or_raise(read or dialect)
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunks(sql, read_dialect, chunk_size)
+    head = list(itertools.islice(chunks, 2))
+
+    if workers < 2 or len(head) < 2:
+        return read_dialect.parse(sql, **opts)
+
+    expressions: list[Expr | None] = []
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_parser, initargs=(read_dialect, opts, sql)
+        ) as executor:
+            for chunk_expressions in executor.map(_parse_chunk, itertools.chain(head, chunks)):
+                expressions.extend(chunk_expressions)
+    except ParseError:
+        return read_dialect.parse(sql, **opts)
+
+    return expressions
+
+
+class TranspileResult(t.NamedTuple):
+    position: int
+    """The position of the SQL string in the input of `transpile_many`, starting from 0."""
+    sql: str
+    """The SQL string that was transpiled."""
+    sqls: list[str]
+    """The transpiled statements, as `sqlglot.transpile` returns them, or [] if it failed."""
+    error: Exception | None
+    """The error that was raised while transpiling the SQL string, if any."""
+
+
+class _Transpiler:
+    """A tokenizer, parser and target dialect that are reused for every SQL string."""
+
+    def __init__(
+        self,
+        read: DialectType,
+        write: DialectType,
+        error_level: ErrorLevel | None,
+        opts: GeneratorNoDialectArgs,
+    ) -> None:
+        read_dialect = Dialect.get_or_raise(read)
+        self.tokenizer: Tokenizer = read_dialect.tokenizer()
+        self.parser: Parser = read_dialect.parser(error_level=error_level)
+        self.write = Dialect.get_or_raise(write)
+        self.opts = opts
+
+    def transpile(self, sql: str) -> Transpiled:
+        try:
+            expressions = self.parser.parse(self.tokenizer.tokenize(sql), sql)
+
+            # Generators hold per-statement state, e.g. the sequence of the names they make up, and
+            # are cheap to create, so each statement gets a fresh one like in `sqlglot.transpile`
+            return [
+                self.write.generator(**self.opts).generate(expression, copy=False)
+                if expression
+                else ""
+                for expression in expressions
+            ], None
+        except Exception as e:
+            return [], e
+
+
+def _init_transpiler(
+    read: DialectType,
+    write: DialectType,
+    error_level: ErrorLevel | None,
+    opts: GeneratorNoDialectArgs,
+) -> None:
+    global _TRANSPILER
+    _TRANSPILER = _Transpiler(read, write, error_level, opts)
+
+
+def _transpile_chunk(sqls: list[str]) -> list[Transpiled]:
+    assert _TRANSPILER is not None
+    results = [_TRANSPILER.transpile(sql) for sql in sqls]
+
+    for i, (_, error) in enumerate(results):
+        if error is not None:
+            try:
+                pickle.dumps(error)
+            except Exception:
+                # The error has to be sent back to the main process, so that the batch goes on
+                results[i] = ([], SqlglotError(f"{error.__class__.__name__}: {error}"))
+
+    return results
+
+
+def transpile_many(
+    sqls: t.Iterable[str],
+    read: DialectType = None,
+    write: DialectType = None,
+    identity: bool = True,
+    error_level: ErrorLevel | None = None,
+    workers: int | None = None,
+    ordered: bool = True,
+    on_error: str = "return",
+    chunk_size: int = 32,
+    max_in_flight: int | None = None,
+    **opts: Unpack[GeneratorNoDialectArgs],
+) -> t.Iterator[TranspileResult]:
+    """
+    Transpiles many SQL strings, each like `sqlglot.transpile` would, using a pool of processes.
+
+    The SQL strings are consumed lazily and sent to the worker processes in chunks of `chunk_size`,
+    at most `max_in_flight` chunks at a time, so that arbitrarily long inputs can be streamed
+    through. Each worker keeps a warm tokenizer and parser for the source dialect.
+
+    Example:
+        >>> from sqlglot import transpile_many
+        >>> sqls = ["SELECT IFF(a, 1, 2)", "SELECT ("]
+        >>> for result in transpile_many(sqls, read="snowflake", write="duckdb", workers=1):
+        ...     print(result.position, result.sqls, type(result.error).__name__)
+        0 ['SELECT CASE WHEN a THEN 1 ELSE 2 END'] NoneType
+        1 [] ParseError
+
+    Args:
+        sqls: the SQL code strings to transpile.
+        read: the source dialect used to parse the input strings.
+        write: the target dialect into which the input should be transformed.
+        identity: if set to `True` and if the target dialect is not specified the source dialect
+            will be used as both: the source and the target dialect.
+        error_level: the desired error level of the parser.
+        workers: the number of worker processes. Defaults to the number of CPUs. With fewer than 2
+            workers, or fewer than 2 chunks of input, the SQL strings are transpiled in-process.
+        ordered: whether to yield the results in the order of `sqls`, or as soon as they're ready.
+        on_error: what to do with a SQL string that fails to be transpiled: "return" yields its
+            result with the error set, "skip" drops it and "raise" raises the error, after which
+            no more results are yielded.
+        chunk_size: the number of SQL strings each worker transpiles at a time.
+        max_in_flight: the maximum number of chunks that are queued or being transpiled at any
+            time. Defaults to twice the number of workers.
+        **opts: other `sqlglot.generator.Generator` options.
+
+    Returns:
+        An iterator over the results, one per SQL string unless they're skipped.
+    """
+    if on_error not in ("return", "skip", "raise"):
+        raise ValueError(f"Invalid on_error value: {on_error!r}")
+
+    write = (read if write is None else write) if identity else write
+    workers = workers or os.cpu_count() or 1
+    iterator = iter(sqls)
+    chunks = iter(lambda: list(itertools.islice(iterator, chunk_size)), [])
+    head = list(itertools.islice(chunks, 2))
+
+    if workers < 2 or len(head) < 2:
+        transpiler = _Transpiler(read, write, error_level, opts)
+        results: t.Iterator[TranspileResult] = (
+            TranspileResult(index, sql, *transpiler.transpile(sql))
+            for index, sql in enumerate(
+                itertools.chain.from_iterable(itertools.chain(head, chunks))
+            )
+        )
+    else:
+        results = _transpile_pool(
+            itertools.chain(head, chunks),
+            workers,
+            ordered,
+            max_in_flight or 2 * workers,
+            (read, write, error_level, opts),
+        )
+
+    for result in results:
+        if result.error is not None:
+            if on_error == "raise":
+                raise result.error
+            if on_error == "skip":
+                continue
+        yield result
+
+
+def _transpile_pool(
+    chunks: t.Iterator[list[str]],
+    workers: int,
+    ordered: bool,
+    max_in_flight: int,
+    initargs: tuple[t.Any, ...],
+) -> t.Iterator[TranspileResult]:
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    executor = ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_transpiler, initargs=initargs
+    )
+
+    # The chunks are kept along with their futures, so that the SQL isn't sent back by the workers
+    in_flight: dict[Future[list[Transpiled]], tuple[int, list[str]]] = {}
+    start = 0
+
+    def results(
+        future: Future[list[Transpiled]],
+    ) -> t.Iterator[TranspileResult]:
+        offset, sqls = in_flight.pop(future)
+        for i, (sql, result) in enumerate(zip(sqls, future.result())):
+            yield TranspileResult(offset + i, sql, *result)
+
+    try:
+        while True:
+            for chunk in itertools.islice(chunks, max_in_flight - len(in_flight)):
+                in_flight[executor.submit(_transpile_chunk, chunk)] = (start, chunk)
+                start += len(chunk)
+
+            if not in_flight:
+                break
+
+            if ordered:
+                # Futures are kept in submission order, so the first one holds the next results
+                yield from results(next(iter(in_flight)))
+            else:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from results(future)
+    finally:
+        # The iterator may be closed early, e.g. when an error is raised or the caller breaks out
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -8,7 +8,7 @@ from builtins import type as Type
 from collections import defaultdict
 from collections.abc import Sequence
 
-from sqlglot import exp
+from sqlglot import exp, interning
 from sqlglot.errors import (
     ErrorLevel,
     ParseError,
@@ -20,7 +20,7 @@ from sqlglot.errors import (
 from sqlglot.expressions import apply_index_offset
 from sqlglot.helper import ensure_list, i64, seq_get
 from sqlglot.time import format_time
-from sqlglot.tokens import Token, Tokenizer, TokenType
+from sqlglot.tokens import Token, TokenBuffer, Tokenizer, TokenType
 from sqlglot.trie import TrieResult, in_trie, new_trie
 
 if t.TYPE_CHECKING:
@@ -29,6 +29,7 @@ if t.TYPE_CHECKING:
     from sqlglot._typing import BuilderArgs, E
     from sqlglot.dialects.dialect import Dialect, DialectType
     from sqlglot.expressions import ExpOrStr
+    from sqlglot.profiler import ParserProfile
 
     T = t.TypeVar("T")
     TCeilFloor = t.TypeVar("TCeilFloor", exp.Ceil, exp.Floor)
@@ -286,6 +287,67 @@ def _unpivot_target(expr: exp.Expr) -> exp.Expr:
 SENTINEL_NONE: Token = Token(TokenType.SENTINEL, "SENTINEL")
 
 
+class LazyRange:
+    """
+    The tokens spanned by an `exp.Lazy` placeholder, along with the settings of the parser that
+    deferred them and the method it would have parsed them with.
+
+    Ranges are immutable and shared by the copies of a placeholder. Two ranges are equal if they
+    span the same SQL text.
+    """
+
+    __slots__ = (
+        "parser_class",
+        "options",
+        "sql",
+        "tokens",
+        "start",
+        "end",
+        "prev_comments",
+        "method",
+        "kwargs",
+    )
+
+    def __init__(
+        self,
+        parser_class: Type[Parser],
+        options: dict[str, t.Any],
+        sql: str,
+        tokens: list[Token],
+        start: i64,
+        end: i64,
+        prev_comments: list[str],
+        method: str,
+        kwargs: dict[str, t.Any],
+    ) -> None:
+        self.parser_class = parser_class
+        self.options = options
+        self.sql = sql
+        self.tokens = tokens
+        self.start = start
+        self.end = end
+        self.prev_comments = prev_comments
+        self.method = method
+        self.kwargs = kwargs
+
+    @property
+    def text(self) -> str:
+        return self.sql[self.tokens[self.start].start : self.tokens[self.end - 1].end + 1]
+
+    def parse(self) -> exp.Expr:
+        """Parses the range into a new syntax tree."""
+        return self.parser_class(**self.options)._parse_lazy(self)
+
+    def __eq__(self, other: object) -> bool:
+        return type(other) is LazyRange and self.text == other.text
+
+    def __hash__(self) -> int:
+        return hash(self.text)
+
+    def __repr__(self) -> str:
+        return f"LazyRange({self.text!r})"
+
+
 class Parser:
     """
     Parser consumes a list of tokens produced by the Tokenizer and produces a parsed syntax tree.
@@ -301,6 +363,16 @@ class Parser:
             Default: 3
         max_nodes: Maximum number of AST nodes to prevent memory exhaustion.
             Set to -1 (default) to disable the check.
+        literal_lists: Whether to parse long lists of plain literals, such as large IN lists or
+            VALUES rows, into compact `exp.LiteralList` nodes instead of one `exp.Literal` each.
+            Default: False
+        lazy: Whether to defer parsing CTE bodies, parenthesized subqueries and function calls
+            that span many tokens. These are parsed into `exp.Lazy` placeholders instead, which
+            are parsed on first access, e.g. when the tree is walked or generated.
+            Default: False
+        intern: Whether to share the args of structurally identical leaves, such as identifiers
+            and literals, across the parsed trees, see `sqlglot.interning`.
+            Default: False
     """
 
     __slots__ = (
@@ -308,6 +380,9 @@ class Parser:
         "error_message_context",
         "max_errors",
         "max_nodes",
+        "literal_lists",
+        "lazy",
+        "intern",
         "dialect",
         "sql",
         "errors",
@@ -319,9 +394,15 @@ class Parser:
         "_prev_comments",
         "_pipe_cte_counter",
         "_chunks",
+        "_chunk_bounds",
         "_chunk_index",
+        "_buffer",
         "_tokens_size",
         "_node_count",
+        "_projection_index",
+        "_memo",
+        "_speculating",
+        "profile",
     )
 
     FUNCTIONS: t.ClassVar[dict[str, t.Callable]] = {
@@ -1529,9 +1610,12 @@ class Parser:
         TokenType.QUALIFY: lambda self: ("qualify", self._parse_qualify()),
         TokenType.WINDOW: lambda self: ("windows", self._parse_window_clause()),
         TokenType.ORDER_BY: lambda self: ("order", self._parse_order()),
-        TokenType.LIMIT: lambda self: ("limit", self._parse_limit()),
+        TokenType.LIMIT: lambda self: ("limit", self._parse_memoized("limit", self._parse_limit)),
         TokenType.FETCH: lambda self: ("limit", self._parse_limit()),
-        TokenType.OFFSET: lambda self: ("offset", self._parse_offset()),
+        TokenType.OFFSET: lambda self: (
+            "offset",
+            self._parse_memoized("offset", self._parse_offset),
+        ),
         TokenType.FOR: lambda self: ("locks", self._parse_locks()),
         TokenType.LOCK: lambda self: ("locks", self._parse_locks()),
         TokenType.TABLE_SAMPLE: lambda self: ("sample", self._parse_table_sample(as_modifier=True)),
@@ -1851,6 +1935,24 @@ class Parser:
     # to be considered valid syntactically. Such expressions evaluate to the strings' concatenation.
     ADJACENT_STRINGS_CANNOT_BE_CONNECTED: t.ClassVar = False
 
+    # The minimum number of literals in a list for it to be parsed into an exp.LiteralList,
+    # if the parser's `literal_lists` option is set
+    LITERAL_LIST_MIN_SIZE: t.ClassVar[int] = 8
+
+    # The minimum number of tokens a CTE body, a parenthesized subquery or the arguments of a
+    # function call must span for their parsing to be deferred, if the parser's `lazy` option is set
+    LAZY_MIN_TOKENS: t.ClassVar[int] = 32
+
+    # The tokens that can follow a projection whose parsing is deferred, i.e. the ones that end it
+    LAZY_PROJECTION_FOLLOWERS: t.ClassVar = {
+        TokenType.COMMA,
+        TokenType.R_PAREN,
+        TokenType.ALIAS,
+        TokenType.FROM,
+        TokenType.SEMICOLON,
+        TokenType.SENTINEL,
+    }
+
     SHOW_TRIE: t.ClassVar[dict] = new_trie(key.split(" ") for key in SHOW_PARSERS)
     SET_TRIE: t.ClassVar[dict] = new_trie(key.split(" ") for key in SET_PARSERS)
 
@@ -1861,11 +1963,17 @@ class Parser:
         max_errors: int = 3,
         max_nodes: int = -1,
         dialect: DialectType = None,
+        literal_lists: bool = False,
+        lazy: bool = False,
+        intern: bool = False,
     ):
         self.error_level: ErrorLevel = error_level or ErrorLevel.IMMEDIATE
         self.error_message_context: int = error_message_context
         self.max_errors: int = max_errors
         self.max_nodes: int = max_nodes
+        self.literal_lists: bool = literal_lists
+        self.lazy: bool = lazy
+        self.intern: bool = intern
         self.dialect: t.Any = _resolve_dialect(dialect)
         self.sql: str = ""
         self.errors: list[ParseError] = []
@@ -1878,8 +1986,15 @@ class Parser:
         self._prev_comments: list[str] = []
         self._pipe_cte_counter: int = 0
         self._chunks: list[list[Token]] = []
+        self._chunk_bounds: list[tuple[int, int]] = []
         self._chunk_index: i64 = 0
+        self._buffer: TokenBuffer | None = None
         self._node_count: int = 0
+        self._projection_index: i64 = -1
+        self._memo: dict[tuple[str, i64], tuple[t.Any, i64, list[str]]] = {}
+        self._speculating: int = 0
+        # Records the parser's backtracking, see `sqlglot.profiler`
+        self.profile: ParserProfile | None = None
 
     def reset(self) -> None:
         self.sql = ""
@@ -1893,8 +2008,13 @@ class Parser:
         self._prev_comments = []
         self._pipe_cte_counter = 0
         self._chunks = []
+        self._chunk_bounds = []
         self._chunk_index = 0
+        self._buffer = None
         self._node_count = 0
+        self._projection_index = -1
+        self._memo = {}
+        self._speculating = 0
 
     def _advance(self, times: i64 = 1) -> None:
         index = self._index + times
@@ -1914,13 +2034,23 @@ class Parser:
 
     def _advance_chunk(self) -> None:
         self._index = -1
-        self._tokens = self._chunks[self._chunk_index]
+        buffer = self._buffer
+        if buffer is None:
+            self._tokens = self._chunks[self._chunk_index]
+        else:
+            # Only the tokens of the statement being parsed are materialized
+            start, end = self._chunk_bounds[self._chunk_index]
+            self._tokens = buffer.tokens(start, end)
         self._tokens_size = i64(len(self._tokens))
         self._chunk_index += 1
+        if self._memo:
+            self._memo = {}
         self._advance()
 
     def _retreat(self, index: i64) -> None:
         if index != self._index:
+            if self.profile is not None and index < self._index:
+                self.profile.retreat(self._index - index)
             self._advance(index - self._index)
 
     def _add_comments(self, expression: exp.Expr | None) -> None:
@@ -2035,13 +2165,64 @@ class Parser:
 
         return this
 
-    def parse(self, raw_tokens: list[Token], sql: str) -> list[exp.Expr | None]:
+    def _speculate(self, rule: str, parse_method: t.Callable[[], exp.Expr | None]) -> bool:
+        """
+        Checks whether `parse_method` can parse the tokens that follow, without consuming them.
+
+        The outcome is memoized by `(rule, token index)`, so checking again at the same position is
+        free and parsing for real with `_parse_memoized` reuses the speculatively parsed tree,
+        instead of scanning the same tokens once per attempt.
+        """
+        key = (rule, self._index)
+        entry = self._memo.get(key)
+
+        if entry is None:
+            index = self._index
+            self._speculating += 1
+            try:
+                this = self._try_parse(parse_method)
+            finally:
+                self._speculating -= 1
+
+            # A failed attempt is recorded with a negative end index, so that it's not replayed by
+            # `_parse_memoized`: the tokens are parsed again, in order to report errors as usual
+            entry = (this, self._index if this else -1, self._prev_comments)
+            self._memo[key] = entry
+            self._retreat(index)
+
+        return entry[0] is not None
+
+    def _parse_memoized(self, rule: str, parse_method: t.Callable[[], T]) -> T:
+        """
+        Packrat-style memoization of `parse_method`, keyed by `(rule, token index)`.
+
+        A result that was parsed while speculating, including a failure to parse anything, is
+        reused at most once when the parser backtracks and parses the same tokens with the same rule
+        again. Results are only recorded while speculating, so this is a plain call otherwise.
+        """
+        key = (rule, self._index)
+        entry = self._memo.pop(key, None)
+
+        if entry is not None and entry[1] >= 0:
+            this, index, comments = entry
+            self._retreat(index)
+            self._prev_comments = comments
+            return this
+
+        this = parse_method()
+        if self._speculating:
+            self._memo[key] = (this, self._index, self._prev_comments)
+
+        return this
+
+    def parse(self, raw_tokens: list[Token] | TokenBuffer, sql: str) -> list[exp.Expr | None]:
         """
         Parses a list of tokens and returns a list of syntax trees, one tree
         per parsed SQL statement.
 
         Args:
-            raw_tokens: The list of tokens.
+            raw_tokens: The list of tokens, or a `TokenBuffer`. The `Token` objects of a buffer
+                are created one statement at a time, as each statement is parsed.
             sql: The original SQL string.
 
         Returns:
@@ -2054,7 +2235,7 @@ class Parser:
     def parse_into(
         self,
         expression_types: exp.IntoType,
-        raw_tokens: list[Token],
+        raw_tokens: list[Token] | TokenBuffer,
         sql: str | None = None,
     ) -> list[exp.Expr | None]:
         """
@@ -2064,7 +2245,7 @@ class Parser:
 
         Args:
             expression_types: The expression type(s) to try and parse the token list into.
-            raw_tokens: The list of tokens.
+            raw_tokens: The list of tokens, or a `TokenBuffer`.
             sql: The original SQL string, used to produce helpful debug messages.
 
         Returns:
@@ -2123,7 +2304,7 @@ class Parser:
             self._match(TokenType.BEGIN)
             expressions.append(parse_method(self))
 
-        chunks_length = len(self._chunks)
+        chunks_length = len(self._chunks) if self._buffer is None else len(self._chunk_bounds)
         while self._chunk_index < chunks_length:
             self._advance_chunk()
 
@@ -2146,28 +2327,63 @@ class Parser:
     def _parse(
         self,
         parse_method: t.Callable[[Parser], exp.Expr | None],
-        raw_tokens: list[Token],
+        raw_tokens: list[Token] | TokenBuffer,
         sql: str | None = None,
     ) -> list[exp.Expr | None]:
         self.reset()
         self.sql = sql or ""
 
-        total = len(raw_tokens)
-        chunks: list[list[Token]] = [[]]
+        if isinstance(raw_tokens, TokenBuffer):
+            self._buffer = raw_tokens
+            self._chunk_bounds = self._buffer_chunk_bounds(raw_tokens)
+        else:
+            total = len(raw_tokens)
+            chunks: list[list[Token]] = [[]]
 
-        for i, token in enumerate(raw_tokens):
-            if token.token_type == TokenType.SEMICOLON:
-                if token.comments:
-                    chunks.append([token])
+            for i, token in enumerate(raw_tokens):
+                if token.token_type == TokenType.SEMICOLON:
+                    if token.comments:
+                        chunks.append([token])
 
-                if i < total - 1:
-                    chunks.append([])
-            else:
-                chunks[-1].append(token)
+                    if i < total - 1:
+                        chunks.append([])
+                else:
+                    chunks[-1].append(token)
+
+            self._chunks = chunks
+
+        expressions = self._parse_batch_statements(
+            parse_method=parse_method, sep_first_statement=False
+        )
+
+        if self.intern:
+            for expression in expressions:
+                if expression:
+                    interning.POOL.intern(expression)
 
-        self._chunks = chunks
+        return expressions
+
+    def _buffer_chunk_bounds(self, buffer: TokenBuffer) -> list[tuple[int, int]]:
+        # Same chunks as the ones built from a list of tokens, as [start, end) index ranges
+        total = len(buffer)
+        comments = buffer.comments
+        semicolon = TokenType.SEMICOLON.value
+        bounds: list[tuple[int, int]] = []
+        start = 0
+
+        for i, token_type in enumerate(buffer.token_types):
+            if token_type == semicolon:
+                bounds.append((start, i))
+
+                if i in comments:
+                    bounds.append((i, i + 1))
+
+                start = i + 1 if i < total - 1 else -1
 
-        return self._parse_batch_statements(parse_method=parse_method, sep_first_statement=False)
+        if start >= 0:
+            bounds.append((start, total))
+
+        return bounds
 
     def _warn_unsupported(self) -> None:
         if self._tokens_size <= 1:
@@ -3787,7 +4003,11 @@ class Parser:
             return self._parse_expression()
 
         if self._match(TokenType.L_PAREN):
-            expressions = self._parse_csv(_parse_value_expression)
+            literal_list = self.literal_lists and self._parse_literal_list(TokenType.R_PAREN)
+            if literal_list:
+                expressions: list[exp.Expr] = [literal_list]
+            else:
+                expressions = self._parse_csv(_parse_value_expression)
             self._match_r_paren()
             return self.expression(exp.Tuple(expressions=expressions))
 
@@ -3800,8 +4020,15 @@ class Parser:
     def _parse_projections(
         self,
     ) -> tuple[list[exp.Expr], list[exp.Expr] | None]:
+        if self.lazy:
+            return self._parse_csv(self._parse_lazy_projection), None
         return self._parse_expressions(), None
 
+    def _parse_lazy_projection(self) -> exp.Expr | None:
+        # Function calls that start at this index may be deferred, see _parse_function_call
+        self._projection_index = self._index
+        return self._parse_expression()
+
     def _parse_wrapped_select(self, table: bool = False) -> exp.Expr | None:
         if self._match_set((TokenType.PIVOT, TokenType.UNPIVOT)):
             this: exp.Expr | None = self._parse_simplified_pivot(
@@ -3878,6 +4105,8 @@ class Parser:
 
             while isinstance(this, exp.Subquery) and this.is_wrapper:
                 this = this.this
+                if isinstance(this, exp.Lazy):
+                    this = this.parse()
 
             assert this is not None
             if "with_" in this.arg_types:
@@ -3977,7 +4206,9 @@ class Parser:
             this = self._parse_query_modifiers(this)
         elif (table or nested) and self._match(TokenType.L_PAREN):
             comments = self._prev_comments
-            this = self._parse_wrapped_select(table=table)
+            this = self._parse_lazy_query(
+                "_parse_wrapped_select", table=table
+            ) or self._parse_wrapped_select(table=table)
 
             if this:
                 this.add_comments(comments, prepend=True)
@@ -4079,7 +4310,9 @@ class Parser:
 
         cte = self.expression(
             exp.CTE(
-                this=self._parse_wrapped(self._parse_statement),
+                this=self._parse_wrapped(
+                    lambda: self._parse_lazy_query("_parse_statement") or self._parse_statement()
+                ),
                 alias=alias,
                 materialized=materialized,
                 key_expressions=key_expressions,
@@ -5632,12 +5865,11 @@ class Parser:
         if not self._match_set(self.AMBIGUOUS_ALIAS_TOKENS, advance=False):
             return False
 
-        index = self._index
-        result = bool(
-            self._try_parse(self._parse_limit, retreat=True)
-            or self._try_parse(self._parse_offset, retreat=True)
+        # The clause is parsed speculatively, and reused once it's parsed for real. Otherwise, it'd be
+        # parsed up to three times (table alias, column alias, clause), recursively for subqueries
+        result = self._speculate("limit", self._parse_limit) or self._speculate(
+            "offset", self._parse_offset
         )
-        self._retreat(index)
 
         # MATCH_CONDITION (...) is a special construct that should not be consumed by limit/offset
         if self._next.token_type == TokenType.MATCH_CONDITION:
@@ -5932,9 +6164,22 @@ class Parser:
             this = self.expression(exp.In(this=this, unnest=unnest))
         elif self._match_set((TokenType.L_PAREN, TokenType.L_BRACKET)):
             matched_l_paren = self._prev.token_type == TokenType.L_PAREN
-            expressions = self._parse_csv(lambda: self._parse_select_or_expression(alias=alias))
+            literal_list = self.literal_lists and self._parse_literal_list(
+                TokenType.R_PAREN if matched_l_paren else TokenType.R_BRACKET
+            )
 
-            if len(expressions) == 1 and isinstance(query := expressions[0], exp.Query):
+            lazy = self._parse_lazy_query("_parse_select")
+
+            if literal_list:
+                expressions: list[exp.Expr] = [literal_list]
+            elif lazy:
+                expressions = [lazy]
+            else:
+                expressions = self._parse_csv(lambda: self._parse_select_or_expression(alias=alias))
+
+            if lazy:
+                this = self.expression(exp.In(this=this, query=exp.Subquery(this=lazy)))
+            elif len(expressions) == 1 and isinstance(query := expressions[0], exp.Query):
                 this = self.expression(
                     exp.In(this=this, query=self._parse_query_modifiers(query).subquery(copy=False))
                 )
@@ -5950,6 +6195,187 @@ class Parser:
 
         return this
 
+    def _parse_literal_list(self, end: TokenType) -> exp.LiteralList | None:
+        """
+        Consumes a comma-separated list of plain string and number literals terminated by `end`
+        (which is left unconsumed) as a single `exp.LiteralList`, scanning the tokens directly.
+        Returns None without consuming anything if the upcoming tokens aren't such a list.
+        """
+        primary_parsers = self.PRIMARY_PARSERS
+        if (
+            primary_parsers.get(TokenType.STRING) is not Parser.PRIMARY_PARSERS[TokenType.STRING]
+            or primary_parsers.get(TokenType.NUMBER) is not Parser.PRIMARY_PARSERS[TokenType.NUMBER]
+        ):
+            return None
+
+        tokens = self._tokens
+        size = self._tokens_size
+        index = self._index
+        values = []
+        is_string = []
+
+        while True:
+            if index + 1 >= size:
+                return None
+
+            token = tokens[index]
+            token_type = token.token_type
+            separator = tokens[index + 1]
+
+            if token_type == TokenType.STRING:
+                is_string.append(True)
+            elif token_type == TokenType.NUMBER:
+                is_string.append(False)
+            else:
+                return None
+
+            if token.comments or separator.comments:
+                return None
+
+            values.append(token.text)
+            index += 2
+
+            if separator.token_type == end:
+                break
+            if separator.token_type != TokenType.COMMA:
+                return None
+
+        if len(values) < self.LITERAL_LIST_MIN_SIZE:
+            return None
+
+        first = self._curr
+        last = tokens[index - 2]
+        self._advance(index - 1 - self._index)
+
+        literal_list = exp.LiteralList(values=tuple(values), is_string=tuple(is_string))
+        return literal_list.update_positions(
+            line=last.line, col=last.col, start=first.start, end=last.end
+        )
+
+    def _closing_paren(self, index: i64) -> i64:
+        """Returns the index of the token that closes the parenthesis at `index`, or -1."""
+        tokens = self._tokens
+        depth = 0
+
+        for i in range(index, self._tokens_size):
+            token_type = tokens[i].token_type
+            if token_type == TokenType.L_PAREN:
+                depth += 1
+            elif token_type == TokenType.R_PAREN:
+                depth -= 1
+                if not depth:
+                    return i
+
+        return -1
+
+    def _parse_lazy_query(self, method: str, **kwargs: t.Any) -> exp.Lazy | None:
+        """
+        Defers parsing the query that starts right after an opening parenthesis, if the parser's
+        `lazy` option is set and the query is long enough. The closing parenthesis is left
+        unconsumed and `method` is the one that would parse the query.
+        """
+        index = self._index
+        if (
+            not self.lazy
+            or self._prev.token_type != TokenType.L_PAREN
+            or self._curr.token_type not in (TokenType.SELECT, TokenType.WITH)
+        ):
+            return None
+
+        end = self._closing_paren(index - 1)
+        if end - index < self.LAZY_MIN_TOKENS:
+            return None
+
+        # Pipe syntax operators that follow the parentheses apply to the parsed query
+        if end + 1 < self._tokens_size and self._tokens[end + 1].token_type == TokenType.PIPE_GT:
+            return None
+
+        return self._defer(method, end, kwargs)
+
+    def _parse_lazy_function_call(self, optional_parens: bool, any_token: bool) -> exp.Lazy | None:
+        """
+        Defers parsing the function call that starts at the current token, which also starts a
+        projection, if its arguments are long enough and it makes up the whole projection, e.g.
+        it's not followed by a window specification or an operator.
+        """
+        index = self._index
+        end = self._closing_paren(index + 1) + 1
+        if end - index < self.LAZY_MIN_TOKENS:
+            return None
+
+        follower = self._tokens[end] if end < self._tokens_size else SENTINEL_NONE
+        if follower.token_type not in self.LAZY_PROJECTION_FOLLOWERS:
+            return None
+
+        return self._defer(
+            "_parse_function_call",
+            end,
+            {"optional_parens": optional_parens, "any_token": any_token},
+        )
+
+    def _defer(self, method: str, end: i64, kwargs: dict[str, t.Any]) -> exp.Lazy:
+        """Skips the tokens up to `end`, returning a placeholder that parses them with `method`."""
+        index = self._index
+        first = self._curr
+        last = self._tokens[end - 1]
+
+        lazy_range = LazyRange(
+            parser_class=type(self),
+            options={
+                "error_level": self.error_level,
+                "error_message_context": self.error_message_context,
+                "max_errors": self.max_errors,
+                "max_nodes": self.max_nodes,
+                "dialect": self.dialect,
+                "literal_lists": self.literal_lists,
+                "lazy": True,
+                "intern": self.intern,
+            },
+            sql=self.sql,
+            tokens=self._tokens,
+            start=index,
+            end=end,
+            prev_comments=self._prev_comments,
+            method=method,
+            kwargs=kwargs,
+        )
+
+        self._advance(end - index)
+
+        # The comments of the skipped tokens are attached when the placeholder is parsed
+        self._prev_comments = []
+
+        return exp.Lazy(this=lazy_range).update_positions(
+            line=last.line, col=last.col, start=first.start, end=last.end
+        )
+
+    def _parse_lazy(self, lazy_range: LazyRange) -> exp.Expr:
+        """Parses the tokens spanned by a placeholder, like the parser that deferred them would."""
+        self.reset()
+        self.sql = lazy_range.sql
+        self._tokens = lazy_range.tokens
+
+        # The token that follows the range is visible, as it was to the parser that skipped it
+        self._tokens_size = i64(min(lazy_range.end + 1, len(lazy_range.tokens)))
+        self._index = lazy_range.start - 1
+        self._advance()
+        self._prev_comments = lazy_range.prev_comments
+
+        expression = getattr(self, lazy_range.method)(**lazy_range.kwargs)
+
+        if self._index != lazy_range.end:
+            self.raise_error("Invalid expression / Unexpected token")
+
+        self.check_errors()
+
+        if not isinstance(expression, exp.Expr):
+            raise ParseError(f"Failed to parse deferred expression '{lazy_range.text}'")
+
+        if self.intern:
+            interning.POOL.intern(expression)
+
+        return expression
+
     def _parse_between(self, this: exp.Expr | None) -> exp.Between:
         symmetric = None
         if self._match_text_seq("SYMMETRIC"):
@@ -6150,6 +6576,8 @@ class Parser:
     def _parse_unary(self) -> exp.Expr | None:
         if self._match_set(self.UNARY_PARSERS):
             return self.UNARY_PARSERS[self._prev.token_type](self)
+        if self._memo or self._speculating:
+            return self._parse_memoized("type", self._parse_type)
         return self._parse_type()
 
     def _parse_type(
@@ -6162,7 +6590,10 @@ class Parser:
             return self._parse_column_ops(interval)
 
         index = self._index
-        data_type = self._parse_types(check_func=True, allow_identifiers=False)
+        if self._memo or self._speculating:
+            data_type = self._parse_memoized("speculative_type", self._parse_speculative_type)
+        else:
+            data_type = self._parse_speculative_type()
 
         # parse_types() returns a Cast if we parsed BQ's inline constructor <type>(<values>) e.g.
         # STRUCT<a INT, b STRING>(1, 'foo'), which is canonicalized to CAST(<values> AS <type>)
@@ -6216,8 +6647,18 @@ class Parser:
 
         return self._parse_column()
 
+    def _parse_speculative_type(self) -> exp.Expr | None:
+        # Something like DECIMAL(...) may turn out to be a function call instead of a type, in which
+        # case its arguments are parsed again. Memoizing them keeps nested calls from being parsed
+        # an exponential number of times
+        self._speculating += 1
+        try:
+            return self._parse_types(check_func=True, allow_identifiers=False)
+        finally:
+            self._speculating -= 1
+
     def _parse_type_size(self) -> exp.DataTypeParam | None:
-        this = self._parse_type()
+        this = self._parse_memoized("type", self._parse_type)
         if not this:
             return None
 
@@ -6534,7 +6975,10 @@ class Parser:
             this = self._parse_id_var()
         else:
             this = (
-                self._parse_type(parse_interval=False, fallback_to_identifier=True)
+                self._parse_memoized(
+                    "struct_field",
+                    lambda: self._parse_type(parse_interval=False, fallback_to_identifier=True),
+                )
                 or self._parse_id_var()
             )
 
@@ -6546,7 +6990,7 @@ class Parser:
             and not self._match_set(self.TYPE_TOKENS, advance=False)
         ):
             self._retreat(index)
-            return self._parse_types()
+            return self._parse_memoized("types", self._parse_types)
 
         return self._parse_column_def(this)
 
@@ -6830,7 +7274,8 @@ class Parser:
             return None
 
         comments = self._prev_comments
-        query = self._parse_select()
+        lazy = self._parse_lazy_query("_parse_select")
+        query = lazy or self._parse_select()
 
         if query:
             expressions = [query]
@@ -6843,7 +7288,7 @@ class Parser:
             this = self.expression(exp.Tuple())
         elif len(expressions) > 1 or self._prev.token_type == TokenType.COMMA:
             this = self.expression(exp.Tuple(expressions=expressions))
-        elif isinstance(this, exp.UNWRAPPED_QUERIES):
+        elif lazy or isinstance(this, exp.UNWRAPPED_QUERIES):
             this = self._parse_subquery(this=this, parse_alias=False)
         elif isinstance(this, (exp.Subquery, exp.Values)):
             this = self._parse_subquery(
@@ -6982,6 +7427,16 @@ class Parser:
         elif token_type not in self.FUNC_TOKENS:
             return None
 
+        if (
+            self._index == self._projection_index
+            and functions is None
+            and not anonymous
+            and not after_dot
+        ):
+            lazy = self._parse_lazy_function_call(optional_parens, any_token)
+            if lazy:
+                return lazy
+
         self._advance(2)
 
         parser = self.FUNCTION_PARSERS.get(upper)
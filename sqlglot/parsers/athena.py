@@ -6,7 +6,7 @@ from sqlglot import exp
 from sqlglot.errors import ErrorLevel
 from sqlglot.parser import Parser
 from sqlglot.parsers.trino import TrinoParser
-from sqlglot.tokens import TokenType, Token
+from sqlglot.tokens import TokenBuffer, TokenType, Token
 
 if t.TYPE_CHECKING:
     from sqlglot.dialects.dialect import DialectType
@@ -56,7 +56,7 @@ class AthenaParser(Parser):
             dialect=trino,
         )
 
-    def parse(self, raw_tokens: list[Token], sql: str) -> list[exp.Expr | None]:
+    def parse(self, raw_tokens: list[Token] | TokenBuffer, sql: str) -> list[exp.Expr | None]:
         if raw_tokens and raw_tokens[0].token_type == TokenType.HIVE_TOKEN_STREAM:
             return self._hive_parser.parse(raw_tokens[1:], sql)
 
@@ -65,7 +65,7 @@ class AthenaParser(Parser):
     def parse_into(
         self,
         expression_types: exp.IntoType,
-        raw_tokens: list[Token],
+        raw_tokens: list[Token] | TokenBuffer,
         sql: str | None = None,
     ) -> list[exp.Expr | None]:
         if raw_tokens and raw_tokens[0].token_type == TokenType.HIVE_TOKEN_STREAM:
@@ -579,7 +579,7 @@ class BigQueryParser(parser.Parser):
         if not unnest:
             return None
 
-        unnest_expr = seq_get(unnest.expressions, 0)
+        unnest_expr = seq_get(exp.parse_lazy(unnest).expressions, 0)
         if unnest_expr:
             from sqlglot.optimizer.annotate_types import annotate_types
 
@@ -0,0 +1,265 @@
+"""
+Per-rule profiling of the parser, to find out which grammar rules a slow or regressed dialect
+spends its time in.
+
+While a `ParserProfile` is active, the parsers created by `Dialect.parser`, and thus by
+`sqlglot.parse`, `sqlglot.parse_one` and `sqlglot.transpile`, are instances of an instrumented
+subclass of the dialect's parser. It counts the calls to and measures the time spent in every
+`_parse_*` method and every `STATEMENT_PARSERS` and `FUNCTION_PARSERS` entry, and the parsers
+record how often and how far they backtrack:
+
+    >>> import sqlglot
+    >>> from sqlglot.profiler import profile_parser
+    >>> with profile_parser() as profile:
+    ...     _ = sqlglot.parse_one("SELECT CAST(a AS INT) FROM t")
+    >>> profile.rules["FUNCTION_PARSERS[CAST]"].calls
+    1
+
+The parser classes themselves are left untouched, so profiling costs nothing when it's disabled,
+apart from a check of the parser's `profile` when it backtracks. This is also available as the
+`--profile` flag of `python -m sqlglot`.
+
+The mypyc compiled parsers of sqlglotc can't be subclassed, and their methods call each other
+directly, so only their parser table entries and their backtracking are profiled. The entries are
+wrapped in place while the profile is active, and restored once it's no longer.
+"""
+
+from __future__ import annotations
+
+import time
+import typing as t
+from contextlib import contextmanager
+
+if t.TYPE_CHECKING:
+    from sqlglot.parser import Parser
+
+
+class RuleStats:
+    """
+    The statistics of a single grammar rule.
+
+    Attributes:
+        name: the rule's name, i.e. the name of a `_parse_*` method or of a parser table entry.
+        calls: the number of times the rule was invoked.
+        total_time: the time spent in the rule, including the rules it invoked, in seconds.
+            Recursive invocations are only accounted for once.
+        self_time: the time spent in the rule, excluding the instrumented rules it invoked.
+    """
+
+    __slots__ = ("name", "calls", "total_time", "self_time", "_depth")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0
+        self.total_time = 0.0
+        self.self_time = 0.0
+        self._depth = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"RuleStats({self.name!r}, calls={self.calls}, "
+            f"total_time={self.total_time:.6f}, self_time={self.self_time:.6f})"
+        )
+
+
+class ParserProfile:
+    """
+    The statistics gathered by the instrumented parsers.
+
+    Attributes:
+        rules: the statistics of each grammar rule that was invoked at least once, by name.
+        retreats: the number of times the parser backtracked.
+        retreated_tokens: the total number of tokens the parser backtracked over, i.e. the number
+            of tokens it had to scan again.
+    """
+
+    def __init__(self) -> None:
+        self.rules: dict[str, RuleStats] = {}
+        self.retreats = 0
+        self.retreated_tokens = 0
+        self._children: list[float] = []
+        self._classes: dict[type[Parser], type[Parser]] = {}
+        # The parser tables that were wrapped in place, along with their original entries
+        self._tables: list[tuple[dict, dict]] = []
+
+    def clear(self) -> None:
+        """Resets the statistics."""
+        self.rules.clear()
+        self.retreats = 0
+        self.retreated_tokens = 0
+        self._children.clear()
+
+    def retreat(self, tokens: int) -> None:
+        """Records that a parser backtracked over `tokens` tokens."""
+        self.retreats += 1
+        self.retreated_tokens += tokens
+
+    def parser(self, parser_class: type[Parser], **opts: t.Any) -> Parser:
+        """
+        Creates a parser of the given class that records its statistics in this profile.
+
+        Args:
+            parser_class: the class of the parser.
+            opts: the parser's options.
+
+        Returns:
+            The parser.
+        """
+        parser = self.instrument(parser_class)(**opts)
+        parser.profile = self
+        return parser
+
+    def instrument(self, parser_class: type[Parser]) -> type[Parser]:
+        """
+        Returns a subclass of `parser_class` that records its statistics in this profile. Compiled
+        parser classes are returned as is, once their `STATEMENT_PARSERS` and `FUNCTION_PARSERS`
+        entries are wrapped in place, see `restore`.
+
+        Args:
+            parser_class: the parser class to instrument.
+
+        Returns:
+            The instrumented parser class.
+        """
+        instrumented = self._classes.get(parser_class)
+        if instrumented is not None:
+            return instrumented
+
+        if _is_compiled(parser_class):
+            for table in ("STATEMENT_PARSERS", "FUNCTION_PARSERS"):
+                entries = getattr(parser_class, table)
+                if any(entries is wrapped for wrapped, _ in self._tables):
+                    # The table is inherited from a parser class that was already instrumented
+                    continue
+
+                self._tables.append((entries, dict(entries)))
+                entries.update(self._wrap_table(table, entries))
+
+            self._classes[parser_class] = parser_class
+            return parser_class
+
+        namespace: dict[str, t.Any] = {}
+
+        for name in dir(parser_class):
+            method = getattr(parser_class, name)
+            if name.startswith("_parse") and callable(method) and _is_method(parser_class, name):
+                namespace[name] = self._wrap(name, method)
+
+        for table in ("STATEMENT_PARSERS", "FUNCTION_PARSERS"):
+            namespace[table] = self._wrap_table(table, getattr(parser_class, table))
+
+        namespace["__module__"] = parser_class.__module__
+
+        instrumented = type(parser_class.__name__, (parser_class,), namespace)
+        self._classes[parser_class] = instrumented
+        return instrumented
+
+    def restore(self) -> None:
+        """Restores the parser table entries that were wrapped in place by `instrument`."""
+        for entries, original in self._tables:
+            entries.update(original)
+
+        self._tables.clear()
+        self._classes.clear()
+
+    def report(self, limit: int | None = 30) -> str:
+        """
+        Formats the statistics as a table of rules, sorted by decreasing self time.
+
+        Args:
+            limit: the maximum number of rules to include, or None to include all of them.
+
+        Returns:
+            The formatted report.
+        """
+        rules = sorted(self.rules.values(), key=lambda stats: stats.self_time, reverse=True)
+        width = max((len(stats.name) for stats in rules[:limit]), default=4)
+
+        lines = [f"{'rule':<{width}}  {'calls':>10}  {'total (ms)':>12}  {'self (ms)':>12}"]
+        for stats in rules[:limit]:
+            lines.append(
+                f"{stats.name:<{width}}  {stats.calls:>10}  "
+                f"{stats.total_time * 1000:>12.3f}  {stats.self_time * 1000:>12.3f}"
+            )
+
+        lines.append(f"retreats: {self.retreats}, retreated tokens: {self.retreated_tokens}")
+        return "\n".join(lines)
+
+    def _wrap_table(self, table: str, entries: dict) -> dict:
+        return {
+            key: self._wrap(f"{table}[{getattr(key, 'name', key)}]", parser)
+            for key, parser in entries.items()
+        }
+
+    def _wrap(self, name: str, method: t.Callable) -> t.Callable:
+        rules = self.rules
+        children = self._children
+        perf_counter = time.perf_counter
+
+        def wrapper(*args: t.Any, **kwargs: t.Any) -> t.Any:
+            stats = rules.get(name)
+            if stats is None:
+                stats = rules[name] = RuleStats(name)
+
+            stats.calls += 1
+            stats._depth += 1
+            children.append(0.0)
+            start = perf_counter()
+
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                stats._depth -= 1
+                stats.self_time += elapsed - children.pop()
+                if not stats._depth:
+                    stats.total_time += elapsed
+                if children:
+                    children[-1] += elapsed
+
+        wrapper.__name__ = getattr(method, "__name__", name)
+        return wrapper
+
+
+def _is_compiled(parser_class: type) -> bool:
+    # Subclasses of mypyc compiled classes can be created, but not instantiated
+    try:
+        type(parser_class.__name__, (parser_class,), {"__module__": parser_class.__module__})()
+    except TypeError:
+        return True
+    return False
+
+
+def _is_method(parser_class: type, name: str) -> bool:
+    for klass in parser_class.__mro__:
+        if name in vars(klass):
+            return not isinstance(vars(klass)[name], (staticmethod, classmethod))
+    return False
+
+
+PROFILE: ParserProfile | None = None
+"""The profile the parsers created by `Dialect.parser` record their statistics in, if any."""
+
+
+@contextmanager
+def profile_parser(profile: ParserProfile | None = None) -> t.Iterator[ParserProfile]:
+    """
+    Profiles the parsers created by `Dialect.parser` for the duration of the context.
+
+    Args:
+        profile: the profile to record the statistics in. A new one is created by default.
+
+    Returns:
+        The profile, which can be inspected once the context exits.
+    """
+    global PROFILE
+
+    previous = PROFILE
+    profile = PROFILE = profile or ParserProfile()
+
+    try:
+        yield profile
+    finally:
+        PROFILE = previous
+        if profile is not previous:
+            profile.restore()
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import struct
 import typing as t
 
-from sqlglot import expressions as exp
+from sqlglot import expressions as exp, interning
 from types import ModuleType
 
 
@@ -42,13 +43,11 @@ def dump(expression: exp.Expr) -> list[dict[str, t.Any]]:
 
         payloads.append(payload)
 
-        if hasattr(node, "parent"):
-            klass = node.__class__.__qualname__
-
-            if node.__class__.__module__ != exp.__name__:
-                klass = f"{node.__module__}.{klass}"
+        if type(node) is exp.Lazy:
+            node = node.parse()
 
-            payload[CLASS] = klass
+        if hasattr(node, "parent"):
+            payload[CLASS] = _class_name(node.__class__)
 
             if node.type and node.type is not node:
                 payload[TYPE] = dump(node.type)
@@ -76,9 +75,15 @@ def dump(expression: exp.Expr) -> list[dict[str, t.Any]]:
 
 def load(
     payloads: list[dict[str, t.Any]] | None,
+    intern: bool = False,
 ) -> exp.Expr | exp.DType | None:
     """
     Load a list of dicts generated by dump into an Expr.
+
+    Args:
+        payloads: the dumped tree.
+        intern: whether to share the args of structurally identical leaves with the other
+            interned trees, see `sqlglot.interning`.
     """
 
     if not payloads:
@@ -102,14 +107,22 @@ def load(
         else:
             parent.set(arg_key, node)
 
+    if intern and isinstance(root, exp.Expr):
+        interning.POOL.intern(root)
+
     return root
 
 
-def _load(payload: dict[str, t.Any]) -> exp.Expr | exp.DType:
-    class_name: str = payload[CLASS]
+def _class_name(klass: type) -> str:
+    name = klass.__qualname__
 
-    if class_name == DATA_TYPE:
-        return exp.DType(payload[VALUE])
+    if klass.__module__ != exp.__name__:
+        name = f"{klass.__module__}.{name}"
+
+    return name
+
+
+def _class(class_name: str) -> t.Any:
     module: ModuleType
     if "." in class_name:
         module_path, class_name = class_name.rsplit(".", maxsplit=1)
@@ -117,8 +130,602 @@ def _load(payload: dict[str, t.Any]) -> exp.Expr | exp.DType:
     else:
         module = exp
 
-    expression = getattr(module, class_name)()
+    return getattr(module, class_name)
+
+
+def _load(payload: dict[str, t.Any]) -> exp.Expr | exp.DType:
+    class_name: str = payload[CLASS]
+
+    if class_name == DATA_TYPE:
+        return exp.DType(payload[VALUE])
+
+    expression = _class(class_name)()
     expression._type = load(payload.get(TYPE))
     expression.comments = payload.get(COMMENTS)
     expression._meta = payload.get(META)
     return expression
+
+
+# The number of items each node takes in the output of `dump_flat`
+FLAT_STRIDE = 7
+
+
+def dump_flat(expression: exp.Expr) -> tuple[t.Any, ...]:
+    """
+    Dump an Expr into a flat tuple, which is how expressions are pickled. It holds the following
+    items for each node, in preorder:
+
+        class, parent position, arg key, list index, args, comments, meta
+
+    where the args are a copy of the node's args in which its children are replaced by None, and
+    the arg key is None for the types nodes are annotated with. See `load_flat`.
+    """
+    stream: list[t.Any] = []
+    stack: list[tuple[exp.Expr, int, str | None, int | None]] = [(expression, -1, None, None)]
+
+    while stack:
+        node, parent, arg_key, index = stack.pop()
+        if type(node) is exp.Lazy:
+            node = node.parse()
+
+        position = len(stream) // FLAT_STRIDE
+        children: list[tuple[exp.Expr, int, str | None, int | None]] = []
+        args = dict(node.args)
+
+        for k, vs in args.items():
+            if isinstance(vs, exp.Expr):
+                children.append((vs, position, k, None))
+                args[k] = None
+            elif type(vs) is list:
+                values: list[t.Any] = []
+                for i, v in enumerate(vs):
+                    if isinstance(v, exp.Expr):
+                        children.append((v, position, k, i))
+                        v = None
+                    values.append(v)
+                args[k] = values
+
+        if isinstance(node._type, exp.Expr) and node._type is not node:
+            children.append((node._type, position, None, None))
+
+        stream.extend(
+            (
+                node.__class__,
+                parent,
+                arg_key,
+                index,
+                args,
+                node.comments[:] if node.comments is not None else None,
+                dict(node._meta) if node._meta is not None else None,
+            )
+        )
+        stack.extend(reversed(children))
+
+    return tuple(stream)
+
+
+def load_flat(stream: tuple[t.Any, ...]) -> exp.Expr:
+    """
+    Load a tuple generated by `dump_flat` into an Expr. The args, comments and meta it holds are
+    used as they are, and the nodes are wired up directly rather than through `set`, since a fresh
+    tree has no hashes to invalidate.
+    """
+    nodes: list[exp.Expr] = []
+
+    for i in range(0, len(stream), FLAT_STRIDE):
+        klass, parent, arg_key, index, args, comments, meta = stream[i : i + FLAT_STRIDE]
+
+        node = klass()
+        node.args = args
+        node.comments = comments
+        node._meta = meta
+
+        if parent >= 0:
+            parent_node = nodes[parent]
+
+            if arg_key is None:
+                parent_node._type = node
+            else:
+                node.parent = parent_node
+                node.arg_key = arg_key
+
+                if index is None:
+                    parent_node.args[arg_key] = node
+                else:
+                    node.index = index
+                    parent_node.args[arg_key][index] = node
+
+        nodes.append(node)
+
+    return nodes[0]
+
+
+# The binary format of `dump_binary`. Integers are unsigned LEB128 varints, except for the values
+# of INT_TAG, which are zigzag-encoded varints, and those of FLOAT_TAG, which are little-endian
+# doubles:
+#
+#   payload := MAGIC strings classes value
+#   strings := count (length utf8-bytes)*        the string table
+#   classes := count string-index*               the class-id table, by (qualified) class name
+#   value   := NONE_TAG | FALSE_TAG | TRUE_TAG | INT_TAG int | FLOAT_TAG double
+#            | STR_TAG string-index | DTYPE_TAG string-index | LIST_TAG count value*
+#            | DICT_TAG count (string-index value)* | NODE_TAG node
+#   node    := class-id size flags [comments] [meta] count (string-index value)* [type]
+#
+# where `size` is the length of the rest of the node, so that its subtree can be skipped, `flags`
+# tells which of the comments, meta and type values are present and the pairs are the node's args.
+# Args that are None or empty lists are left out, like in `dump`.
+MAGIC = b"SQLG\x01"
+
+NONE_TAG = 0
+FALSE_TAG = 1
+TRUE_TAG = 2
+INT_TAG = 3
+FLOAT_TAG = 4
+STR_TAG = 5
+DTYPE_TAG = 6
+LIST_TAG = 7
+DICT_TAG = 8
+NODE_TAG = 9
+
+HAS_COMMENTS = 1
+HAS_META = 2
+HAS_TYPE = 4
+
+_DOUBLE = struct.Struct("<d")
+
+
+def _write_varint(out: bytearray, n: int) -> None:
+    while n > 0x7F:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _varint_size(n: int) -> int:
+    size = 1
+    while n > 0x7F:
+        n >>= 7
+        size += 1
+    return size
+
+
+class _Encoder:
+    def __init__(self) -> None:
+        self.body = bytearray()
+        self.strings: dict[str, int] = {}
+        self.classes: dict[type, int] = {}
+        # The sizes of the nodes are only known once their subtrees are encoded, so the body is
+        # written without them, and they're inserted at the recorded positions by `payload`
+        self.starts: list[int] = []
+        self.ends: list[int] = []
+        self.parents: list[int] = []
+
+    def string(self, value: str) -> int:
+        index = self.strings.get(value)
+        if index is None:
+            index = self.strings[value] = len(self.strings)
+        return index
+
+    def scalar(self, value: t.Any) -> None:
+        body = self.body
+
+        if value is None:
+            body.append(NONE_TAG)
+        elif value is True:
+            body.append(TRUE_TAG)
+        elif value is False:
+            body.append(FALSE_TAG)
+        elif type(value) is str:
+            body.append(STR_TAG)
+            _write_varint(body, self.string(value))
+        elif type(value) is int:
+            body.append(INT_TAG)
+            _write_varint(body, value << 1 if value >= 0 else (-value << 1) - 1)
+        elif type(value) is float:
+            body.append(FLOAT_TAG)
+            body += _DOUBLE.pack(value)
+        elif type(value) is exp.DType:
+            body.append(DTYPE_TAG)
+            _write_varint(body, self.string(value.value))
+        elif type(value) is list:
+            body.append(LIST_TAG)
+            _write_varint(body, len(value))
+            for v in value:
+                self.scalar(v)
+        elif type(value) is dict:
+            body.append(DICT_TAG)
+            _write_varint(body, len(value))
+            for k, v in value.items():
+                _write_varint(body, self.string(k))
+                self.scalar(v)
+        else:
+            raise TypeError(f"Cannot serialize {value!r} of type {type(value).__name__}")
+
+    def encode(self, expression: exp.Expr) -> None:
+        body = self.body
+        # A task is either a (value, enclosing node) pair to write, an arg key to write or the
+        # number of the node whose end has been reached
+        tasks: list[t.Any] = [(expression, -1)]
+
+        while tasks:
+            task = tasks.pop()
+
+            if type(task) is str:
+                _write_varint(body, self.string(task))
+                continue
+            if type(task) is int:
+                self.ends[task] = len(body)
+                continue
+
+            value, parent = task
+
+            if type(value) is list:
+                body.append(LIST_TAG)
+                _write_varint(body, len(value))
+                for v in reversed(value):
+                    tasks.append((v, parent))
+                continue
+            if not isinstance(value, exp.Expr):
+                self.scalar(value)
+                continue
+
+            node = value.parse() if type(value) is exp.Lazy else value
+            class_id = self.classes.get(node.__class__)
+            if class_id is None:
+                class_id = self.classes[node.__class__] = len(self.classes)
+                self.string(_class_name(node.__class__))
+
+            body.append(NODE_TAG)
+            _write_varint(body, class_id)
+
+            number = len(self.starts)
+            self.starts.append(len(body))
+            self.ends.append(0)
+            self.parents.append(parent)
+
+            dtype = node._type if node._type is not node else None
+            body.append(
+                (HAS_COMMENTS if node.comments else 0)
+                | (HAS_META if node._meta is not None else 0)
+                | (HAS_TYPE if dtype is not None else 0)
+            )
+            if node.comments:
+                self.scalar(node.comments)
+            if node._meta is not None:
+                self.scalar(node._meta)
+
+            args = [(k, v) for k, v in node.args.items() if v is not None and v != []]
+            _write_varint(body, len(args))
+
+            tasks.append(number)
+            if dtype is not None:
+                tasks.append((dtype, number))
+            for i in range(len(args) - 1, -1, -1):
+                k, v = args[i]
+                tasks.append((v, number))
+                tasks.append(k)
+
+    def payload(self) -> bytes:
+        starts, ends, parents = self.starts, self.ends, self.parents
+
+        # The size of a node covers the size fields of its descendants, which follow it
+        sizes = [0] * len(starts)
+        nested = [0] * len(starts)
+        for i in reversed(range(len(starts))):
+            size = sizes[i] = ends[i] - starts[i] + nested[i]
+            if parents[i] >= 0:
+                nested[parents[i]] += _varint_size(size) + nested[i]
+
+        out = bytearray(MAGIC)
+        _write_varint(out, len(self.strings))
+        for string in self.strings:
+            encoded = string.encode("utf-8")
+            _write_varint(out, len(encoded))
+            out += encoded
+        _write_varint(out, len(self.classes))
+        for klass in self.classes:
+            _write_varint(out, self.strings[_class_name(klass)])
+
+        body = self.body
+        position = 0
+        for start, size in zip(starts, sizes):
+            out += body[position:start]
+            _write_varint(out, size)
+            position = start
+        out += body[position:]
+
+        return bytes(out)
+
+
+class _Decoder:
+    # Varints are mostly a single byte, so that case is inlined throughout
+    def __init__(
+        self,
+        data: memoryview,
+        position: int,
+        strings: list[str],
+        classes: list[t.Any],
+        lazy: bool,
+        intern: bool,
+    ) -> None:
+        self.data = data
+        self.position = position
+        self.strings = strings
+        self.classes = classes
+        self.lazy = lazy
+        self.intern = intern
+        self.deferred = {
+            i for i, klass in enumerate(classes) if lazy and issubclass(klass, exp.Query)
+        }
+
+    def varint(self) -> int:
+        data = self.data
+        position = self.position
+        byte = data[position]
+        position += 1
+        n = byte & 0x7F
+        shift = 7
+
+        while byte & 0x80:
+            byte = data[position]
+            position += 1
+            n |= (byte & 0x7F) << shift
+            shift += 7
+
+        self.position = position
+        return n
+
+    def scalar(self) -> t.Any:
+        data = self.data
+        tag = data[self.position]
+        self.position += 1
+
+        if tag == STR_TAG or tag == INT_TAG or tag == DTYPE_TAG:
+            n = data[self.position]
+            if n < 0x80:
+                self.position += 1
+            else:
+                n = self.varint()
+
+            if tag == STR_TAG:
+                return self.strings[n]
+            if tag == INT_TAG:
+                return -((n + 1) >> 1) if n & 1 else n >> 1
+            return exp.DType(self.strings[n])
+        if tag == NONE_TAG:
+            return None
+        if tag == TRUE_TAG:
+            return True
+        if tag == FALSE_TAG:
+            return False
+        if tag == FLOAT_TAG:
+            position = self.position
+            self.position = position + 8
+            return _DOUBLE.unpack_from(data, position)[0]
+        if tag == LIST_TAG:
+            return [self.scalar() for _ in range(self.varint())]
+        if tag == DICT_TAG:
+            strings = self.strings
+            values = {}
+            for _ in range(self.varint()):
+                n = data[self.position]
+                if n < 0x80:
+                    self.position += 1
+                else:
+                    n = self.varint()
+                # Meta values are mostly small integers, e.g. the positions of the nodes
+                if data[self.position] == INT_TAG and data[self.position + 1] < 0x80:
+                    n2 = data[self.position + 1]
+                    self.position += 2
+                    values[strings[n]] = -((n2 + 1) >> 1) if n2 & 1 else n2 >> 1
+                else:
+                    values[strings[n]] = self.scalar()
+            return values
+        raise ValueError(f"Invalid tag {tag} at position {self.position - 1}")
+
+    def decode(self) -> t.Any:
+        """
+        Decodes the value at the current position. If it's a node, the subtrees of its descendant
+        queries are deferred when loading lazily.
+        """
+        data = self.data
+        strings = self.strings
+        classes = self.classes
+        deferred = self.deferred
+        # The nodes and lists being decoded, as [node, args left, arg key, flags] and
+        # [list, values left] frames
+        stack: list[list[t.Any]] = []
+        root = True
+
+        while True:
+            if stack and len(stack[-1]) == 4:
+                n = data[self.position]
+                if n < 0x80:
+                    self.position += 1
+                else:
+                    n = self.varint()
+                stack[-1][2] = strings[n]
+
+            tag = data[self.position]
+            value: t.Any
+
+            if tag == NODE_TAG:
+                start = self.position
+                self.position += 1
+                class_id = data[self.position]
+                if class_id < 0x80:
+                    self.position += 1
+                else:
+                    class_id = self.varint()
+                size = self.varint()
+
+                if class_id in deferred and not root:
+                    value = exp.Lazy(this=BinaryRange(self, start))
+                    self.position += size
+                else:
+                    node = classes[class_id]()
+                    flags = data[self.position]
+                    self.position += 1
+                    if flags & HAS_COMMENTS:
+                        node.comments = self.scalar()
+                    if flags & HAS_META:
+                        node._meta = self.scalar()
+
+                    count = data[self.position]
+                    if count < 0x80:
+                        self.position += 1
+                    else:
+                        count = self.varint()
+
+                    root = False
+                    if count:
+                        stack.append([node, count, None, flags])
+                        continue
+                    if flags & HAS_TYPE:
+                        node._type = self.decode()
+                    value = node
+
+                root = False
+            elif tag == LIST_TAG:
+                self.position += 1
+                count = self.varint()
+                if count:
+                    stack.append([[], count])
+                    continue
+                value = []
+            else:
+                value = self.scalar()
+
+            # Add the value to its container, along with the containers it completes
+            while stack:
+                frame = stack[-1]
+
+                if len(frame) == 2:
+                    frame[0].append(value)
+                    frame[1] -= 1
+                    if frame[1]:
+                        break
+                    value = frame[0]
+                else:
+                    node, _, arg_key, flags = frame
+                    node.args[arg_key] = value
+                    # Nodes are completed bottom-up, so flagging the parents of placeholders
+                    # flags all of their ancestors
+                    if isinstance(value, exp.Expr):
+                        value.parent = node
+                        value.arg_key = arg_key
+                        if value._lazy:
+                            node._lazy = True
+                    elif type(value) is list:
+                        for i, v in enumerate(value):
+                            if isinstance(v, exp.Expr):
+                                v.parent = node
+                                v.arg_key = arg_key
+                                v.index = i
+                                if v._lazy:
+                                    node._lazy = True
+
+                    frame[1] -= 1
+                    if frame[1]:
+                        break
+                    if flags & HAS_TYPE:
+                        node._type = self.decode()
+                    value = node
+
+                stack.pop()
+            else:
+                return value
+
+
+class BinaryRange:
+    """
+    The subtree spanned by an `exp.Lazy` placeholder in a payload loaded by `load_binary`, which
+    is decoded when the placeholder is walked into. Ranges reference the payload without copying
+    it, and are shared by the copies of a placeholder.
+    """
+
+    __slots__ = ("decoder", "start")
+
+    def __init__(self, decoder: _Decoder, start: int) -> None:
+        self.decoder = decoder
+        self.start = start
+
+    @property
+    def text(self) -> str:
+        return self.parse().sql()
+
+    def parse(self) -> exp.Expr:
+        """Decodes the range into a new syntax tree."""
+        decoder = self.decoder
+        decoder = _Decoder(
+            decoder.data,
+            self.start,
+            decoder.strings,
+            decoder.classes,
+            decoder.lazy,
+            decoder.intern,
+        )
+        expression = decoder.decode()
+        if decoder.intern:
+            interning.POOL.intern(expression)
+        return expression
+
+    def __eq__(self, other: object) -> bool:
+        return type(other) is BinaryRange and self.parse() == other.parse()
+
+    def __hash__(self) -> int:
+        return hash(self.parse())
+
+    def __repr__(self) -> str:
+        return f"BinaryRange({self.text!r})"
+
+
+def dump_binary(expression: exp.Expr) -> bytes:
+    """
+    Dump an Expr into the compact binary format described above, which is much smaller than the
+    JSON serialized output of `dump` and faster to load. See `load_binary`.
+    """
+    encoder = _Encoder()
+    encoder.encode(expression)
+    return encoder.payload()
+
+
+def load_binary(
+    payload: bytes | bytearray | memoryview,
+    lazy: bool = False,
+    intern: bool = False,
+) -> exp.Expr:
+    """
+    Load a payload generated by `dump_binary` into an Expr.
+
+    Args:
+        payload: the dumped tree.
+        lazy: whether to defer the decoding of subqueries, CTE bodies and other nested queries
+            until they're walked into. They're loaded as `exp.Lazy` placeholders, whose decoding
+            reads the payload in place, so it must not be mutated while any of them is left.
+        intern: whether to share the args of structurally identical leaves with the other
+            interned trees, see `sqlglot.interning`.
+    """
+    data = memoryview(payload)
+    if data[: len(MAGIC)] != MAGIC:
+        raise ValueError("Invalid payload, expected the output of dump_binary")
+
+    decoder = _Decoder(data, len(MAGIC), [], [], False, False)
+
+    strings = []
+    for _ in range(decoder.varint()):
+        length = decoder.varint()
+        position = decoder.position
+        strings.append(str(data[position : position + length], "utf-8"))
+        decoder.position = position + length
+
+    classes = [_class(strings[decoder.varint()]) for _ in range(decoder.varint())]
+
+    decoder = _Decoder(data, decoder.position, strings, classes, lazy, intern)
+    expression = decoder.decode()
+
+    if intern:
+        interning.POOL.intern(expression)
+
+    return expression
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import typing as t
+from array import array
 from enum import IntEnum, auto
 
 from sqlglot.errors import TokenError
@@ -534,11 +535,154 @@ class Token:
         return f"<Token {attributes}>"
 
 
+_TOKEN_TYPES: dict[int, TokenType] = {token_type.value: token_type for token_type in TokenType}
+
+
+class TokenBuffer:
+    """
+    A compact, struct-of-arrays alternative to a list of `Token` objects.
+
+    Each token is a row across parallel integer columns. Its text is sliced lazily from `sql`,
+    unless it differs from the source (e.g. the unescaped contents of a string literal), in which
+    case it's kept in the `texts` side table. Likewise, only the tokens that carry comments have an
+    entry in the `comments` side table. `Token` objects are materialized on demand, when the buffer
+    is indexed or iterated over.
+
+    The savings are limited to holding the tokens: the parser still materializes the `Token`
+    objects of the statement it's parsing, so a script's peak memory while parsing is that of its
+    longest statement's tokens, and that of the whole script if it's a single statement.
+    """
+
+    __slots__ = ("sql", "token_types", "starts", "ends", "lines", "cols", "texts", "comments")
+
+    def __init__(self, sql: str = "") -> None:
+        self.sql = sql
+        self.token_types: array[int] = array("i")
+        self.starts: array[int] = array("i")
+        self.ends: array[int] = array("i")
+        self.lines: array[int] = array("i")
+        self.cols: array[int] = array("i")
+        self.texts: dict[int, str] = {}
+        self.comments: dict[int, list[str]] = {}
+
+    @classmethod
+    def from_tokens(cls, tokens: t.Iterable[Token], sql: str = "") -> TokenBuffer:
+        """Builds a buffer out of existing tokens, whose positions refer to `sql`."""
+        buffer = cls(sql)
+
+        for token in tokens:
+            start = token.start
+            end = token.end
+            text = token.text
+            buffer.append(
+                token.token_type,
+                None if sql[start : end + 1] == text else text,
+                token.line,
+                token.col,
+                start,
+                end,
+                token.comments,
+            )
+
+        return buffer
+
+    def append(
+        self,
+        token_type: TokenType,
+        text: str | None,
+        line: int,
+        col: int,
+        start: int,
+        end: int,
+        comments: list[str],
+    ) -> None:
+        """Appends a token, whose text is `sql[start : end + 1]` unless `text` is given."""
+        index = len(self.token_types)
+        self.token_types.append(token_type)
+        self.starts.append(start)
+        self.ends.append(end)
+        self.lines.append(line)
+        self.cols.append(col)
+
+        if text is not None:
+            self.texts[index] = text
+        if comments:
+            self.comments[index] = comments
+
+    def token_type(self, index: int) -> TokenType:
+        return _TOKEN_TYPES[self.token_types[index]]
+
+    def text(self, index: int) -> str:
+        text = self.texts.get(index)
+        if text is None:
+            text = self.sql[self.starts[index] : self.ends[index] + 1]
+        return text
+
+    def token(self, index: int) -> Token:
+        """Materializes the `index`-th token."""
+        comments = self.comments.get(index)
+        return Token(
+            _TOKEN_TYPES[self.token_types[index]],
+            self.text(index),
+            line=self.lines[index],
+            col=self.cols[index],
+            start=self.starts[index],
+            end=self.ends[index],
+            comments=[] if comments is None else comments,
+        )
+
+    def tokens(self, start: int = 0, end: int | None = None) -> list[Token]:
+        """Materializes the tokens in the range [`start`, `end`)."""
+        if end is None:
+            end = len(self.token_types)
+        return [self.token(index) for index in range(start, end)]
+
+    def __len__(self) -> int:
+        return len(self.token_types)
+
+    def __iter__(self) -> t.Iterator[Token]:
+        for index in range(len(self.token_types)):
+            yield self.token(index)
+
+    @t.overload
+    def __getitem__(self, index: int) -> Token: ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> TokenBuffer: ...
+
+    def __getitem__(self, index: int | slice) -> Token | TokenBuffer:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self.token_types))
+            if step != 1:
+                raise ValueError("TokenBuffer slices don't support steps")
+
+            buffer = TokenBuffer(self.sql)
+            buffer.token_types = self.token_types[start:stop]
+            buffer.starts = self.starts[start:stop]
+            buffer.ends = self.ends[start:stop]
+            buffer.lines = self.lines[start:stop]
+            buffer.cols = self.cols[start:stop]
+            buffer.texts = {i - start: v for i, v in self.texts.items() if start <= i < stop}
+            buffer.comments = {i - start: v for i, v in self.comments.items() if start <= i < stop}
+            return buffer
+
+        if index < 0:
+            index += len(self.token_types)
+        if not 0 <= index < len(self.token_types):
+            raise IndexError("TokenBuffer index out of range")
+
+        return self.token(index)
+
+    def __repr__(self) -> str:
+        return f"<TokenBuffer tokens: {len(self.token_types)}>"
+
+
 class TokenizerCore:
     __slots__ = (
         "sql",
         "size",
         "tokens",
+        "buffer",
         "_start",
         "_current",
         "_line",
@@ -548,6 +692,8 @@ class TokenizerCore:
         "_end",
         "_peek",
         "_prev_token_line",
+        "_last_type",
+        "_last_comments",
         "single_tokens",
         "keywords",
         "quotes",
@@ -637,6 +783,7 @@ class TokenizerCore:
         self.sql = ""
         self.size = 0
         self.tokens: list[Token] = []
+        self.buffer: TokenBuffer | None = None
         self._start = 0
         self._current = 0
         self._line = 1
@@ -646,11 +793,14 @@ class TokenizerCore:
         self._end = False
         self._peek = ""
         self._prev_token_line = -1
+        self._last_type = TokenType.SENTINEL
+        self._last_comments: list[str] = []
 
     def reset(self) -> None:
         self.sql = ""
         self.size = 0
         self.tokens = []
+        self.buffer = None
         self._start = 0
         self._current = 0
         self._line = 1
@@ -660,10 +810,66 @@ class TokenizerCore:
         self._end = False
         self._peek = ""
         self._prev_token_line = -1
+        self._last_type = TokenType.SENTINEL
+        self._last_comments = []
 
     def tokenize(self, sql: str) -> list[Token]:
         """Returns a list of tokens corresponding to the SQL string `sql`."""
         self.reset()
+        self._tokenize(sql)
+        return self.tokens
+
+    def tokenize_buffer(self, sql: str) -> TokenBuffer:
+        """Returns a `TokenBuffer` of the tokens corresponding to the SQL string `sql`."""
+        self.reset()
+        buffer = TokenBuffer(sql)
+        self.buffer = buffer
+
+        try:
+            self._tokenize(sql)
+        finally:
+            self.buffer = None
+
+        return buffer
+
+    def tokenize_range(self, sql: str, start: int, stop: int, line: int, col: int) -> list[Token]:
+        """
+        Returns the tokens of `sql` from offset `start` up to and including the first semicolon that
+        starts at or after offset `stop`. The scanner sees the whole string, so the tokens are the
+        same as the ones `tokenize` would produce, as long as `start` is a statement boundary.
+        """
+        self.reset()
+        self.sql = sql
+        self.size = len(sql)
+        self._current = start
+        self._line = line
+        self._col = col
+        self._end = start >= self.size
+
+        try:
+            # Each scan stops right before a semicolon, which is added by the next one. Scanning
+            # up to the next semicolon also attaches the comments that trail the last one.
+            while not self._end:
+                self._scan(check_semicolon=True)
+                if self._last_type != TokenType.SENTINEL:
+                    # The comments that precede the semicolon were attached to the last token
+                    self._comments = []
+                tokens = self.tokens
+                for i in range(len(tokens) - 1, -1, -1):
+                    token = tokens[i]
+                    if token.token_type == TokenType.SEMICOLON and token.start >= stop:
+                        self.tokens = tokens[: i + 1]
+                        return self.tokens
+                    if token.start < stop:
+                        break
+        except Exception as e:
+            start = max(self._current - 50, 0)
+            end = min(self._current + 50, self.size - 1)
+            raise TokenError(f"Error tokenizing '{self.sql[start:end]}'") from e
+
+        return self.tokens
+
+    def _tokenize(self, sql: str) -> None:
         self.sql = sql
         self.size = len(sql)
 
@@ -675,7 +881,14 @@ class TokenizerCore:
             context = self.sql[start:end]
             raise TokenError(f"Error tokenizing '{context}'") from e
 
-        return self.tokens
+    def _attach_comments(self, comments: list[str]) -> None:
+        # Attaches comments to the last token, registering its comment list in the buffer's side
+        # table the first time it becomes non-empty
+        last_comments = self._last_comments
+        buffer = self.buffer
+        if buffer is not None and not last_comments:
+            buffer.comments[len(buffer) - 1] = last_comments
+        last_comments.extend(comments)
 
     def _scan(self, check_semicolon: bool = False) -> None:
         identifiers = self.identifiers
@@ -709,8 +922,8 @@ class TokenizerCore:
             if check_semicolon and self._peek == ";":
                 break
 
-        if self.tokens and self._comments:
-            self.tokens[-1].comments.extend(self._comments)
+        if self._comments and self._last_type != TokenType.SENTINEL:
+            self._attach_comments(self._comments)
 
     def _chars(self, size: int) -> str:
         if size == 1:
@@ -765,24 +978,40 @@ class TokenizerCore:
     def _add(self, token_type: TokenType, text: str | None = None) -> None:
         self._prev_token_line = self._line
 
-        if self._comments and token_type == TokenType.SEMICOLON and self.tokens:
-            self.tokens[-1].comments.extend(self._comments)
-            self._comments = []
+        if self._comments and token_type == TokenType.SEMICOLON:
+            if self._last_type != TokenType.SENTINEL:
+                self._attach_comments(self._comments)
+                self._comments = []
+
+        prev_type = self._last_type
+        comments = self._comments
+        buffer = self.buffer
+
+        if buffer is None:
+            if text is None:
+                text = self.sql[self._start : self._current]
+
+            self.tokens.append(
+                Token(
+                    token_type,
+                    text=text,
+                    line=self._line,
+                    col=self._col,
+                    start=self._start,
+                    end=self._current - 1,
+                    comments=comments,
+                )
+            )
+        else:
+            if text is not None and text == self.sql[self._start : self._current]:
+                text = None
 
-        if text is None:
-            text = self.sql[self._start : self._current]
-
-        self.tokens.append(
-            Token(
-                token_type,
-                text=text,
-                line=self._line,
-                col=self._col,
-                start=self._start,
-                end=self._current - 1,
-                comments=self._comments,
+            buffer.append(
+                token_type, text, self._line, self._col, self._start, self._current - 1, comments
             )
-        )
+
+        self._last_type = token_type
+        self._last_comments = comments
         self._comments = []
 
         # If we have either a semicolon or a begin token before the command's token, we'll parse
@@ -790,16 +1019,36 @@ class TokenizerCore:
         if (
             token_type in self.commands
             and self._peek != ";"
-            and (len(self.tokens) == 1 or self.tokens[-2].token_type in self.command_prefix_tokens)
+            and (prev_type == TokenType.SENTINEL or prev_type in self.command_prefix_tokens)
         ):
             start = self._current
-            tokens = len(self.tokens)
-            self._scan(check_semicolon=True)
-            self.tokens = self.tokens[:tokens]
+            self._scan_command()
+            self._last_type = token_type
+            self._last_comments = comments
             text = self.sql[start : self._current].strip()
             if text:
                 self._add(TokenType.STRING, text)
 
+    def _scan_command(self) -> None:
+        # The tokens of the command's body are discarded, as it's parsed as a string
+        if self.buffer is None:
+            tokens = len(self.tokens)
+            self._scan(check_semicolon=True)
+            self.tokens = self.tokens[:tokens]
+            return
+
+        buffer = self.buffer
+        comments = self._last_comments
+        self.buffer = TokenBuffer(self.sql)
+        try:
+            self._scan(check_semicolon=True)
+        finally:
+            self.buffer = buffer
+
+        # Trailing comments may have been attached to the command's token during the scan
+        if comments:
+            buffer.comments[len(buffer) - 1] = comments
+
     def _scan_keywords(self) -> None:
         sql = self.sql
         sql_size = self.size
@@ -904,15 +1153,15 @@ class TokenizerCore:
 
         if (
             comment_start == self.hint_start
-            and self.tokens
-            and self.tokens[-1].token_type in self.tokens_preceding_hint
+            and self._last_type != TokenType.SENTINEL
+            and self._last_type in self.tokens_preceding_hint
         ):
             self._add(TokenType.HINT)
 
         # Leading comment is attached to the succeeding token, whilst trailing comment to the preceding.
         # Multiple consecutive comments are preserved by appending them to the current comments list.
         if comment_start_line == self._prev_token_line:
-            self.tokens[-1].comments.extend(self._comments)
+            self._attach_comments(self._comments)
             self._comments = []
             self._prev_token_line = self._line
 
@@ -949,9 +1198,7 @@ class TokenizerCore:
                     end += 1
                 self._advance(end - self._current)
             elif self._peek == "." and not decimal:
-                if (
-                    self.tokens and self.tokens[-1].token_type == TokenType.PARAMETER
-                ) or not self.numbers_can_have_decimals:
+                if self._last_type == TokenType.PARAMETER or not self.numbers_can_have_decimals:
                     break
                 decimal = True
                 self._advance()
@@ -1116,7 +1363,7 @@ class TokenizerCore:
 
         self._add(
             TokenType.VAR
-            if self.tokens and self.tokens[-1].token_type == TokenType.PARAMETER
+            if self._last_type == TokenType.PARAMETER
             else self.keywords.get(self.sql[self._start : self._current].upper(), TokenType.VAR)
         )
 
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import codecs
 import threading
 import typing as t
+from mmap import mmap
 
+from sqlglot.errors import TokenError
 from sqlglot.trie import new_trie
 
-from sqlglot.tokenizer_core import Token, TokenizerCore, TokenType
+from sqlglot.tokenizer_core import Token, TokenBuffer, TokenizerCore, TokenType
 
 T = t.TypeVar("T")
 
@@ -42,6 +45,77 @@ except ImportError:
 if t.TYPE_CHECKING:
     from sqlglot.dialects.dialect import DialectType
 
+    TokenSource = t.Union[str, t.TextIO, bytes, bytearray, memoryview, mmap]
+
+
+def _text_reader(
+    source: TokenSource, encoding: str
+) -> tuple[t.Callable[[int], str], t.Callable[[], None]]:
+    """
+    Returns a function that reads up to `size` characters of `source` per call ("" at EOF),
+    along with a function that releases any resources held by the reader.
+    """
+    if isinstance(source, str):
+        position = 0
+
+        def read_str(size: int) -> str:
+            nonlocal position
+            text = source[position : position + size]
+            position += size
+            return text
+
+        return read_str, lambda: None
+
+    if isinstance(source, (bytes, bytearray, memoryview, mmap)):
+        # Bytes-like sources, e.g. mmap.mmap, are decoded incrementally so that the whole
+        # file is never materialized as a single str
+        view = memoryview(source)
+        decoder = codecs.getincrementaldecoder(encoding)()
+        offset = 0
+
+        def read_bytes(size: int) -> str:
+            nonlocal offset
+            text = ""
+            while not text and offset < len(view):
+                chunk = view[offset : offset + size]
+                offset += size
+                text = decoder.decode(chunk, final=offset >= len(view))
+            return text
+
+        return read_bytes, view.release
+
+    return source.read, lambda: None  # type: ignore[union-attr]
+
+
+class _ByteOffsets:
+    """
+    Wraps the reader of a bytes-like source, see `_text_reader`, to map the character offsets of
+    the text it reads to byte offsets in the source. The offsets must be mapped in increasing order,
+    so that only the text that follows the last mapped offset is kept.
+    """
+
+    __slots__ = ("read_text", "encoder", "text", "char_offset", "byte_offset")
+
+    def __init__(self, read: t.Callable[[int], str], encoding: str) -> None:
+        self.read_text = read
+        # Encoding the text back, instead of tracking the decoder, also accounts for any BOM
+        self.encoder = codecs.getincrementalencoder(encoding)()
+        self.text = ""
+        self.char_offset = 0
+        self.byte_offset = 0
+
+    def read(self, size: int) -> str:
+        text = self.read_text(size)
+        self.text += text
+        return text
+
+    def __call__(self, offset: int) -> int:
+        size = offset - self.char_offset
+        self.byte_offset += len(self.encoder.encode(self.text[:size]))
+        self.text = self.text[size:]
+        self.char_offset = offset
+        return self.byte_offset
+
 
 def _convert_quotes(arr: list[str | tuple[str, str]]) -> dict[str, str]:
     return dict((item, item) if isinstance(item, str) else (item[0], item[1]) for item in arr)
@@ -596,6 +670,189 @@ class Tokenizer(_TokenizerBase):
         """Returns a list of tokens corresponding to the SQL string `sql`."""
         return self._core.tokenize(sql)  # type: ignore
 
+    def tokenize_range(
+        self, sql: str, start: int = 0, stop: int = 0, line: int = 1, col: int = 0
+    ) -> list[Token]:
+        """
+        Returns the tokens of `sql` from offset `start` up to and including the first semicolon that
+        starts at or after offset `stop`, or up to the end of `sql` if there is none. The tokens and
+        their positions are the same as the ones `tokenize` would produce for the whole string,
+        unless `tokenize` is overridden to post-process them.
+
+        Args:
+            sql: the SQL code string.
+            start: a statement boundary, i.e. either 0 or the offset of a semicolon token.
+            stop: the offset from which on the first semicolon ends the range.
+            line: the line of the character at `start`.
+            col: the column of the character that precedes `start` in its line.
+
+        Returns:
+            The range's tokens.
+        """
+        return self._core.tokenize_range(sql, start, stop, line, col)  # type: ignore
+
+    def tokenize_buffer(self, sql: str) -> TokenBuffer:
+        """
+        Returns the tokens corresponding to the SQL string `sql` as a `TokenBuffer`, i.e. without
+        creating a `Token` object per token. The parser can consume the buffer directly, although
+        it materializes the tokens of each statement while parsing it, see `TokenBuffer`.
+        """
+        if type(self).tokenize is not Tokenizer.tokenize:
+            # Tokenizers that post-process the token list can only be buffered after the fact
+            return TokenBuffer.from_tokens(self.tokenize(sql), sql)
+        return self._core.tokenize_buffer(sql)
+
+    def iter_tokens(
+        self,
+        source: TokenSource,
+        chunk_size: int = 1 << 16,
+        encoding: str = "utf-8",
+    ) -> t.Iterator[Token]:
+        """
+        Lazily tokenizes `source`, yielding the same tokens as `tokenize` would for the whole text.
+
+        The source is consumed in chunks and tokens are yielded as soon as the statement they belong
+        to is terminated, so only the text that follows the last statement boundary seen so far is
+        held in memory. Peak memory thus depends on the longest statement, not on the size of `source`.
+
+        Args:
+            source: the SQL code, either as a string, a text stream or a bytes-like object such as
+                an `mmap.mmap` of a SQL file.
+            chunk_size: the number of characters (or bytes) to read from `source` at a time.
+            encoding: the encoding used to decode bytes-like sources.
+
+        Returns:
+            An iterator over the tokens of `source`.
+        """
+        read, release = _text_reader(source, encoding)
+
+        try:
+            yield from self._iter_tokens(read, chunk_size)
+        finally:
+            release()
+
+    def _iter_tokens(self, read: t.Callable[[int], str], chunk_size: int) -> t.Iterator[Token]:
+        core = self._core
+
+        buffer = ""
+        start_offset = 0
+        line_offset = 0
+        col_offset = 0
+
+        while True:
+            # The read size grows with the buffer so that long statements are rescanned a
+            # logarithmic number of times, keeping the total work linear in the source size
+            text = read(max(chunk_size, len(buffer)))
+            exhausted = not text
+            buffer += text
+
+            if not buffer:
+                return
+
+            try:
+                tokens: list[Token] = core.tokenize(buffer)  # type: ignore
+            except TokenError:
+                # The buffer may end in an unterminated string, comment etc
+                if exhausted:
+                    raise
+                continue
+
+            if exhausted:
+                cut = len(tokens)
+            else:
+                # Cut at the last semicolon: the tokens before it can't be affected by any text that
+                # follows, while the semicolon itself is rescanned so that it still gets any comments
+                # that trail it on the same line
+                cut = len(tokens) - 1
+                while cut > 0 and tokens[cut].token_type != TokenType.SEMICOLON:
+                    cut -= 1
+
+                if cut < 1:
+                    continue
+
+            for i in range(cut + (not exhausted)):
+                token = tokens[i]
+                if token.line == 1:
+                    token.col += col_offset
+                token.line += line_offset
+                token.start += start_offset
+                token.end += start_offset
+
+                if i < cut:
+                    yield token
+
+            if exhausted:
+                return
+
+            boundary = tokens[cut]
+            buffer = buffer[boundary.start - start_offset :]
+            start_offset = boundary.start
+            line_offset = boundary.line - 1
+            col_offset = boundary.col - 1
+
+    def split_statements(
+        self,
+        source: TokenSource,
+        chunk_size: int = 1 << 16,
+        encoding: str = "utf-8",
+    ) -> t.Iterator[tuple[int, int, TokenType]]:
+        """
+        Lazily splits `source` into statements without parsing it.
+
+        The statement boundaries are the semicolons found by the tokenizer, so quoting, heredocs,
+        (nested) comments and commands are handled exactly like they are when parsing. Statements
+        that contain no tokens, e.g. `;;`, are skipped.
+
+        Args:
+            source: the SQL code, either as a string, a text stream or a bytes-like object.
+            chunk_size: the number of characters (or bytes) to read from `source` at a time.
+            encoding: the encoding used to decode bytes-like sources.
+
+        Returns:
+            An iterator of `(start, end, leading_token_type)` tuples, one per statement, where
+            `source[start:end]` is the statement's text, excluding its leading comments and its
+            terminating semicolon, and `leading_token_type` is the type of its first token. The
+            offsets are byte offsets for bytes-like sources and character offsets otherwise, and
+            for text streams they're relative to the stream's position when the split started.
+        """
+        read, release = _text_reader(source, encoding)
+        offset: t.Callable[[int], int] | None = None
+
+        if isinstance(source, (bytes, bytearray, memoryview, mmap)):
+            byte_offsets = _ByteOffsets(read, encoding)
+            read = byte_offsets.read
+            offset = byte_offsets
+
+        first: Token | None = None
+        last: Token | None = None
+
+        try:
+            for token in self._iter_tokens(read, chunk_size):
+                if token.token_type == TokenType.SEMICOLON:
+                    if first and last:
+                        yield self._statement_span(first, last, offset)
+                    first = None
+                elif first:
+                    last = token
+                else:
+                    first = last = token
+
+            if first and last:
+                yield self._statement_span(first, last, offset)
+        finally:
+            release()
+
+    @staticmethod
+    def _statement_span(
+        first: Token, last: Token, offset: t.Callable[[int], int] | None
+    ) -> tuple[int, int, TokenType]:
+        start = first.start
+        end = last.end + 1
+        if offset is not None:
+            start = offset(start)
+            end = offset(end)
+        return start, end, first.token_type
+
     @property
     def sql(self) -> str:
         """The SQL string being tokenized."""
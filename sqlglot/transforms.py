@@ -236,10 +236,10 @@ def eliminate_qualify(expression: exp.Expr) -> exp.Expr:
         }
 
         select_candidates = (exp.Window,) if expression.is_star else (exp.Window, exp.Column)
-        for select_candidate in list(qualify_filters.find_all(*select_candidates)):
+        for select_candidate in qualify_filters.collect(*select_candidates):
             if isinstance(select_candidate, exp.Window):
                 if expression_by_alias:
-                    for column in select_candidate.find_all(exp.Column):
+                    for column in select_candidate.collect(exp.Column):
                         expr = expression_by_alias.get(column.name)
                         if expr:
                             column.replace(expr)
@@ -267,7 +267,7 @@ def remove_precision_parameterized_types(expression: exp.Expr) -> exp.Expr:
     Some dialects only allow the precision for parameterized types to be defined in the DDL and not in
     other expressions. This transforms removes the precision from parameterized types in expressions.
     """
-    for node in expression.find_all(exp.DataType):
+    for node in expression.collect(exp.DataType):
         node.set(
             "expressions", [e for e in node.expressions if not isinstance(e, exp.DataTypeParam)]
         )
@@ -277,16 +277,16 @@ def remove_precision_parameterized_types(expression: exp.Expr) -> exp.Expr:
 
 def unqualify_unnest(expression: exp.Expr) -> exp.Expr:
     """Remove references to unnest table aliases, added by the optimizer's qualify_columns step."""
-    from sqlglot.optimizer.scope import find_all_in_scope
+    from sqlglot.optimizer.scope import collect_in_scope
 
     if isinstance(expression, exp.Select):
         unnest_aliases = {
             unnest.alias
-            for unnest in find_all_in_scope(expression, exp.Unnest)
+            for unnest in collect_in_scope(expression, exp.Unnest)
             if isinstance(unnest.parent, (exp.From, exp.Join))
         }
         if unnest_aliases:
-            for column in expression.find_all(exp.Column):
+            for column in expression.collect(exp.Column):
                 leftmost_part = column.parts[0]
                 if leftmost_part.arg_key != "this" and leftmost_part.this in unnest_aliases:
                     leftmost_part.pop()
@@ -331,9 +331,10 @@ def unnest_to_explode(
             columns: list[exp.Identifier] = alias.columns if alias else []
             offset: exp.Expr | None = unnest.args.get("offset")
             if offset:
-                columns.insert(
-                    0, offset if isinstance(offset, exp.Identifier) else exp.to_identifier("pos")
-                )
+                columns = [
+                    offset if isinstance(offset, exp.Identifier) else exp.to_identifier("pos"),
+                    *columns,
+                ]
 
             unnest.replace(
                 exp.Table(
@@ -366,7 +367,7 @@ def unnest_to_explode(
                 has_multi_expr = len(exprs) > 1
                 exprs = _unnest_zip_exprs(unnest, exprs, has_multi_expr)
 
-                joins.remove(join)
+                join.pop()
 
                 alias_cols: list[exp.Identifier] = alias.columns
 
@@ -381,10 +382,10 @@ def unnest_to_explode(
 
                 offset = unnest.args.get("offset")
                 if offset:
-                    alias_cols.insert(
-                        0,
+                    alias_cols = [
                         offset if isinstance(offset, exp.Identifier) else exp.to_identifier("pos"),
-                    )
+                        *alias_cols,
+                    ]
 
                 for e, column in zip(exprs, alias_cols):
                     expression.append(
@@ -491,16 +492,16 @@ def explode_projection_to_unnest(
 
                     if is_posexplode:
                         expressions = expression.expressions
-                        expressions.insert(
-                            expressions.index(alias) + 1,
-                            exp.If(
-                                this=exp.column(series_alias, table=series_table_alias).eq(
-                                    exp.column(pos_alias, table=unnest_source_alias)
-                                ),
-                                true=exp.column(pos_alias, table=unnest_source_alias),
-                            ).as_(pos_alias),
+                        index = expressions.index(alias) + 1
+                        pos_column = exp.If(
+                            this=exp.column(series_alias, table=series_table_alias).eq(
+                                exp.column(pos_alias, table=unnest_source_alias)
+                            ),
+                            true=exp.column(pos_alias, table=unnest_source_alias),
+                        ).as_(pos_alias)
+                        expression.set(
+                            "expressions", [*expressions[:index], pos_column, *expressions[index:]]
                         )
-                        expression.set("expressions", expressions)
 
                     if not arrays:
                         if expression.args.get("from_"):
@@ -697,9 +698,9 @@ def move_ctes_to_top_level(expression: E) -> E:
             inner_with.pop()
 
             if parent_cte:
-                i = top_level_with.expressions.index(parent_cte)
-                top_level_with.expressions[i:i] = inner_with.expressions
-                top_level_with.set("expressions", top_level_with.expressions)
+                ctes = top_level_with.expressions
+                i = ctes.index(parent_cte)
+                top_level_with.set("expressions", [*ctes[:i], *inner_with.expressions, *ctes[i:]])
             else:
                 top_level_with.set(
                     "expressions", top_level_with.expressions + inner_with.expressions
@@ -730,7 +731,7 @@ def ensure_bools(expression: exp.Expr) -> exp.Expr:
 
 
 def unqualify_columns(expression: exp.Expr) -> exp.Expr:
-    for column in expression.find_all(exp.Column):
+    for column in expression.collect(exp.Column):
         # We only wanna pop off the table, db, catalog args
         for part in column.parts[:-1]:
             part.pop()
@@ -740,7 +741,7 @@ def unqualify_columns(expression: exp.Expr) -> exp.Expr:
 
 def remove_unique_constraints(expression: exp.Expr) -> exp.Expr:
     assert isinstance(expression, exp.Create)
-    for constraint in expression.find_all(exp.UniqueColumnConstraint):
+    for constraint in expression.collect(exp.UniqueColumnConstraint):
         if constraint.parent:
             constraint.parent.pop()
 
@@ -897,7 +898,7 @@ def eliminate_join_marks(expression: exp.Expr) -> exp.Expr:
         # dict of {name: list of join AND conditions}
         joins_ons: defaultdict[str, list[exp.Expr]] = defaultdict(list)
         for cond in [where] if not isinstance(where, exp.And) else where.flatten():
-            join_cols = [col for col in cond.find_all(exp.Column) if col.args.get("join_mark")]
+            join_cols = [col for col in cond.collect(exp.Column) if col.args.get("join_mark")]
 
             left_join_table = set(col.table for col in join_cols)
             if not left_join_table:
@@ -985,7 +986,7 @@ def eliminate_window_clause(expression: exp.Expr) -> exp.Expr:
     """Eliminates the `WINDOW` query clause by inling each named window."""
     windows: list[exp.Expr] | None = expression.args.get("windows")
     if isinstance(expression, exp.Select) and windows is not None:
-        from sqlglot.optimizer.scope import find_all_in_scope
+        from sqlglot.optimizer.scope import collect_in_scope
 
         expression.set("windows", None)
 
@@ -1006,7 +1007,7 @@ def eliminate_window_clause(expression: exp.Expr) -> exp.Expr:
             _inline_inherited_window(window)
             window_expression[window.name.lower()] = window
 
-        for window in find_all_in_scope(expression, exp.Window):
+        for window in collect_in_scope(expression, exp.Window):
             _inline_inherited_window(window)
 
     return expression
@@ -102,7 +102,7 @@ def _annotate_by_args_with_coerce(self: TypeAnnotator, expression: exp.Expr) ->
 def _annotate_by_args_approx_top(self: TypeAnnotator, expression: exp.ApproxTopK) -> exp.ApproxTopK:
     struct_type = exp.DataType(
         this=exp.DType.STRUCT,
-        expressions=[expression.this.type, exp.DataType(this=exp.DType.BIGINT)],
+        expressions=[expression.this.type.copy(), exp.DataType(this=exp.DType.BIGINT)],
         nested=True,
     )
     self._set_type(
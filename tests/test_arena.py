@@ -0,0 +1,96 @@
+import unittest
+
+from sqlglot import exp, parse_one
+from sqlglot.arena import Arena, ArenaNode
+from sqlglot.optimizer import optimize
+from sqlglot.serde import load_binary, dump_binary
+from tests.helpers import load_sql_fixtures
+
+
+class TestArena(unittest.TestCase):
+    def test_round_trip(self):
+        for sql in load_sql_fixtures("identity.sql"):
+            with self.subTest(sql):
+                expression = parse_one(sql)
+                arena = Arena.from_expression(expression)
+                converted = arena.to_expression()
+
+                self.assertEqual(repr(converted), repr(expression))
+                self.assertEqual(arena.sql(), expression.sql())
+                self.assertEqual(len(arena), sum(1 for _ in expression.walk()))
+
+    def test_walk(self):
+        expression = parse_one(
+            "WITH x AS (SELECT a FROM t) SELECT x.a, SUM(b) FROM x JOIN y ON x.a = y.a WHERE c > 1"
+        )
+        arena = Arena.from_expression(expression)
+
+        for bfs in (True, False):
+            self.assertEqual(
+                [(node.key, node.arg_key, node.index) for node in arena.walk(bfs=bfs)],
+                [(node.key, node.arg_key, node.index) for node in expression.walk(bfs=bfs)],
+            )
+            self.assertEqual(
+                [node.sql() for node in arena.find_all(exp.Column, exp.Table, bfs=bfs)],
+                [node.sql() for node in expression.find_all(exp.Column, exp.Table, bfs=bfs)],
+            )
+
+        pruned = [node.key for node in arena.walk(prune=lambda node: node.is_type(exp.CTE))]
+        self.assertEqual(
+            pruned,
+            [node.key for node in expression.walk(prune=lambda node: isinstance(node, exp.CTE))],
+        )
+
+        where = arena.find(exp.Where)
+        self.assertIsInstance(where, ArenaNode)
+        self.assertEqual(where, ArenaNode(arena, where.position))
+        self.assertEqual(where.parent, arena.root)
+        self.assertEqual(where.this.key, "gt")
+        self.assertEqual([child.key for child in where.this.children()], ["column", "literal"])
+        self.assertEqual(where.this.to_expression().sql(), "c > 1")
+        self.assertIsNone(arena.root.parent)
+        self.assertIsNone(arena.find(exp.Window))
+
+        self.assertEqual(
+            [column.name for column in arena.find_all(exp.Column)],
+            [column.name for column in expression.find_all(exp.Column)],
+        )
+        self.assertEqual(arena.find(exp.Literal).args, {"this": "1", "is_string": False})
+
+    def test_comments_meta_types(self):
+        expression = optimize(
+            parse_one("SELECT a /* x */ + 1 AS b FROM t"), schema={"t": {"a": "int"}}
+        )
+        expression.selects[0].meta["line"] = 1
+
+        arena = Arena.from_expression(expression, meta=True)
+        converted = arena.to_expression()
+
+        self.assertEqual(converted.sql(), expression.sql())
+        self.assertEqual(arena.find(exp.Column).comments, [" x "])
+        self.assertEqual(arena.find(exp.Alias).type.sql(), "INT")
+        self.assertEqual(converted.selects[0].type, expression.selects[0].type)
+        self.assertEqual(converted.selects[0].meta, {"line": 1})
+        self.assertFalse(Arena.from_expression(expression).to_expression().selects[0].meta)
+
+    def test_shape_pool(self):
+        shape_pool: dict = {}
+        first = Arena.from_expression(parse_one("SELECT a FROM t"), shape_pool=shape_pool)
+        second = Arena.from_expression(parse_one("SELECT a FROM u"), shape_pool=shape_pool)
+
+        self.assertIs(first.find(exp.Column).this.arena, first)
+        self.assertIs(
+            first.shape_table[first.shapes[first.find(exp.Column).this.position]],
+            second.shape_table[second.shapes[second.find(exp.Column).this.position]],
+        )
+        self.assertEqual(second.sql(), "SELECT a FROM u")
+
+        # Equal but differently typed values aren't conflated
+        literals = [exp.Literal(this=1, is_string=False), exp.Literal(this=True, is_string=False)]
+        arena = Arena.from_expression(exp.Tuple(expressions=literals))
+        self.assertEqual(len(arena.shape_table), 3)
+
+    def test_lazy(self):
+        expression = parse_one("SELECT * FROM (SELECT a FROM t) AS x")
+        lazy = load_binary(dump_binary(expression), lazy=True)
+        self.assertEqual(Arena.from_expression(lazy).to_expression(), expression)
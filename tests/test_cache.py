@@ -0,0 +1,84 @@
+import unittest
+
+from sqlglot import ErrorLevel, exp, parse, parse_one, transpile
+from sqlglot.cache import ParseCache, disable_parse_cache, enable_parse_cache
+from sqlglot.dialects import DuckDB, MySQL, Postgres
+from sqlglot.errors import MutationError
+
+
+class TestCache(unittest.TestCase):
+    def tearDown(self):
+        disable_parse_cache()
+
+    def test_parse_cache(self):
+        cache = enable_parse_cache()
+
+        first = parse_one("SELECT a FROM t")
+        second = parse_one("SELECT a FROM t")
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertEqual(second.meta, first.meta)
+
+        first.set("where", exp.column("x"))
+        self.assertEqual(parse_one("SELECT a FROM t").sql(), "SELECT a FROM t")
+        self.assertEqual(cache.info()[:3], (2, 1, 0))
+
+        parse_one("SELECT a FROM t", read=DuckDB)
+        parse_one("SELECT a FROM t", read=MySQL(normalization_strategy="case_sensitive"))
+        parse_one("SELECT a FROM t", into=exp.Select)
+        parse("SELECT a FROM t", error_level=ErrorLevel.RAISE)
+        self.assertEqual(cache.info()[:3], (2, 5, 0))
+
+        self.assertEqual(transpile("SELECT a FROM t; SELECT b"), ["SELECT a FROM t", "SELECT b"])
+        self.assertEqual(transpile("SELECT a FROM t; SELECT b"), ["SELECT a FROM t", "SELECT b"])
+        self.assertEqual(cache.info()[:3], (3, 6, 0))
+
+    def test_parse_cache_read_only(self):
+        cache = enable_parse_cache(copy=False)
+        expression = parse_one("SELECT a FROM t")
+        self.assertIs(expression, parse_one("SELECT a FROM t"))
+
+        with self.assertRaises(MutationError):
+            expression.set("where", exp.column("x"))
+        with self.assertRaises(MutationError):
+            expression.find(exp.Column).replace(exp.column("b"))
+        with self.assertRaises(MutationError):
+            exp.Subquery(this=expression)
+
+        self.assertEqual(parse_one("SELECT a FROM t").sql(), "SELECT a FROM t")
+        self.assertEqual(transpile("SELECT a FROM t", write="tsql"), ["SELECT a FROM t"])
+        self.assertEqual(expression.copy().where("x").sql(), "SELECT a FROM t WHERE x")
+        self.assertEqual(expression.where("x").sql(), "SELECT a FROM t WHERE x")
+
+        # Trees are only read-only while they're cached
+        cache.clear()
+        self.assertEqual(exp.MUTATION_GUARD.roots, {})
+        expression.where("x", copy=False)
+        self.assertEqual(expression.sql(), "SELECT a FROM t WHERE x")
+
+        parse_one("SELECT a FROM t")
+        disable_parse_cache()
+        self.assertEqual(exp.MUTATION_GUARD.roots, {})
+
+    def test_parse_cache_eviction(self):
+        cache = ParseCache(max_nodes=16)
+        dialect = Postgres()
+
+        cache.parse(dialect, "SELECT 1")
+        cache.parse(dialect, "SELECT 2")
+        cache.parse(dialect, "SELECT 1")
+        cache.parse(dialect, "SELECT a, b, c, d, e FROM t")
+        self.assertEqual(cache.info(), (1, 3, 1, 2, 16, 16))
+
+        # SELECT 1 was the most recently used entry, so SELECT 2 was evicted
+        cache.parse(dialect, "SELECT 1")
+        self.assertEqual(cache.info()[:3], (2, 3, 1))
+
+        cache.parse(dialect, " UNION ".join(f"SELECT {i}" for i in range(10)))
+        self.assertEqual(cache.info()[:5], (2, 4, 1, 2, 16))
+
+        cache.parse(dialect, "SELECT (", {"error_level": ErrorLevel.IGNORE})
+        self.assertEqual(len(cache), 2)
+
+        cache.clear()
+        self.assertEqual(cache.info(), (0, 0, 0, 0, 0, 16))
@@ -2,8 +2,11 @@ import datetime
 import math
 import sys
 import unittest
+from copy import deepcopy
 
 from sqlglot import ParseError, alias, exp, parse_one
+from sqlglot.errors import MutationError
+from sqlglot.helper import ensure_list
 
 
 class TestExprs(unittest.TestCase):
@@ -133,6 +136,66 @@ class TestExprs(unittest.TestCase):
             ["a", "b", "c", "d"],
         )
 
+    def test_index_nodes(self):
+        sql = "SELECT a, (SELECT b FROM u WHERE c = 1) AS d FROM t JOIN v ON t.x = v.x WHERE e > 1"
+        columns = " ".join(f"c{i}" for i in range(20))
+        expression = exp.index_nodes(parse_one(f"{sql} ORDER BY {columns.replace(' ', ', ')}"))
+        expected = expression.copy()
+        self.assertIsNotNone(expression._node_index)
+        self.assertIsNone(expected._node_index)
+
+        def assert_found(*types):
+            for bfs in (True, False):
+                self.assertEqual(
+                    [id(node) for node in expression.find_all(*types, bfs=bfs)],
+                    [id(node) for node in expression.walk(bfs=bfs) if isinstance(node, types)],
+                )
+
+        assert_found(exp.Where)
+        assert_found(exp.Table, exp.Subquery)
+        assert_found(exp.Literal)
+        assert_found(exp.Column)
+        self.assertIsNotNone(expression._node_index.find_all((exp.Table,)))
+        self.assertIsNone(expression._node_index.find_all((exp.Expression,)))
+        self.assertEqual(expression.find(exp.Where).sql(), "WHERE e > 1")
+        self.assertEqual(expression.find(exp.Where, bfs=False).sql(), "WHERE c = 1")
+
+        expression.find(exp.Subquery).pop()
+        expression.find(exp.Join).replace(exp.Join(this=exp.to_table("w")))
+        expression.append("joins", exp.Join(this=exp.to_table("x")))
+        expression.find(exp.Where).this.set("expression", exp.Literal.number(2))
+        expression.set("group", exp.Group(expressions=[exp.column("g")]))
+        expression.set("expressions", exp.Literal.number(3), index=0)
+        expression.set("expressions", None, index=0)
+        expression.find(exp.Order).set("expressions", exp.column("o"), index=1, overwrite=False)
+
+        assert_found(exp.Table)
+        assert_found(exp.Literal)
+        assert_found(exp.Where)
+        assert_found(exp.Group, exp.Subquery)
+        assert_found(exp.Ordered)
+        self.assertEqual([table.name for table in expression.find_all(exp.Table)], ["t", "w", "x"])
+
+        # Nodes moved out of the tree behind the index's back aren't found
+        where = expression.args.pop("where")
+        self.assertNotIn(where, expression.find_all(exp.Where))
+        assert_found(exp.Where, exp.Literal)
+
+        # Trees that are attached to another tree are no longer indexed separately
+        table = exp.index_nodes(exp.to_table("y"))
+        expression.find(exp.Join).set("this", table)
+        self.assertIs(table._node_index, expression._node_index)
+        assert_found(exp.Table)
+
+        # Nodes that are moved into a new node before their old parent is detached stay indexed
+        expression = exp.index_nodes(parse_one("SELECT a FROM t WHERE b = 1"))
+        expression.set("having", exp.Having(this=expression.find(exp.EQ)))
+        expression.set("where", None)
+        assert_found(exp.Column)
+        assert_found(exp.Where, exp.Having)
+
+        self.assertEqual(expected.find(exp.Where).sql(), "WHERE e > 1")
+
     def test_find_ancestor(self):
         column = parse_one("select * from foo where (a + 1 > 2)").find(exp.Column)
         self.assertIsInstance(column, exp.Column)
@@ -535,6 +598,130 @@ class TestExprs(unittest.TestCase):
         expr.append("expressions", exp.column("b"))
         self.assertEqual(hash(expr), hash(parse_one("SELECT a, b")))
 
+    def test_hash_stats(self):
+        expr = parse_one("SELECT a + 1 FROM t WHERE b > 2")
+
+        with exp.hash_stats() as stats:
+            hash(expr)
+            hash(expr)
+        self.assertEqual((stats.rehashed, stats.invalidated, stats.version), (13, 0, 0))
+
+        # Only the mutated node and its ancestors are rehashed
+        with exp.hash_stats() as stats:
+            expr.find(exp.GT).set("expression", exp.Literal.number(3))
+            hash(expr)
+        self.assertEqual((stats.rehashed, stats.invalidated, stats.version), (4, 3, 1))
+        self.assertEqual(expr, parse_one("SELECT a + 1 FROM t WHERE b > 3"))
+
+    def test_guard_mutations(self):
+        expr = parse_one("SELECT a /* c */ FROM t WHERE b > 2")
+        column = expr.find(exp.Column)
+        gt = expr.find(exp.GT)
+        dtype = exp.DataType.build("int")
+        column.type = dtype
+        trips = exp.MUTATION_GUARD.trips
+
+        with exp.guard_mutations(expr, dtype) as guard:
+            mutations = (
+                lambda: gt.set("expression", exp.Literal.number(3)),
+                lambda: expr.append("expressions", exp.column("c")),
+                lambda: column.pop(),
+                lambda: column.add_comments(["d"]),
+                lambda: column.pop_comments(),
+                lambda: setattr(column, "type", "text"),
+                lambda: dtype.set("nested", True),
+                # New nodes can't adopt guarded ones either
+                lambda: exp.Paren(this=gt),
+            )
+            for mutation in mutations:
+                with self.assertRaises(MutationError):
+                    mutation()
+
+            # Mutations that would leave the tree as is are allowed
+            gt.set("expression", gt.expression)
+            gt.set("unknown", None)
+            gt.add_comments(None)
+            self.assertEqual(gt.pop_comments(), [])
+
+            # And so are mutations of new trees, even if they're equal to guarded ones
+            copy = expr.copy()
+            copy.find(exp.GT).set("expression", exp.Literal.number(3))
+            exp.Paren(this=copy.find(exp.GT))
+
+            with exp.guard_mutations(expr):
+                pass
+
+            with self.assertRaises(MutationError):
+                gt.pop()
+
+        self.assertEqual(guard.trips, trips + 9)
+        self.assertEqual(guard.roots, {})
+        self.assertEqual(expr.sql(), "SELECT a /* c */ FROM t WHERE b > 2")
+        self.assertIs(column.type, dtype)
+        self.assertFalse(dtype.args.get("nested"))
+
+        gt.set("expression", exp.Literal.number(3))
+        self.assertEqual(expr.sql(), "SELECT a /* c */ FROM t WHERE b > 3")
+
+    def test_copy(self):
+        expression = parse_one("SELECT a /* c */, CAST(b AS INT) FROM x WHERE y IN (1, 2)")
+        dtype = exp.DataType.build("int")
+        for column in expression.find_all(exp.Column):
+            column.type = dtype
+        expression.find(exp.Where).meta["final"] = True
+        expression.find(exp.Table).meta["types"] = [dtype]
+
+        copy = expression.copy()
+        self.assertEqual(copy, expression)
+        self.assertIsNone(copy.parent)
+
+        for node, copied in zip(expression.walk(), copy.walk()):
+            self.assertIsNot(node, copied)
+            self.assertIs(type(node), type(copied))
+            self.assertEqual(node.comments, copied.comments)
+            self.assertEqual(node.meta, copied.meta)
+            self.assertEqual(node.type, copied.type)
+
+            if node.parent:
+                self.assertEqual(node.arg_key, copied.arg_key)
+                self.assertEqual(node.index, copied.index)
+                self.assertTrue(
+                    any(v is copied for v in ensure_list(copied.parent.args[copied.arg_key]))
+                )
+
+        columns = list(copy.find_all(exp.Column))
+        self.assertIsNot(columns[0].type, dtype)
+        self.assertIs(columns[0].type, columns[1].type)
+        self.assertIsNot(copy.find(exp.Table).meta["types"][0], dtype)
+
+        copy.expressions[0].comments.append("d")
+        copy.find(exp.Where).meta["final"] = False
+        columns[0].type.set("this", exp.DataType.Type.TEXT)
+        self.assertEqual(expression.expressions[0].comments, [" c "])
+        self.assertTrue(expression.find(exp.Where).meta["final"])
+        self.assertTrue(dtype.is_type("int"))
+        self.assertEqual(copy.copy(), copy)
+        self.assertEqual(deepcopy(expression), expression)
+
+    def test_deepcopy_memo(self):
+        expression = parse_one("SELECT a FROM (SELECT a FROM x) AS y")
+        subquery = expression.find(exp.Subquery)
+        dtype = exp.DataType.build("int")
+        expression.selects[0].type = dtype
+
+        # Trees reached several times are copied once, and subtrees copied on their own first
+        # are adopted by the copies of their parents
+        subquery_copy, expression_copy, dtype_copy, again = deepcopy(
+            [subquery, expression, dtype, expression]
+        )
+        self.assertIs(again, expression_copy)
+        self.assertIs(expression_copy.find(exp.Subquery), subquery_copy)
+        self.assertIs(subquery_copy.parent, expression_copy.args["from_"])
+        self.assertIs(expression_copy.selects[0].type, dtype_copy)
+        self.assertIsNot(dtype_copy, dtype)
+        self.assertEqual(expression_copy, expression)
+        self.assertIs(subquery.parent, expression.args["from_"])
+
     def test_sql(self):
         self.assertEqual(parse_one("x + y * 2").sql(), "x + y * 2")
         self.assertEqual(parse_one('select "x"').sql(dialect="hive", pretty=True), "SELECT\n  `x`")
@@ -676,6 +863,88 @@ class TestExprs(unittest.TestCase):
         self.assertTrue(all(isinstance(e, exp.Expr) for e in expression.walk()))
         self.assertTrue(all(isinstance(e, exp.Expr) for e in expression.walk(bfs=False)))
 
+    def test_collect(self):
+        expression = parse_one("SELECT a, SUM(b + 1) FROM (SELECT c FROM x) WHERE d IN (1, 2)")
+
+        def prune(node):
+            return isinstance(node, exp.Subquery)
+
+        for bfs in (True, False):
+            self.assertEqual(expression.collect(bfs=bfs), list(expression.walk(bfs=bfs)))
+            self.assertEqual(
+                expression.collect(exp.Column, exp.Literal, bfs=bfs),
+                list(expression.find_all(exp.Column, exp.Literal, bfs=bfs)),
+            )
+            self.assertEqual(
+                expression.collect(bfs=bfs, prune=prune),
+                list(expression.walk(bfs=bfs, prune=prune)),
+            )
+
+        self.assertEqual(
+            [column.name for column in expression.collect(exp.Column, prune=prune)],
+            ["a", "b", "d"],
+        )
+
+    def test_map_in_place(self):
+        expression = parse_one("SELECT a, b FROM x")
+
+        def fun(node):
+            if isinstance(node, exp.Column):
+                return exp.column(node.name.upper())
+            return None if isinstance(node, exp.From) else node
+
+        self.assertIs(expression.map_in_place(fun), expression)
+        self.assertEqual(expression.sql(), "SELECT A, B")
+
+        self.assertEqual(exp.column("a").map_in_place(lambda n: exp.column("b")).sql(), "b")
+
+    def test_visitor(self):
+        class Visitor(exp.Visitor):
+            def __init__(self):
+                self.visited = []
+
+            def generic_visit(self, node):
+                self.visited.append(node.key)
+
+            def visit_func(self, node):
+                self.visited.append(f"func:{node.key}")
+
+            def visit_aggfunc(self, node):
+                self.visited.append(f"agg:{node.key}")
+                return True
+
+            def visit_query(self, node):
+                self.visited.append(f"query:{node.key}")
+
+        expression = parse_one("SELECT SUM(a), UPPER(b) FROM (SELECT 1) AS x")
+
+        visitor = Visitor()
+        visitor.visit(expression)
+        self.assertEqual(
+            visitor.visited,
+            [
+                "query:select",
+                "agg:sum",
+                "func:upper",
+                "from",
+                "column",
+                "query:subquery",
+                "identifier",
+                "query:select",
+                "tablealias",
+                "literal",
+                "identifier",
+            ],
+        )
+
+        visitor = Visitor()
+        visitor.visit(expression.selects[1], bfs=False)
+        self.assertEqual(visitor.visited, ["func:upper", "column", "identifier"])
+
+        self.assertIs(Visitor._dispatch[exp.Select], Visitor.visit_query)
+        self.assertIs(Visitor._dispatch[exp.Column], Visitor.generic_visit)
+        self.assertIsNot(Visitor._dispatch, exp.Visitor._dispatch)
+
     def test_str_position_order(self):
         str_position_exp = parse_one("STR_POSITION('mytest', 'test')")
         self.assertIsInstance(str_position_exp, exp.StrPosition)
@@ -1,8 +1,14 @@
+import io
 import unittest
 
 from sqlglot import exp, parse_one
+from sqlglot.dialects import Dialect
+from sqlglot.errors import ErrorLevel, UnsupportedError
 from sqlglot.expressions import Expression, Func
+from sqlglot.generator import GenerationCache, Generator
 from sqlglot.parsers.snowflake import SnowflakeParser
+from sqlglot.serde import dump
+from tests.helpers import load_sql_fixture_pairs, load_sql_fixtures
 
 import sqlglot.expressions.core as _core_module
 
@@ -56,6 +62,215 @@ class TestGenerator(unittest.TestCase):
         sql = "SELECT 'foo'" + (" || 'foo'" * 1000)
         self.assertEqual(parse_one(sql).sql(copy=False), sql)
 
+    def test_indent(self):
+        generator = Generator(pretty=True)
+        self.assertEqual(generator.indent("a\nb"), "  a\n  b")
+        self.assertEqual(generator.indent("a\n\nb", level=1, pad=0), "  a\n  \n  b")
+        self.assertEqual(generator.indent("\na\n", skip_first=True, skip_last=True), "\n  a\n")
+        self.assertEqual(generator.indent("\na", skip_last=True), "  \na")
+        self.assertEqual(generator.indent("a", skip_first=True), "a")
+        self.assertEqual(generator.indent("a", skip_last=True), "a")
+        self.assertEqual(generator.indent("a\nb", pad=0), "a\nb")
+        self.assertEqual(Generator().indent("a\nb"), "a\nb")
+
+        # Each level of nesting indents the queries it wraps
+        sql = "SELECT * FROM " + "(SELECT * FROM " * 3 + "t" + ")" * 3
+        self.assertEqual(
+            parse_one(sql).sql(pretty=True),
+            """SELECT
+  *
+FROM (
+  SELECT
+    *
+  FROM (
+    SELECT
+      *
+    FROM (
+      SELECT
+        *
+      FROM t
+    )
+  )
+)""",
+        )
+
+        # Nested queries are only indented once the SQL is complete, but their width accounts for it
+        self.assertEqual(
+            parse_one("SELECT COALESCE((SELECT a FROM (SELECT a FROM t)), b)").sql(
+                pretty=True, max_text_width=62
+            ),
+            """SELECT
+  COALESCE((
+    SELECT
+      a
+    FROM (
+      SELECT
+        a
+      FROM t
+    )
+  ), b)""",
+        )
+
+        # Line breaks in strings aren't indented, so the nested queries in them are indented first
+        self.assertEqual(
+            parse_one("CREATE TABLE IF NOT EXISTS x AS SELECT * FROM (SELECT a FROM t)").sql(
+                "tsql", pretty=True
+            ),
+            """IF NOT EXISTS (SELECT * FROM INFORMATION_SCHEMA.TABLES WHERE TABLE_NAME = 'x') EXEC('SELECT
+  *
+INTO x
+FROM (
+  SELECT
+    *
+  FROM (
+    SELECT
+      a
+    FROM t
+  )
+) AS temp')""",
+        )
+
+    def test_generate_to(self):
+        values = ", ".join(f"({i}, 'a{i}' /* c{i} */)" for i in range(20))
+        projections = ", ".join(f"c{i} + {i} AS c{i}" for i in range(20))
+        sqls = [
+            f"INSERT INTO t VALUES {values}",
+            f"VALUES {values}",
+            f"SELECT {projections} FROM t",
+            "SELECT 1 /* a */ UNION ALL (SELECT 2 UNION SELECT 3) ORDER BY 1 LIMIT 2",
+            "INSERT INTO t SELECT 1 UNION ALL SELECT 2",
+            "CREATE TABLE t (a INT) PARTITIONED BY (b STRING) LOCATION 's3://bucket/t'",
+            "SELECT SUM(x) / y FROM t",
+            "SELECT a, (SELECT b FROM (SELECT b FROM u)) AS c FROM t",
+            *load_sql_fixtures("identity.sql"),
+            *(sql for _, sql, _ in load_sql_fixture_pairs("pretty.sql")),
+        ]
+
+        for dialect in ("", "tsql", "athena"):
+            for sql in sqls:
+                with self.subTest(sql=sql, dialect=dialect):
+                    expression = parse_one(sql)
+
+                    for pretty in (False, True):
+                        for leading_comma in (False, True):
+                            opts = {
+                                "pretty": pretty,
+                                "leading_comma": leading_comma,
+                                "unsupported_level": ErrorLevel.IGNORE,
+                            }
+                            buffer = io.StringIO()
+                            fragments: list[str] = []
+                            Dialect.get_or_raise(dialect).generate_to(expression, buffer, **opts)
+                            Dialect.get_or_raise(dialect).generate_to(expression, fragments, **opts)
+                            generated = expression.sql(dialect, **opts)
+
+                            self.assertEqual(buffer.getvalue(), generated)
+                            self.assertEqual("".join(fragments), generated)
+
+        # The rows of a VALUES and the operands of a set operation are written one at a time
+        fragments = []
+        Generator().generate_to(parse_one(sqls[0]), fragments)
+        self.assertEqual(len(fragments), 21)
+
+        fragments = []
+        Generator(pretty=True).generate_to(parse_one(sqls[3]), fragments)
+        self.assertEqual(
+            fragments,
+            [
+                "SELECT\n  1 /* a */",
+                "\nUNION ALL",
+                "\n(\n  SELECT\n    2\n  UNION\n  SELECT\n    3\n)",
+                "\nORDER BY\n  1\nLIMIT 2",
+            ],
+        )
+
+    def test_generation_cache(self):
+        cache = GenerationCache(max_size=3)
+        expression = parse_one("SELECT a, SUM(b) FROM t GROUP BY a")
+
+        for _ in range(2):
+            self.assertEqual(expression.sql(cache=cache), "SELECT a, SUM(b) FROM t GROUP BY a")
+            self.assertEqual(
+                expression.sql("tsql", cache=cache), "SELECT a, SUM(b) FROM t GROUP BY a"
+            )
+            self.assertEqual(expression.selects[1].sql(cache=cache), "SUM(b)")
+
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (3, 3, 3))
+        self.assertEqual(cache.hit_rate, 0.5)
+
+        # Equal trees share their entries, unlike trees generated with different options
+        self.assertEqual(
+            parse_one("SELECT a, SUM(b) FROM t GROUP BY a").sql(cache=cache), expression.sql()
+        )
+        self.assertEqual(expression.sql(pretty=True, cache=cache), expression.sql(pretty=True))
+        self.assertEqual((cache.hits, cache.misses, cache.evictions), (4, 4, 1))
+
+        # Mutations reset the hashes the entries are keyed on
+        expression.find(exp.Table).set("this", exp.to_identifier("u"))
+        self.assertEqual(expression.sql(cache=cache), "SELECT a, SUM(b) FROM u GROUP BY a")
+
+        # Changes that don't affect the hash are caught by comparing the trees
+        expression.selects[0].add_comments(["c"])
+        self.assertEqual(expression.sql(cache=cache), "SELECT a /* c */, SUM(b) FROM u GROUP BY a")
+        expression.find(exp.Table).this.set("quoted", True)
+        expression.selects[0].comments = None
+        column = expression.find(exp.Column)
+        self.assertEqual(column.sql(cache=cache), "a")
+        column.this.set("this", "A")
+        self.assertEqual(column.sql(cache=cache), "A")
+        self.assertEqual(expression.sql(cache=cache), 'SELECT A, SUM(b) FROM "u" GROUP BY a')
+
+        # Subtrees generated in place aren't cached, since their SQL may depend on their ancestors
+        misses = cache.misses
+        Generator(cache=cache).generate(column, copy=False)
+        self.assertEqual(cache.misses, misses)
+
+        # Unsupported messages are reported on hits too
+        cache.clear()
+        hits = cache.hits
+        unsupported = parse_one("SELECT FORMAT(12332.2, 2, 'de_DE')", read="mysql")
+        for _ in range(2):
+            with self.assertRaises(UnsupportedError):
+                unsupported.sql("duckdb", unsupported_level=ErrorLevel.RAISE, cache=cache)
+        self.assertEqual(cache.hits, hits + 1)
+
+        # Including those stored by a generation that didn't raise
+        cache.clear()
+        unsupported.sql("duckdb", unsupported_level=ErrorLevel.IGNORE, cache=cache)
+        with self.assertRaises(UnsupportedError) as uncached:
+            unsupported.sql("duckdb", unsupported_level=ErrorLevel.IMMEDIATE)
+        with self.assertRaises(UnsupportedError) as cached:
+            unsupported.sql("duckdb", unsupported_level=ErrorLevel.IMMEDIATE, cache=cache)
+        self.assertEqual(str(cached.exception), str(uncached.exception))
+        self.assertEqual(cache.hits, hits + 2)
+
+    def test_generate_in_place(self):
+        # Trees are generated without being copied unless the dialect mutates them
+        fixtures = load_sql_fixture_pairs("optimizer/tpc-ds/tpc-ds.sql")
+        queries = [query for _, query, _ in fixtures][:20]
+
+        for dialect in ("duckdb", "postgres", "spark", "tsql"):
+            generator = Dialect.get_or_raise(dialect).generator
+
+            for query in queries:
+                with self.subTest(dialect=dialect, query=query):
+                    expression = parse_one(query)
+                    before = dump(expression)
+                    self.assertEqual(
+                        generator().generate(expression),
+                        generator().generate(expression.copy(), copy=False),
+                    )
+                    self.assertEqual(dump(expression), before)
+
+        expression = parse_one("SELECT a FROM t LIMIT 1")
+        trips = exp.MUTATION_GUARD.trips
+        self.assertEqual(expression.sql("duckdb"), "SELECT a FROM t LIMIT 1")
+        self.assertEqual(exp.MUTATION_GUARD.trips, trips)
+
+        # T-SQL moves the limit, so the tree is copied after all
+        self.assertEqual(expression.sql("tsql"), "SELECT TOP 1 a FROM t")
+        self.assertEqual(expression.sql(), "SELECT a FROM t LIMIT 1")
+
     def test_overlap_operator(self):
         for op in ("&<", "&>"):
             with self.subTest(op=op):
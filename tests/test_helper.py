@@ -1,6 +1,7 @@
 import unittest
 
-from sqlglot.helper import merge_ranges, name_sequence, tsort
+from sqlglot import exp, parse_one
+from sqlglot.helper import merge_ranges, name_sequence, tsort, while_changing
 
 
 class TestHelper(unittest.TestCase):
@@ -46,3 +47,22 @@ class TestHelper(unittest.TestCase):
         self.assertEqual([(0, 1), (2, 3)], merge_ranges([(0, 1), (2, 3)]))
         self.assertEqual([(0, 3)], merge_ranges([(0, 1), (1, 3)]))
         self.assertEqual([(0, 1), (2, 4)], merge_ranges([(2, 3), (0, 1), (3, 4)]))
+
+    def test_while_changing(self):
+        expression = parse_one("a AND b")
+
+        # Untouched expressions aren't hashed
+        with exp.hash_stats() as stats:
+            self.assertIs(while_changing(expression, lambda e: e), expression)
+        self.assertEqual(stats.rehashed, 0)
+
+        def unnest(e):
+            return e.this if isinstance(e, exp.Paren) else e
+
+        self.assertEqual(while_changing(parse_one("((a))"), unnest).sql(), "a")
+
+        def rename(e):
+            e.set("this", exp.to_identifier(e.name.upper()))
+            return e
+
+        self.assertEqual(while_changing(exp.column("a"), rename).sql(), "A")
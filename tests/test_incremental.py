@@ -0,0 +1,164 @@
+import unittest
+
+from sqlglot import ParseError, Tokenizer, TokenError, parse, parse_incremental, tokenize
+
+
+class TestIncremental(unittest.TestCase):
+    @staticmethod
+    def positions(expressions):
+        return [
+            expression
+            and [(type(node), node.meta, node.comments or []) for node in expression.walk()]
+            for expression in expressions
+        ]
+
+    @staticmethod
+    def token_positions(tokens):
+        return [
+            (
+                token.token_type,
+                token.text,
+                token.line,
+                token.col,
+                token.start,
+                token.end,
+                token.comments,
+            )
+            for token in tokens
+        ]
+
+    def validate(self, script, read=None):
+        expected = parse(script.sql, read=read)
+        self.assertEqual(script.expressions, expected)
+        self.assertEqual(self.positions(script.expressions), self.positions(expected))
+        self.assertEqual(
+            self.token_positions(script.tokens),
+            self.token_positions(tokenize(script.sql, read=read)),
+        )
+
+    def test_parse_incremental(self):
+        sql = (
+            "/* lead */ SELECT 1 AS x FROM t; -- trail\n"
+            "SELECT a,\n  b FROM u WHERE c = 'x;y';;\n"
+            "SELECT 2 /* c */ ; /* d */ ; INSERT INTO t VALUES (1, 2);\n"
+            'SELECT "q;" FROM v\n'
+        )
+
+        edits = (
+            ("x", "y"),
+            ("SELECT 1", "SELECT 10"),
+            ("a,\n  b", "a, b"),
+            ("-- trail", "-- tail\n"),
+            ("-- tail", "/* tail */"),
+            ("SELECT 2", "SELECT 'a;b', 2"),
+            ("'a;b', ", ""),
+            ("; INSERT", ";\nINSERT"),
+            ("(1, 2)", "(1, 2); SELECT 3; SELECT 4"),
+            ("SELECT 3; ", ""),
+            ("/* d */", "/* d; SELECT 5 */"),
+            ("SELECT 2", "-- SELECT 2"),
+            ("-- ", ""),
+            ('"q;" FROM v', '"q;" FROM v;'),
+            ("FROM v;", "FROM v; -- end"),
+            ("/* lead */", ""),
+        )
+
+        script = parse_incremental(sql)
+        self.validate(script)
+
+        for old, new in edits:
+            with self.subTest(f"{old!r} -> {new!r}"):
+                start = script.sql.index(old)
+                self.assertIs(script.edit(start, start + len(old), new), script)
+                self.validate(script)
+
+        script.edit(0, len(script.sql), "")
+        self.assertEqual(script.expressions, [None])
+        script.edit(0, 0, "SELECT 1")
+        self.validate(script)
+
+    def test_parse_incremental_built_nodes(self):
+        # Nodes that the parser builds out of other strings, like the star of a FROM-first query or
+        # the contents of a hint, are positioned relative to those strings, so they never move
+        sql = "SELECT 1;\nFROM t;\nSELECT /*+ BROADCAST(y) */ a FROM x JOIN y;\nSELECT 3"
+        edits = (
+            (0, 8, "SELECT 12345"),
+            (0, 12, "SELECT 1"),
+            (0, 0, "SELECT 0;\n"),
+            (0, 10, ""),
+            (0, 9, "SELECT 1; SELECT 2;"),
+        )
+
+        script = parse_incremental(sql, read="spark")
+        self.validate(script, read="spark")
+
+        for start, end, text in edits:
+            with self.subTest(f"{start} {end} {text!r}"):
+                script.edit(start, end, text)
+                self.validate(script, read="spark")
+
+    def test_parse_incremental_reuse(self):
+        sql = ";\n".join(f"SELECT c{i} FROM t{i}" for i in range(10))
+        script = parse_incremental(sql)
+        before = script.expressions
+
+        start = script.sql.index("c5")
+        script.edit(start, start + 2, "\ncolumn_5")
+        after = script.expressions
+
+        for i, (old, new) in enumerate(zip(before, after)):
+            if i == 5:
+                self.assertIsNot(old, new)
+            else:
+                self.assertIs(old, new)
+
+        self.validate(script)
+
+    def test_parse_incremental_blocks(self):
+        sql = "SELECT 1; WHILE x < 1 BEGIN SELECT 2; END; SELECT 3"
+        script = parse_incremental(sql, read="tsql")
+        self.validate(script, read="tsql")
+
+        start = script.sql.index("SELECT 2")
+        script.edit(start, start + 8, "SELECT 20")
+        self.validate(script, read="tsql")
+
+        start = script.sql.index("WHILE")
+        script.edit(start, script.sql.index("SELECT 3"), "")
+        self.validate(script, read="tsql")
+
+        script.edit(0, 0, "IF x = 1 BEGIN SELECT 0; END; ")
+        self.validate(script, read="tsql")
+
+    def test_parse_incremental_errors(self):
+        sql = "SELECT 1; SELECT 2; SELECT 3"
+        script = parse_incremental(sql)
+
+        with self.assertRaises(ParseError):
+            script.edit(10, 10, "(")
+        with self.assertRaises(TokenError):
+            script.edit(len(sql), len(sql), " 'open")
+
+        self.assertEqual(script.sql, sql)
+        self.validate(script)
+
+        with self.assertRaises(ValueError):
+            parse_incremental(sql, lazy=True)
+
+    def test_tokenize_range(self):
+        tokenizer = Tokenizer()
+        sql = "SELECT 1; -- a\nSELECT 2 /* b */; SELECT ';'; SELECT 4"
+        tokens = tokenizer.tokenize(sql)
+
+        self.assertEqual(
+            self.token_positions(tokenizer.tokenize_range(sql, stop=3)),
+            self.token_positions(tokens[:3]),
+        )
+        self.assertEqual(
+            self.token_positions(tokenizer.tokenize_range(sql, 8, 9, line=1, col=8)),
+            self.token_positions(tokens[2:6]),
+        )
+        self.assertEqual(
+            self.token_positions(tokenizer.tokenize_range(sql, 31, 32, line=2, col=16)),
+            self.token_positions(tokens[5:9]),
+        )
@@ -0,0 +1,84 @@
+import gc
+import unittest
+
+from sqlglot import exp, parse, parse_one
+from sqlglot.interning import POOL, InternedArgs, InternPool
+from sqlglot.optimizer import optimize
+from sqlglot.serde import dump, load
+
+
+class TestInterning(unittest.TestCase):
+    def test_intern_parsed(self):
+        sql = "SELECT a, CAST(1 AS INT), 'x' FROM t WHERE a = 1; SELECT a FROM u WHERE b = 'x'"
+        expected = parse(sql)
+        first, second = parse(sql, intern=True)
+
+        self.assertEqual([first, second], expected)
+        self.assertEqual(
+            [node.meta for node in first.walk()], [node.meta for node in expected[0].walk()]
+        )
+
+        a, b = first.find(exp.Identifier), second.find(exp.Identifier)
+        self.assertIsNot(a, b)
+        self.assertIs(a.args, b.args)
+        self.assertIs(type(a.args), InternedArgs)
+        self.assertIs(
+            first.find(exp.DataType).args, parse_one("CAST(x AS INT)", intern=True).to.args
+        )
+        self.assertIs(first.find(exp.Literal, bfs=False).args, first.find(exp.EQ).expression.args)
+        self.assertIsNot(first.selects[2].args, first.find(exp.EQ).expression.args)
+
+        # Only the args of leaves are interned
+        self.assertIs(type(first.args), dict)
+        self.assertIs(type(first.find(exp.Column).args), dict)
+
+    def test_intern_copy_on_write(self):
+        first, second = parse("SELECT a FROM t; SELECT a FROM u", intern=True)
+        a = first.selects[0].this
+
+        a.set("quoted", True)
+        self.assertIs(type(a.args), dict)
+        self.assertEqual(first.sql(), 'SELECT "a" FROM t')
+        self.assertEqual(second.sql(), "SELECT a FROM u")
+
+        b = second.selects[0].this
+        copy = second.copy()
+        self.assertIs(copy.selects[0].this.args, b.args)
+        self.assertIs(copy.selects[0].this.parent, copy.selects[0])
+
+        copy.selects[0].this.replace(exp.to_identifier("c"))
+        copy.find(exp.Table).this.append("comments", "x")
+        self.assertEqual(second.sql(), "SELECT a FROM u")
+
+        optimized = optimize(parse_one("SELECT a FROM t WHERE a > 1", intern=True))
+        self.assertEqual(optimized.sql(), 'SELECT "t"."a" AS "a" FROM "t" AS "t" WHERE "t"."a" > 1')
+
+    def test_intern_load(self):
+        expression = optimize(parse_one("SELECT a + 1 AS b FROM t"), schema={"t": {"a": "int"}})
+        first = load(dump(expression), intern=True)
+        second = load(dump(expression), intern=True)
+
+        self.assertEqual(first, expression)
+        self.assertEqual(first.selects[0].type, expression.selects[0].type)
+        self.assertIs(first.find(exp.Literal).args, second.find(exp.Literal).args)
+        self.assertIs(first.selects[0].type.args, second.selects[0].type.args)
+        self.assertIs(type(load(dump(expression)).find(exp.Literal).args), dict)
+
+    def test_intern_pool(self):
+        pool = InternPool()
+        pool.intern(exp.func("f", exp.Literal.number(1), exp.Literal.number(1), exp.true()))
+        self.assertEqual((pool.hits, pool.misses), (1, 2))
+
+        # Equal but differently typed values aren't conflated
+        pool.intern(exp.Literal(this=1, is_string=False))
+        self.assertEqual((pool.hits, pool.misses), (1, 3))
+
+        gc.collect()
+        self.assertEqual(len(pool), 0)
+
+        pool.intern(parse_one("SELECT a"))
+        self.assertEqual(len(pool), 1)
+        pool.clear()
+        self.assertEqual((len(pool), pool.hits, pool.misses), (0, 0, 0))
+
+        self.assertIsNot(POOL, pool)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import unittest
+from copy import deepcopy
 
 import sqlglot
 from sqlglot.lineage import lineage
@@ -64,6 +65,11 @@ class TestLineage(unittest.TestCase):
 
         self.assertEqual(source.sql(), source_sql)
 
+        # deep copies of a tree and its subtrees keep the subtrees within the tree
+        source, expression = deepcopy([node.source, node.expression])
+        self.assertIsNot(source, node.source)
+        self.assertIs(source.selects[0], expression)
+
     def test_lineage_sql_with_cte(self) -> None:
         node = lineage(
             "a",
@@ -1,4 +1,5 @@
 import unittest
+from copy import deepcopy
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from functools import partial
 from unittest.mock import patch
@@ -1578,6 +1579,46 @@ SELECT :with_,WITH :expressions,CTE :this,UNION :this,SELECT :expressions,1,:exp
         annotate_types(qualified, schema=schema)
         self.assertEqual(len(schema._find_cache) - pre, 1)
 
+    def test_annotate_shared_types(self):
+        for meta, sql, _ in load_sql_fixture_pairs("optimizer/annotate_types.sql"):
+            dialect = meta.get("dialect")
+
+            with self.subTest(sql):
+                expected = annotate_types(parse_one(sql, read=dialect), dialect=dialect)
+                shared = annotate_types(
+                    parse_one(sql, read=dialect), dialect=dialect, shared_types=True
+                )
+                self.assertEqual(
+                    [node.type for node in shared.walk()], [node.type for node in expected.walk()]
+                )
+
+        expression = annotate_types(parse_one("SELECT 1 + 2, 'a' || 'b'"), shared_types=True)
+        add, concat = expression.selects
+        self.assertIs(add.type, exp.DataType.shared(exp.DType.INT))
+        self.assertIs(add.this.type, add.type)
+        self.assertIs(concat.type, exp.DataType.shared(exp.DType.VARCHAR))
+
+        copy = expression.copy()
+        self.assertIs(copy.selects[0].type, add.type)
+        self.assertIs(deepcopy(expression).selects[1].type, concat.type)
+        self.assertEqual(copy, expression)
+
+        optimized = optimizer.optimize(
+            parse_one("SELECT a + 1 AS b FROM t"), schema={"t": {"a": "int"}}, shared_types=True
+        )
+        self.assertIs(optimized.selects[0].this.expression.type, add.type)
+
+        # Shared instances are copied into the trees that use them, so they never get a parent
+        for sql, read, write in (
+            ("SELECT REGR_VALX(1 + 1, 2 + 2)", "snowflake", "duckdb"),
+            ("SELECT STRUCT(1 AS a, 'b' AS b)", "bigquery", "bigquery"),
+            ("SELECT MAP(ARRAY(1), ARRAY('a'))", "spark", "spark"),
+        ):
+            with self.subTest(sql):
+                annotate_types(parse_one(sql, read=read), shared_types=True).sql(write)
+                self.assertIsNone(add.type.parent)
+                self.assertIsNone(concat.type.parent)
+
     def test_annotate_funcs(self):
         test_schema = {
             "tbl": {
@@ -0,0 +1,129 @@
+import unittest
+
+from sqlglot import ParseError, parse, parse_parallel, transpile, transpile_many
+from sqlglot.dialects.dialect import Dialect
+from sqlglot.parallel import _chunks
+
+
+class TestParallel(unittest.TestCase):
+    @staticmethod
+    def positions(expressions):
+        return [
+            expression
+            and [(type(node), node.meta, node.comments or []) for node in expression.walk()]
+            for expression in expressions
+        ]
+
+    def test_parse_parallel(self):
+        sql = (
+            "/* lead */ SELECT 1 AS x FROM t;\n"
+            "SELECT a,\n  b FROM u; -- trail\n"
+            ";;  SELECT 'x;' FROM v WHERE c = 1;\n"
+        ) * 3
+
+        for tail in ("", ";", "; -- comment", "\n;\n"):
+            script = sql + "SELECT 2" + tail
+            expected = parse(script)
+
+            for chunk_size in (1, 2, 3, 100):
+                with self.subTest(f"{tail!r} {chunk_size}"):
+                    expressions = parse_parallel(script, workers=2, chunk_size=chunk_size)
+                    self.assertEqual(expressions, expected)
+                    self.assertEqual(self.positions(expressions), self.positions(expected))
+
+        # The nodes built by the parser out of strings, like the star of a FROM-first query, keep
+        # the positions they get in a serial parse
+        script = "SELECT 1;\nSELECT 2;\nFROM t;\nSELECT 4 FROM (SELECT 5)"
+        expected = parse(script)
+        for chunk_size in (1, 2):
+            with self.subTest(f"{script!r} {chunk_size}"):
+                expressions = parse_parallel(script, workers=2, chunk_size=chunk_size)
+                self.assertEqual(self.positions(expressions), self.positions(expected))
+
+    def test_parse_parallel_blocks(self):
+        for sql in (
+            "SELECT 1; IF x > 1 SELECT 1; ELSE SELECT 2; SELECT 9",
+            "SELECT 1; IF x > 1 BEGIN SELECT 1; SELECT 2; END ELSE BEGIN SELECT 3; END; SELECT 9",
+            "SELECT 1; WHILE x > 1 BEGIN SELECT 1; SELECT 2; END; SELECT 9",
+            "SELECT 1; CREATE PROCEDURE p AS BEGIN SELECT 1; SELECT 2; END; SELECT 9",
+            "BEGIN TRANSACTION; SELECT 1; COMMIT; SELECT 2; IF x > 1 SELECT 1; ELSE SELECT 2",
+        ):
+            expected = parse(sql, read="tsql")
+
+            for chunk_size in (1, 2, 3):
+                with self.subTest(f"{sql} {chunk_size}"):
+                    expressions = parse_parallel(sql, read="tsql", workers=2, chunk_size=chunk_size)
+                    self.assertEqual(expressions, expected)
+                    self.assertEqual(self.positions(expressions), self.positions(expected))
+
+        # Transactions aren't blocks, so the statements that follow them are still split
+        chunks = list(_chunks("BEGIN; SELECT 1; COMMIT; SELECT 2", Dialect.get_or_raise(None), 1))
+        self.assertEqual(len(chunks), 4)
+
+    def test_parse_parallel_error(self):
+        with self.assertRaises(ParseError):
+            parse_parallel("SELECT 1; SELECT (; SELECT 2", workers=2, chunk_size=1)
+
+    def test_transpile_many(self):
+        sqls = [
+            "SELECT IFF(a, 1, 2) FROM t",
+            "SELECT (",
+            "SELECT 1; SELECT 2",
+            "",
+            "SELECT a FROM t QUALIFY ROW_NUMBER() OVER (ORDER BY b) = 1",
+        ] * 5
+
+        def expected(sql):
+            try:
+                return transpile(sql, read="snowflake", write="duckdb"), None
+            except ParseError as e:
+                return [], str(e)
+
+        for workers, chunk_size, ordered in ((1, 4, True), (2, 1, True), (2, 3, False)):
+            with self.subTest(f"{workers} {chunk_size} {ordered}"):
+                results = list(
+                    transpile_many(
+                        sqls,
+                        read="snowflake",
+                        write="duckdb",
+                        workers=workers,
+                        chunk_size=chunk_size,
+                        ordered=ordered,
+                    )
+                )
+                if not ordered:
+                    results.sort(key=lambda result: result.position)
+
+                self.assertEqual([result.position for result in results], list(range(len(sqls))))
+                self.assertEqual([result.sql for result in results], sqls)
+                self.assertEqual(
+                    [(result.sqls, result.error and str(result.error)) for result in results],
+                    [expected(sql) for sql in sqls],
+                )
+
+        errors = [
+            result.error.errors[0]["line"]
+            for result in transpile_many(sqls, read="snowflake", workers=2, chunk_size=2)
+            if result.error
+        ]
+        self.assertEqual(errors, [1] * 5)
+
+        skipped = transpile_many(sqls, read="snowflake", workers=2, chunk_size=2, on_error="skip")
+        self.assertEqual(len(list(skipped)), 20)
+
+        with self.assertRaises(ParseError):
+            list(transpile_many(sqls, read="snowflake", workers=2, chunk_size=2, on_error="raise"))
+
+    def test_transpile_many_streaming(self):
+        consumed = 0
+
+        def sqls():
+            nonlocal consumed
+            for i in range(10_000):
+                consumed += 1
+                yield f"SELECT {i}"
+
+        results = transpile_many(sqls(), workers=2, chunk_size=10, max_in_flight=2)
+        self.assertEqual(next(results).sqls, ["SELECT 0"])
+        self.assertLessEqual(consumed, 40)
+        results.close()
@@ -1,10 +1,12 @@
+import pickle
 import time
 import unittest
 from unittest.mock import patch
 
-from sqlglot import Parser, exp, parse, parse_one
+from sqlglot import Parser, Tokenizer, exp, parse, parse_one
 from sqlglot.errors import ErrorLevel, ParseError
 from sqlglot.parser import logger as parser_logger
+from sqlglot.profiler import profile_parser
 from tests.helpers import assert_logger_contains
 
 
@@ -805,6 +807,25 @@ class TestParser(unittest.TestCase):
         warn_over_threshold("SELECT * FROM a " + ("OUTER APPLY (SELECT * FROM b) " * 30))
         warn_over_threshold("SELECT * FROM a " + ("NATURAL FULL OUTER JOIN x " * 30))
 
+    def test_parse_nested_backtracking(self):
+        def rule_calls(sql, read):
+            # The methods of compiled parsers aren't profiled, but their backtracking is
+            with profile_parser() as profile:
+                self.assertEqual(parse_one(sql, read=read).sql(read), sql)
+            return profile.retreats + sum(stats.calls for stats in profile.rules.values())
+
+        for read, open_, close in (
+            (None, "DECIMAL(", ")"),
+            (None, "STRUCT(", ")"),
+            ("clickhouse", "tuple(", ")"),
+            (None, "(SELECT x FROM t OFFSET 1 + ", ")"),
+        ):
+            with self.subTest(open_):
+                calls = [
+                    rule_calls(f"SELECT {open_ * depth}1{close * depth}", read) for depth in (8, 16)
+                ]
+                self.assertLess(calls[1], 2.5 * calls[0])
+
     def test_parse_properties(self):
         self.assertEqual(
             parse_one("create materialized table x").sql(), "CREATE MATERIALIZED TABLE x"
@@ -1140,3 +1161,143 @@ class TestParser(unittest.TestCase):
         with self.assertRaises(ParseError):
             parse_one("SELECT " + ",".join(f"x={i}" for i in range(100)), max_nodes=5)
         self.assertIsInstance(parse_one("SELECT 1, 2, 3"), exp.Select)
+
+    def test_parse_token_buffer(self):
+        sql = "/* a */ SELECT 1; ; SELECT x FROM y /* b */; -- c\nUPDATE t SET x = 1;"
+        tokenizer = Tokenizer()
+
+        for expected, expressions in (
+            (parse(sql), Parser().parse(tokenizer.tokenize_buffer(sql), sql)),
+            (
+                Parser().parse_into(exp.Select, tokenizer.tokenize("SELECT 1"), "SELECT 1"),
+                Parser().parse_into(exp.Select, tokenizer.tokenize_buffer("SELECT 1"), "SELECT 1"),
+            ),
+        ):
+            self.assertEqual(expressions, expected)
+            self.assertEqual(
+                [e and (e.sql(), e.meta) for e in expressions],
+                [e and (e.sql(), e.meta) for e in expected],
+            )
+
+        with self.assertRaises(ParseError):
+            Parser().parse(tokenizer.tokenize_buffer("SELECT 1 +"), "SELECT 1 +")
+
+    def test_literal_lists(self):
+        numbers = ", ".join(str(i) for i in range(10))
+        strings = ", ".join(f"'it''s {i}'" for i in range(10))
+
+        for sql in (
+            f"SELECT * FROM t WHERE x IN ({numbers}) AND y NOT IN ({strings})",
+            f"INSERT INTO t VALUES ({numbers}, 'a', 1.5e3, 'b'), ({strings})",
+            f"SELECT * FROM t WHERE x IN [{numbers}]",
+        ):
+            with self.subTest(sql):
+                expected = parse_one(sql)
+                expression = parse_one(sql, literal_lists=True)
+                literal_lists = list(expression.find_all(exp.LiteralList))
+
+                self.assertTrue(literal_lists)
+                self.assertFalse(expression.find(exp.Literal))
+                self.assertEqual(expression.sql(), expected.sql())
+                self.assertEqual(expression.sql(pretty=True), expected.sql(pretty=True))
+                self.assertEqual(expression.sql("bigquery"), expected.sql("bigquery"))
+                self.assertEqual(expression.copy(), expression)
+
+                for literal_list in literal_lists:
+                    literal_list.expand()
+
+                self.assertEqual(expression, expected)
+                self.assertEqual(expression.sql(), expected.sql())
+
+        literal_list = parse_one(f"x IN ({numbers})", literal_lists=True).find(exp.LiteralList)
+        self.assertEqual(literal_list.to_py(), list(range(10)))
+        self.assertEqual(literal_list.meta, {"line": 1, "col": 34, "start": 6, "end": 33})
+        self.assertEqual(exp.LiteralList.from_literals(literal_list.literals()).sql(), numbers)
+
+        for sql in (
+            "x IN (1, 2, 3)",
+            f"x IN ({numbers}, y)",
+            f"x IN ({numbers}, -1)",
+            f"x IN ({numbers} /* comment */)",
+            f"x IN ('a' 'b', {numbers})",
+            f"x IN ({numbers}, '1'::INT)",
+        ):
+            with self.subTest(sql):
+                expression = parse_one(sql, literal_lists=True)
+                self.assertIsNone(expression.find(exp.LiteralList))
+                self.assertEqual(expression.sql(), parse_one(sql).sql())
+
+    def test_lazy(self):
+        columns = ", ".join(f"c{i}" for i in range(20))
+        sql = (
+            f"WITH cte AS (SELECT {columns} FROM t) "
+            f"SELECT COALESCE({columns}) AS x, a FROM (SELECT {columns} FROM u) AS s "
+            f"WHERE a IN (SELECT {columns} FROM v)"
+        )
+        expected = parse_one(sql)
+
+        expression = parse_one(sql, lazy=True)
+        coalesce = expression.selects[0].this
+        placeholders = [
+            expression.args["with_"].expressions[0].this,
+            coalesce,
+            expression.args["from_"].this.this,
+            expression.args["where"].this.args["query"].this,
+        ]
+
+        for placeholder in placeholders:
+            self.assertIsInstance(placeholder, exp.Lazy)
+
+        self.assertEqual(coalesce.source, f"COALESCE({columns})")
+        self.assertEqual(coalesce.meta, {"line": 1, "col": 222, "start": 124, "end": 221})
+        self.assertEqual(expression.selects[1], exp.column("a"))
+
+        self.assertEqual(expression.sql(), expected.sql())
+        self.assertEqual(expression.sql(pretty=True), expected.sql(pretty=True))
+        self.assertIs(expression.selects[0].this, coalesce)
+
+        self.assertEqual(len(list(expression.find_all(exp.Coalesce))), 1)
+        self.assertIsInstance(expression.selects[0].this, exp.Coalesce)
+        self.assertIsNone(coalesce.parent)
+
+        expression = parse_one(sql, lazy=True)
+        self.assertEqual(pickle.loads(pickle.dumps(expression)), expected)
+
+        expression = parse_one(sql, lazy=True)
+        self.assertTrue(expression._lazy)
+        self.assertFalse(expected._lazy)
+        self.assertIsNone(expression.meta_get("lazy"))
+
+        subquery = expression.args["from_"].this.copy()
+        self.assertTrue(subquery._lazy)
+        self.assertEqual(exp.parse_lazy(subquery), expected.args["from_"].this)
+        self.assertFalse(subquery._lazy)
+
+        self.assertIs(exp.parse_lazy(expression), expression)
+        self.assertIsNone(expression.find(exp.Lazy))
+        self.assertFalse(any(node._lazy for node in expression.walk()))
+        self.assertEqual(repr(expression), repr(expected))
+
+        wrapper = exp.select("*").from_(parse_one(sql, lazy=True).subquery("q", copy=False))
+        self.assertTrue(wrapper._lazy)
+        self.assertEqual(wrapper.sql(), exp.select("*").from_(expected.subquery("q")).sql())
+
+        # FROM-first queries wrap the parsed FROM in a new SELECT
+        from_first = f"FROM (SELECT {columns} FROM bar) AS z"
+        for dialect in ("bigquery", "duckdb"):
+            with self.subTest(dialect=dialect):
+                expression = parse_one(from_first, read=dialect, lazy=True)
+                self.assertIsInstance(expression.find(exp.Subquery).this, exp.Lazy)
+                self.assertEqual(
+                    expression.sql(dialect), parse_one(from_first, read=dialect).sql(dialect)
+                )
+                self.assertIsInstance(
+                    exp.parse_lazy(expression).find(exp.Subquery).this, exp.Select
+                )
+
+        self.assertEqual(parse_one(sql, lazy=True), expected)
+        self.assertEqual(parse_one("SELECT a FROM (SELECT 1) AS s", lazy=True).find(exp.Lazy), None)
+
+        expression = parse_one(f"SELECT a FROM (SELECT {columns} FROM u WHERE) AS s", lazy=True)
+        with self.assertRaises(ParseError):
+            expression.sql()
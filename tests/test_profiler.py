@@ -0,0 +1,85 @@
+import unittest
+from unittest.mock import patch
+
+import sqlglot.parsers.base as _base_module
+from sqlglot import parse, parse_one
+from sqlglot.dialects.dialect import Dialect
+from sqlglot.profiler import ParserProfile, profile_parser
+
+_PARSER_IS_COMPILED = getattr(_base_module, "__file__", "").endswith(".so")
+
+
+class TestProfiler(unittest.TestCase):
+    def test_profile_compiled_parser(self):
+        # The tables of compiled parsers, which can't be subclassed, are wrapped in place instead
+        dialect = Dialect.get_or_raise("duckdb")
+        sql = "SELECT CAST(a AS INT) FROM t; DROP TABLE t"
+        expected = parse(sql, read="duckdb")
+        function_parsers = dict(dialect.parser_class.FUNCTION_PARSERS)
+        statement_parsers = dict(dialect.parser_class.STATEMENT_PARSERS)
+
+        with patch("sqlglot.profiler._is_compiled", return_value=True):
+            with profile_parser() as profile:
+                parser = dialect.parser()
+                self.assertIs(type(parser), dialect.parser_class)
+                self.assertIs(parser.profile, profile)
+                expressions = parse(sql, read="duckdb")
+
+        self.assertEqual(expressions, expected)
+        self.assertEqual(profile.rules["STATEMENT_PARSERS[DROP]"].calls, 1)
+        self.assertEqual(profile.rules["FUNCTION_PARSERS[CAST]"].calls, 1)
+        self.assertFalse(any(name.startswith("_parse") for name in profile.rules))
+        self.assertGreater(profile.retreats, 0)
+
+        self.assertEqual(dialect.parser_class.FUNCTION_PARSERS, function_parsers)
+        self.assertEqual(dialect.parser_class.STATEMENT_PARSERS, statement_parsers)
+        self.assertIsNone(dialect.parser().profile)
+
+    @unittest.skipIf(_PARSER_IS_COMPILED, "mypyc compiled parsers cannot be subclassed")
+    def test_profile_parser(self):
+        sql = "SELECT CAST(a AS INT), (SELECT (1 + 2)) FROM t; DROP TABLE t"
+        expected = parse(sql, read="duckdb")
+
+        with profile_parser() as profile:
+            expressions = parse(sql, read="duckdb")
+
+        self.assertEqual(expressions, expected)
+        self.assertEqual(profile.rules["STATEMENT_PARSERS[DROP]"].calls, 1)
+        self.assertEqual(profile.rules["FUNCTION_PARSERS[CAST]"].calls, 1)
+        self.assertEqual(profile.rules["_parse_statement"].calls, 2)
+
+        for stats in profile.rules.values():
+            self.assertGreater(stats.calls, 0)
+            self.assertGreaterEqual(stats.self_time, 0)
+            self.assertLessEqual(stats.self_time, stats.total_time + 1e-9)
+
+        self.assertGreaterEqual(
+            profile.rules["_parse_statement"].total_time,
+            profile.rules["FUNCTION_PARSERS[CAST]"].total_time,
+        )
+        self.assertIn("FUNCTION_PARSERS[CAST]", profile.report(limit=None))
+
+    def test_profile_parser_retreats(self):
+        with profile_parser() as profile:
+            parse_one("SELECT CAST(a AS INT)")
+
+        self.assertGreater(profile.retreats, 0)
+        self.assertGreaterEqual(profile.retreated_tokens, profile.retreats)
+
+        profile.clear()
+        self.assertEqual(profile.rules, {})
+        self.assertEqual(profile.retreats, 0)
+
+    @unittest.skipIf(_PARSER_IS_COMPILED, "mypyc compiled parsers cannot be subclassed")
+    def test_profile_parser_disabled(self):
+        dialect = Dialect.get_or_raise("duckdb")
+        profile = ParserProfile()
+
+        with profile_parser(profile):
+            self.assertIsNot(type(dialect.parser()), dialect.parser_class)
+            self.assertIsInstance(dialect.parser(), dialect.parser_class)
+
+        self.assertIs(type(dialect.parser()), dialect.parser_class)
+
+        parse_one("SELECT 1")
+        self.assertEqual(profile.rules, {})
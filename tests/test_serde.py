@@ -4,6 +4,7 @@ import unittest
 
 from sqlglot import exp, parse_one
 from sqlglot.optimizer.annotate_types import annotate_types
+from sqlglot.serde import BinaryRange, dump_binary, load_binary
 from tests.helpers import load_sql_fixtures
 
 import sqlglot.expressions.core as _core_module
@@ -27,6 +28,11 @@ class TestSerde(unittest.TestCase):
                 after = self.dump_load(before)
                 self.assertEqual(repr(before), repr(after))
 
+                after = load_binary(dump_binary(before))
+                self.assertEqual(repr(before), repr(after))
+                self.assertEqual([n.meta for n in before.walk()], [n.meta for n in after.walk()])
+                self.assertEqual(load_binary(dump_binary(before), lazy=True), before)
+
     @unittest.skipIf(_EXPRESSION_IS_COMPILED, "mypyc compiled expressions cannot be subclassed")
     def test_custom_expression(self):
         before = CustomExpression()
@@ -39,12 +45,86 @@ class TestSerde(unittest.TestCase):
         self.assertEqual(before.type, after.type)
         self.assertEqual(before.this.type, after.this.type)
 
+    def test_binary(self):
+        before = annotate_types(parse_one("SELECT CAST('1' AS STRUCT<x ARRAY<INT>>) /* c */"))
+        before.meta["x"] = [-1, 2.5, None, True, {"y": 10**30}]
+        payload = dump_binary(before)
+        after = load_binary(payload)
+
+        self.assertIsInstance(payload, bytes)
+        self.assertLess(len(payload), len(json.dumps(before.dump())) / 2)
+        self.assertEqual(before, after)
+        self.assertEqual(before.meta, after.meta)
+        self.assertEqual(after.selects[0].comments, [" c "])
+        self.assertEqual(before.selects[0].type, after.selects[0].type)
+        self.assertEqual(before.selects[0].this.type, after.selects[0].this.type)
+        self.assertIsInstance(after.selects[0].type.this, exp.DType)
+
+        with self.assertRaises(ValueError):
+            load_binary(b"SELECT 1")
+
+        before.meta["x"] = object()
+        with self.assertRaises(TypeError):
+            dump_binary(before)
+
+    def test_binary_lazy(self):
+        sql = "WITH x AS (SELECT a FROM t) SELECT * FROM (SELECT b FROM x) WHERE c IN (SELECT 1)"
+        before = parse_one(sql)
+        after = load_binary(dump_binary(before), lazy=True)
+
+        subquery = after.args["from_"].this
+        self.assertIsInstance(after.args["with_"].expressions[0].this, exp.Lazy)
+        self.assertIsInstance(subquery, exp.Lazy)
+        self.assertIsInstance(subquery.this, BinaryRange)
+        self.assertEqual(subquery.source, "(SELECT b FROM x)")
+
+        # Generating SQL and copying leave the placeholders in place
+        self.assertEqual(after.sql(), sql)
+        self.assertEqual(after.copy(), before)
+        self.assertIs(after.args["from_"].this, subquery)
+
+        self.assertEqual(after, before)
+        self.assertIsInstance(after.args["from_"].this, exp.Subquery)
+        self.assertEqual(list(after.find_all(exp.Lazy)), [])
+
+    def test_pickle(self):
+        before = annotate_types(parse_one("SELECT CAST(a AS INT) /* c */, x IN ('y', 1) FROM t"))
+        before.meta["x"] = 1
+        after = pickle.loads(pickle.dumps(before))
+
+        self.assertTrue(all(node._hash is None for node in after.walk()))
+        self.assertEqual(before, after)
+        self.assertEqual(before.meta, after.meta)
+        self.assertEqual(after.selects[0].comments, [" c "])
+        self.assertEqual(before.selects[0].type, after.selects[0].type)
+        self.assertEqual(before.selects[1].type, after.selects[1].type)
+        self.assertEqual(
+            [(node.parent, node.arg_key, node.index) for node in before.walk()][1:],
+            [(node.parent, node.arg_key, node.index) for node in after.walk()][1:],
+        )
+
+        # Pickling copies the args, comments and meta
+        after.selects[0].comments.append("d")
+        after.selects[1].set("expressions", [])
+        after.meta["x"] = 2
+        self.assertEqual(before.sql(), "SELECT CAST(a AS INT) /* c */, x IN ('y', 1) FROM t")
+        self.assertEqual(before.meta["x"], 1)
+
     def test_meta(self):
         before = parse_one("SELECT * FROM X")
         before.meta["x"] = 1
         after = self.dump_load(before)
         self.assertEqual(before.meta, after.meta)
 
+    def test_literal_list(self):
+        sql = "SELECT * FROM t WHERE x IN (" + ", ".join(f"'{i}'" for i in range(100)) + ")"
+        before = parse_one(sql, literal_lists=True)
+        self.assertLess(len(before.dump()), 20)
+
+        for after in (self.dump_load(before), pickle.loads(pickle.dumps(before))):
+            self.assertEqual(before, after)
+            self.assertEqual(after.sql(), sql)
+
     def test_recursion(self):
         sql = "SELECT 1"
         sql += " UNION ALL SELECT 1" * 5000
@@ -52,3 +132,5 @@ class TestSerde(unittest.TestCase):
         before = expr.sql()
         self.assertEqual(before, self.dump_load(expr).sql())
         self.assertEqual(before, pickle.loads(pickle.dumps(expr)).sql())
+        self.assertEqual(before, load_binary(dump_binary(expr)).sql())
+        self.assertEqual(before, load_binary(dump_binary(expr), lazy=True).sql())
@@ -1,8 +1,12 @@
+import io
+import mmap
+import tempfile
 import unittest
 
-from sqlglot.dialects import BigQuery
+from sqlglot import exp, parse, split_statements
+from sqlglot.dialects import BigQuery, Postgres
 from sqlglot.errors import TokenError
-from sqlglot.tokens import Tokenizer, TokenType
+from sqlglot.tokens import TokenBuffer, Tokenizer, TokenType
 
 
 class TestTokens(unittest.TestCase):
@@ -212,3 +216,99 @@ x"""
             repr(Tokenizer().tokenize("foo")),
             "[<Token token_type: TokenType.VAR, text: foo, line: 1, col: 3, start: 0, end: 2, comments: []>]",
         )
+
+    def test_iter_tokens(self):
+        def token_tuples(tokens):
+            return [
+                (t.token_type, t.text, t.line, t.col, t.start, t.end, t.comments) for t in tokens
+            ]
+
+        sql = """SELECT 1; SELECT 'a;b' -- c;
+; /* x; */ SELECT
+  2;\r\nSHOW tables; x
+/* lead */ SELECT 'café ☃' /* c */;
+SELECT 3; -- trail
+CREATE FUNCTION f() AS $$ SELECT 1; SELECT 2; $$;;
+-- end"""
+
+        for tokenizer in (Tokenizer(), Postgres.Tokenizer()):
+            expected = token_tuples(tokenizer.tokenize(sql))
+
+            for chunk_size in (1, 3, 16, 1 << 16):
+                for source in (sql, io.StringIO(sql), sql.encode()):
+                    with self.subTest(f"{tokenizer} {chunk_size} {type(source)}"):
+                        tokens = tokenizer.iter_tokens(source, chunk_size=chunk_size)
+                        self.assertEqual(token_tuples(tokens), expected)
+
+        with tempfile.TemporaryFile() as f:
+            f.write(sql.encode())
+            f.flush()
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                tokens = Postgres.Tokenizer().iter_tokens(buffer, chunk_size=32)
+                self.assertEqual(token_tuples(tokens), expected)
+
+        with self.assertRaises(TokenError):
+            list(Tokenizer().iter_tokens("SELECT 1; SELECT 'a", chunk_size=4))
+
+    def test_split_statements(self):
+        sql = """/* lead */ SELECT 'a;b', "c;d" FROM t;;
+CREATE FUNCTION f() AS $$ SELECT 1; SELECT 2; $$ LANGUAGE sql; -- trail
+/* nested /* comment; */ ; */ SHOW TABLES LIKE 'x;';
+DELETE FROM t WHERE x = 1"""
+
+        spans = list(split_statements(sql, read="postgres"))
+        self.assertEqual(
+            [(sql[start:end], token_type) for start, end, token_type in spans],
+            [
+                ("SELECT 'a;b', \"c;d\" FROM t", TokenType.SELECT),
+                ("CREATE FUNCTION f() AS $$ SELECT 1; SELECT 2; $$ LANGUAGE sql", TokenType.CREATE),
+                ("SHOW TABLES LIKE 'x;'", TokenType.SHOW),
+                ("DELETE FROM t WHERE x = 1", TokenType.DELETE),
+            ],
+        )
+        self.assertEqual(
+            [parse(sql[start:end], read="postgres")[0] for start, end, _ in spans],
+            [e for e in parse(sql, read="postgres") if e and not isinstance(e, exp.Semicolon)],
+        )
+        self.assertEqual(list(split_statements(";; -- nothing")), [])
+
+        sql = "SELECT 'é'; /* ü */ SELECT \"ß\" FROM t;; SELECT 3"
+        expected = ["SELECT 'é'", 'SELECT "ß" FROM t', "SELECT 3"]
+        for encoding in ("utf-8", "utf-8-sig", "latin-1"):
+            with self.subTest(encoding=encoding):
+                data = sql.encode(encoding)
+                spans = Tokenizer().split_statements(data, chunk_size=3, encoding=encoding)
+                self.assertEqual(
+                    [data[start:end].decode(encoding.split("-sig")[0]) for start, end, _ in spans],
+                    expected,
+                )
+
+    def test_tokenize_buffer(self):
+        def token_tuples(tokens):
+            return [
+                (t.token_type, t.text, t.line, t.col, t.start, t.end, t.comments) for t in tokens
+            ]
+
+        sql = """/* lead */ SELECT 'a''b', "c" /* c */ FROM t; -- trail
+SHOW /* x */ tables -- y
+; SELECT /*+ hint */ x, 1_000, $$body$$ FROM u;"""
+
+        for tokenizer in (Tokenizer(), Postgres.Tokenizer(), BigQuery.Tokenizer()):
+            with self.subTest(str(tokenizer)):
+                tokens = tokenizer.tokenize(sql)
+                buffer = tokenizer.tokenize_buffer(sql)
+                expected = token_tuples(tokens)
+
+                self.assertEqual(len(buffer), len(tokens))
+                self.assertEqual(token_tuples(buffer), expected)
+                self.assertEqual(token_tuples(TokenBuffer.from_tokens(tokens, sql)), expected)
+                self.assertEqual(token_tuples(buffer[2:-3]), expected[2:-3])
+                self.assertEqual(token_tuples([buffer[-1]]), expected[-1:])
+                self.assertEqual(buffer.token_type(1), tokens[1].token_type)
+                self.assertEqual(buffer.text(2), tokens[2].text)
+
+        self.assertEqual(len(Tokenizer().tokenize_buffer("SELECT a, b").texts), 0)
+
+        with self.assertRaises(IndexError):
+            Tokenizer().tokenize_buffer("SELECT 1")[2]